@@ -1,3 +1,4 @@
 from app.api.profile_api import ProfileApi
+from app.api.async_profile_api import AsyncProfileApi
 
-__all__ = ["ProfileApi"]
+__all__ = ["ProfileApi", "AsyncProfileApi"]
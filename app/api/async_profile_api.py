@@ -0,0 +1,136 @@
+from typing import AsyncIterator, BinaryIO, Dict, List, Optional, Tuple
+from app.api.pagination import (
+    HISTORY_ORDER,
+    SEARCH_ORDER,
+    decode_cursor,
+    next_cursor,
+    next_history_cursor,
+    next_search_cursor,
+)
+from app.api.profile_import import read_profiles
+from app.api.profile_api import build_filter, parse_status
+from app.entities import HistoryFilter, Profile, ProfileHistory
+from app.services.async_profile_service import AsyncProfileService
+from app.services.profile_import import DEFAULT_IMPORT_BATCH_SIZE, ImportReport
+
+
+class AsyncProfileApi:
+    """Asyncio counterpart of ProfileApi."""
+
+    def __init__(self, profile_service: AsyncProfileService):
+        self.profile_service = profile_service
+
+    async def create_profile(
+        self, name: str, email: str, specialty: str, linkedin: Optional[str] = None
+    ) -> Profile:
+        """Create a new profile."""
+        return await self.profile_service.create_profile(name, email, specialty, linkedin)
+
+    async def create_profiles(self, profiles: List[Dict]) -> List[Optional[Profile]]:
+        """Create many profiles at once; None marks duplicate emails."""
+        return await self.profile_service.create_profiles(profiles)
+
+    async def get_profile(
+        self, profile_id: int, include_history: bool = False
+    ) -> Optional[Profile]:
+        """Get a profile by ID."""
+        return await self.profile_service.get_profile(profile_id, include_history=include_history)
+
+    async def get_profiles_batch(
+        self, profile_ids: List[int]
+    ) -> Tuple[List[Profile], List[int]]:
+        """Get many profiles by ID with a single query; returns the found and the missing."""
+        found = await self.profile_service.get_profiles_by_ids(profile_ids)
+        profiles = [found[i] for i in profile_ids if found[i] is not None]
+        return profiles, [i for i in profile_ids if found[i] is None]
+
+    async def get_profiles(
+        self, skip: int = 0, limit: int = 10, include_history: bool = False
+    ) -> List[Profile]:
+        """Get all profiles with pagination."""
+        return await self.profile_service.get_profiles(
+            skip, limit, include_history=include_history
+        )
+
+    async def get_profiles_page(
+        self,
+        skip: int = 0,
+        limit: int = 10,
+        after: Optional[str] = None,
+        order_by: str = "id",
+        filters: Optional[Dict] = None,
+    ) -> Tuple[List[Profile], Optional[str]]:
+        """Get a page of the profiles matching ``filters`` and the cursor of the next one."""
+        keyset = decode_cursor(after, order_by) if after else None
+        profiles = await self.profile_service.get_profiles(
+            skip, limit, after=keyset, order_by=order_by, filters=build_filter(filters)
+        )
+        return profiles, next_cursor(profiles, limit, order_by)
+
+    async def get_history_page(
+        self,
+        profile_id: int,
+        limit: int = 10,
+        after: Optional[str] = None,
+        filters: Optional[Dict] = None,
+    ) -> Optional[Tuple[List[ProfileHistory], Optional[str]]]:
+        """Get a page of a profile's status history and the cursor of the next one."""
+        keyset = decode_cursor(after, HISTORY_ORDER) if after else None
+        entries = await self.profile_service.get_history(
+            profile_id, limit, keyset, build_filter(filters, HistoryFilter)
+        )
+        if entries is None:
+            return None
+        return entries, next_history_cursor(entries, limit)
+
+    async def search_profiles(
+        self, query: str, limit: int = 10, after: Optional[str] = None
+    ) -> Tuple[List[Profile], Optional[str]]:
+        """Search profiles by relevance; returns a page and the cursor of the next one."""
+        keyset = decode_cursor(after, SEARCH_ORDER) if after else None
+        results = await self.profile_service.search_profiles(query, limit, keyset)
+        return [profile for profile, _ in results], next_search_cursor(results, limit)
+
+    def export_profiles(self) -> AsyncIterator[Tuple]:
+        """Stream every profile as a plain row for bulk export."""
+        return self.profile_service.stream_profiles()
+
+    async def import_profiles(
+        self,
+        upload: BinaryIO,
+        import_format: str,
+        batch_size: int = DEFAULT_IMPORT_BATCH_SIZE,
+    ) -> ImportReport:
+        """Stream-parse a CSV/NDJSON upload and upsert its valid rows in batches."""
+        report = ImportReport()
+        profiles = read_profiles(upload, import_format, report)
+        return await self.profile_service.import_profiles(profiles, batch_size, report)
+
+    async def update_profile(
+        self,
+        profile_id: int,
+        name: Optional[str] = None,
+        email: Optional[str] = None,
+        specialty: Optional[str] = None,
+        linkedin: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> Optional[Profile]:
+        """Update a profile."""
+        profile = await self.profile_service.get_profile_for_update(profile_id)
+        if not profile:
+            return None
+
+        return await self.profile_service.update_profile(
+            profile, name, email, specialty, linkedin, parse_status(status)
+        )
+
+    async def patch_profile(self, profile_id: int, changes: Dict) -> Optional[Profile]:
+        """Apply only the supplied fields to a profile; unknown statuses are ignored."""
+        changes = dict(changes)
+        if "status" in changes:
+            changes["status"] = parse_status(changes["status"])
+        return await self.profile_service.patch_profile(profile_id, changes)
+
+    async def delete_profile(self, profile_id: int) -> Optional[Profile]:
+        """Delete a profile."""
+        return await self.profile_service.delete_profile(profile_id)
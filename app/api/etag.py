@@ -0,0 +1,58 @@
+import hashlib
+from typing import Iterable, Optional
+
+from fastapi import Request, Response
+
+from app.entities import PROFILE_FIELDS, Profile
+
+
+def _digest(parts: Iterable[str]) -> str:
+    return hashlib.blake2b("\x1f".join(parts).encode(), digest_size=16).hexdigest()
+
+
+def _fingerprint(profile: Profile) -> str:
+    """Stable text form of every field a ProfileResponse exposes."""
+    values = []
+    for field in PROFILE_FIELDS:
+        value = getattr(profile, field)
+        values.append(str(getattr(value, "value", value)))
+    return _digest(values)
+
+
+def profile_etag(profile: Profile) -> str:
+    """
+    Strong ETag of a single profile.
+    It hashes the column values themselves, so every write path (PUT, bulk
+    import, direct SQL) changes it without a version column to maintain.
+    """
+    return f'"{_fingerprint(profile)}"'
+
+
+def profiles_etag(profiles: Iterable[Profile]) -> str:
+    """Strong ETag of a list of profiles, sensitive to membership and order."""
+    return f'"{_digest(_fingerprint(profile) for profile in profiles)}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Evaluate If-None-Match against ``etag`` with the weak comparison RFC 9110 requires."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return any((tag[2:] if tag.startswith("W/") else tag) == etag for tag in candidates)
+
+
+def not_modified(request: Request, response: Response, etag: str) -> Optional[Response]:
+    """
+    Return a 304 response when the client already holds ``etag``.
+    Otherwise tag the outgoing response and return None so the route serializes the body.
+    """
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        headers = {"ETag": etag}
+        for name in ("X-Next-Cursor", "X-Missing-Ids"):
+            if name in response.headers:
+                headers[name] = response.headers[name]
+        return Response(status_code=304, headers=headers)
+    response.headers["ETag"] = etag
+    return None
@@ -0,0 +1,29 @@
+from fastapi import APIRouter, Depends, Response
+from app.config.health import Readiness, get_database_check, get_readiness
+
+# 🔹 Sondas de liveness/readiness para el orquestador
+router = APIRouter(include_in_schema=False)
+
+
+# 🔹 El proceso está vivo (no toca la base de datos)
+@router.get("/healthz")
+def liveness():
+    return {"status": "ok"}
+
+
+# 🔹 Listo para tráfico: arranque completado y base de datos alcanzable
+@router.get("/readyz")
+async def readiness_probe(
+    response: Response,
+    state: Readiness = Depends(get_readiness),
+    check_database=Depends(get_database_check),
+):
+    if not state.ready:
+        response.status_code = 503
+        return {"status": "starting", **state.to_dict()}
+    try:
+        await check_database(0)
+    except Exception as exc:
+        response.status_code = 503
+        return {"status": "unavailable", "error": str(exc)}
+    return {"status": "ready"}
@@ -0,0 +1,44 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.pool import Pool
+from app.config.cache import get_profile_cache, get_single_flights
+from app.config.dependencies import get_database_pools
+from app.config.history import get_history_recorder
+from app.config.internal import require_internal_token
+from app.db.history_recorder import HistoryRecorder
+from app.config.pool import pool_stats
+from app.services.profile_cache import ProfileCache
+from typing import Dict, Optional
+
+# 🔹 Endpoints internos de diagnóstico; no se publican en el esquema OpenAPI
+# y exigen el token interno (X-Internal-Token)
+router = APIRouter(
+    prefix="/internal",
+    include_in_schema=False,
+    dependencies=[Depends(require_internal_token)],
+)
+
+
+# 🔹 Estado del pool de conexiones (ocupación, esperas y fallos de checkout)
+@router.get("/pool")
+def read_pool_stats(pools: Dict[str, Pool] = Depends(get_database_pools)):
+    return {name: pool_stats(pool) for name, pool in pools.items()}
+
+
+# 🔹 Estadísticas de la caché de perfiles
+@router.get("/cache")
+def read_cache_stats(cache: ProfileCache = Depends(get_profile_cache)):
+    return cache.stats()
+
+
+# 🔹 Lecturas de perfiles deduplicadas (ejecutadas, compartidas y en curso)
+@router.get("/single-flight")
+def read_single_flight_stats(flights: Dict = Depends(get_single_flights)):
+    return {mode: group.stats() for mode, group in flights.items()}
+
+
+# 🔹 Cola de escritura diferida del historial (vacío en modo síncrono)
+@router.get("/history-recorder")
+def read_history_recorder_stats(
+    recorder: Optional[HistoryRecorder] = Depends(get_history_recorder),
+):
+    return recorder.stats() if recorder is not None else {}
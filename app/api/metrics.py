@@ -0,0 +1,179 @@
+import time
+from fastapi import APIRouter, Response
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from app.config.cache import get_single_flights
+from app.config.dependencies import get_database_pools
+from app.config.pool import pool_stats
+from app.config.query_stats import request_queries
+
+# 🔹 Registro propio (no el global de prometheus_client), expuesto en /metrics
+REGISTRY = CollectorRegistry()
+
+# Label of requests that match no route, so unknown paths cannot blow up label cardinality
+UNMATCHED_ROUTE = "unmatched"
+
+HTTP_REQUESTS = Counter(
+    "http_requests",
+    "HTTP requests handled, by route template and status code.",
+    ["method", "route", "status"],
+    registry=REGISTRY,
+)
+HTTP_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Time from receiving a request to sending the last chunk of its body.",
+    ["method", "route"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1, 2.5, 5, 10),
+    registry=REGISTRY,
+)
+HTTP_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "HTTP requests currently being handled.",
+    ["method"],
+    registry=REGISTRY,
+)
+DB_QUERIES = Histogram(
+    "db_queries_per_request",
+    "SQL statements executed while handling a request.",
+    ["method", "route"],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 50, 100),
+    registry=REGISTRY,
+)
+DB_QUERY_SECONDS = Histogram(
+    "db_query_seconds_per_request",
+    "Time spent executing SQL while handling a request.",
+    ["method", "route"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+    registry=REGISTRY,
+)
+
+
+def route_template(scope) -> str:
+    """Path template of the route that served ``scope``, e.g. /profiles/{profile_id}."""
+    # The router stores the matched route in the scope, also for 405 responses
+    route = scope.get("route")
+    return getattr(route, "path", UNMATCHED_ROUTE)
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording request counts, latency, in-flight requests and the
+    SQL executed per request, labelled by route template rather than raw path.
+    The route is only known once the router has run, so in-flight requests are
+    labelled by method alone. Slow statements, N+1 patterns and query budgets are
+    handled by app.config.query_stats.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = 500
+
+        async def send_recording_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        in_progress = HTTP_IN_PROGRESS.labels(method)
+        in_progress.inc()
+        started = time.perf_counter()
+        try:
+            with request_queries(lambda: route_template(scope)) as queries:
+                await self.app(scope, receive, send_recording_status)
+        finally:
+            in_progress.dec()
+            route = route_template(scope)
+            HTTP_LATENCY.labels(method, route).observe(time.perf_counter() - started)
+            HTTP_REQUESTS.labels(method, route, str(status)).inc()
+            DB_QUERIES.labels(method, route).observe(queries.count)
+            DB_QUERY_SECONDS.labels(method, route).observe(queries.seconds)
+
+
+class PoolCollector:
+    """Exports the connection pool occupancy and checkout telemetry at scrape time."""
+
+    GAUGES = {
+        "size": ("db_pool_size", "Connections the pool keeps open."),
+        "checked_in": ("db_pool_checked_in", "Idle connections in the pool."),
+        "checked_out": ("db_pool_checked_out", "Connections currently in use."),
+        "overflow": (
+            "db_pool_overflow",
+            "Connections beyond the pool size (negative while the pool fills up).",
+        ),
+    }
+    COUNTERS = {
+        "checkouts": ("db_pool_checkouts", "Successful connection checkouts."),
+        "checkout_failures": (
+            "db_pool_checkout_failures",
+            "Checkouts that timed out waiting for a connection.",
+        ),
+        "wait_seconds_total": (
+            "db_pool_checkout_wait_seconds",
+            "Time spent waiting for a connection.",
+        ),
+    }
+
+    def __init__(self, get_pools=get_database_pools):
+        self.get_pools = get_pools
+
+    def collect(self):
+        stats = {name: pool_stats(pool) for name, pool in self.get_pools().items()}
+        for kind, metrics in ((GaugeMetricFamily, self.GAUGES),
+                              (CounterMetricFamily, self.COUNTERS)):
+            for key, (name, documentation) in metrics.items():
+                family = kind(name, documentation, labels=["engine"])
+                for engine, values in stats.items():
+                    # SQLite pools have no occupancy and NullPool has no telemetry
+                    if key in values:
+                        family.add_metric([engine], values[key])
+                yield family
+
+
+class SingleFlightCollector:
+    """Exports how many profile reads ran and how many joined one already in flight."""
+
+    METRICS = {
+        "executed": (CounterMetricFamily, "profile_reads_executed",
+                     "Profile reads by ID that ran a query of their own."),
+        "coalesced": (CounterMetricFamily, "profile_reads_coalesced",
+                      "Profile reads by ID served by a concurrent identical query."),
+        "in_flight": (GaugeMetricFamily, "profile_reads_in_flight",
+                      "Distinct profile reads by ID currently running."),
+    }
+
+    def __init__(self, get_flights=get_single_flights):
+        self.get_flights = get_flights
+
+    def collect(self):
+        stats = {mode: flights.stats() for mode, flights in self.get_flights().items()}
+        for key, (kind, name, documentation) in self.METRICS.items():
+            family = kind(name, documentation, labels=["mode"])
+            for mode, values in stats.items():
+                family.add_metric([mode], values[key])
+            yield family
+
+
+REGISTRY.register(PoolCollector())
+REGISTRY.register(SingleFlightCollector())
+
+# 🔹 Endpoint de scraping de Prometheus; no se publica en el esquema OpenAPI
+router = APIRouter(include_in_schema=False)
+
+
+@router.get("/metrics")
+def read_metrics():
+    return Response(generate_latest(REGISTRY), media_type=CONTENT_TYPE_LATEST)
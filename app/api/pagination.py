@@ -0,0 +1,88 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import List, Literal, Optional, Tuple
+
+from app.entities import Profile, ProfileHistory
+
+# 🔹 Claves de ordenamiento soportadas por la paginación keyset
+ProfileOrder = Literal["id", "start_date"]
+
+
+class InvalidCursorError(ValueError):
+    """Raised when an ``after`` token cannot be decoded for the requested ordering."""
+
+
+# Ordering tag of search cursors, keyed on (rank, id)
+SEARCH_ORDER = "rank"
+
+# Ordering tag of status history cursors, keyed on (changed_at, id)
+HISTORY_ORDER = "changed_at"
+
+
+def _encode(order_by: str, key: List) -> str:
+    payload = json.dumps({"o": order_by, "k": key}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def encode_cursor(order_by: str, profile: Profile) -> str:
+    """Build an opaque cursor pointing just after ``profile`` in ``order_by`` order."""
+    if order_by == "start_date":
+        return _encode(order_by, [profile.start_date.isoformat(), profile.id])
+    return _encode(order_by, [profile.id])
+
+
+def encode_search_cursor(rank: float, profile: Profile) -> str:
+    """Build an opaque cursor pointing just after ``profile`` in a ranked search."""
+    # repr round-trips floats exactly, so the seek predicate can compare ranks for equality
+    return _encode(SEARCH_ORDER, [rank, profile.id])
+
+
+def encode_history_cursor(entry: ProfileHistory) -> str:
+    """Build an opaque cursor pointing just after ``entry`` in a profile's history."""
+    return _encode(HISTORY_ORDER, [entry.changed_at.isoformat(), entry.id])
+
+
+def decode_cursor(token: str, order_by: str) -> Tuple:
+    """Decode an ``after`` token into the keyset values for ``order_by``."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if payload["o"] != order_by:
+            raise InvalidCursorError("Cursor does not match the requested ordering")
+        key = payload["k"]
+        if order_by in ("start_date", HISTORY_ORDER):
+            moment, row_id = key
+            return datetime.fromisoformat(moment), int(row_id)
+        if order_by == SEARCH_ORDER:
+            rank, profile_id = key
+            return float(rank), int(profile_id)
+        (profile_id,) = key
+        return (int(profile_id),)
+    except InvalidCursorError:
+        raise
+    except (binascii.Error, UnicodeDecodeError, ValueError, KeyError, TypeError) as exc:
+        raise InvalidCursorError("Malformed cursor") from exc
+
+
+def next_cursor(profiles: List[Profile], limit: int, order_by: str) -> Optional[str]:
+    """Return the cursor for the following page, or None when this page is the last one."""
+    if not profiles or len(profiles) < limit:
+        return None
+    return encode_cursor(order_by, profiles[-1])
+
+
+def next_search_cursor(results: List[Tuple[Profile, float]], limit: int) -> Optional[str]:
+    """Return the cursor for the following page of (profile, rank) search results."""
+    if not results or len(results) < limit:
+        return None
+    profile, rank = results[-1]
+    return encode_search_cursor(rank, profile)
+
+
+def next_history_cursor(entries: List[ProfileHistory], limit: int) -> Optional[str]:
+    """Return the cursor for the following page of history entries."""
+    if not entries or len(entries) < limit:
+        return None
+    return encode_history_cursor(entries[-1])
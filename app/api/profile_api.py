@@ -1,8 +1,107 @@
-from typing import List, Optional
-from app.entities import Profile, ProfileStatus
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
+from app.api.pagination import (
+    HISTORY_ORDER,
+    SEARCH_ORDER,
+    decode_cursor,
+    next_cursor,
+    next_history_cursor,
+    next_search_cursor,
+)
+from app.api.profile_import import read_profiles
+from app.entities import HistoryFilter, Profile, ProfileFilter, ProfileHistory, ProfileStatus
+from app.services.profile_import import DEFAULT_IMPORT_BATCH_SIZE, ImportReport
 from app.services.profile_service import ProfileService
 
 
+def parse_status(status: Optional[str]) -> Optional[ProfileStatus]:
+    """Convert a status string to the enum, ignoring unknown values."""
+    if not status:
+        return None
+    try:
+        # Handle both "inactive" and "INACTIVE" formats
+        if status.upper() == "INACTIVE":
+            return ProfileStatus.INACTIVE
+        elif status.upper() == "ACTIVE":
+            return ProfileStatus.ACTIVE
+        elif status.upper() == "SUSPENDED":
+            return ProfileStatus.SUSPENDED
+        elif status.upper() == "DELETED":
+            return ProfileStatus.DELETED
+        else:
+            # Try direct conversion as fallback
+            return ProfileStatus(status)
+    except ValueError:
+        # Invalid status value, ignore it
+        return None
+
+
+class InvalidFilterError(ValueError):
+    """Raised when a listing filter has a value that cannot match any profile."""
+
+
+def build_filter(params: Optional[Dict], filter_class=ProfileFilter):
+    """
+    Turn raw listing filter values into a ``filter_class`` (ProfileFilter or
+    HistoryFilter); None means no filtering.
+    """
+    if not params:
+        return None
+    params = dict(params)
+    if params.get("status") is not None:
+        status = parse_status(params["status"])
+        if status is None:
+            raise InvalidFilterError(f"Unknown status {params['status']!r}")
+        params["status"] = status
+    return filter_class(**params)
+
+
+class InvalidIdsError(ValueError):
+    """Raised when a batch lookup gets a value that is not a profile ID."""
+
+
+# Largest ID a BIGINT column can hold; larger values cannot even be bound to the query
+MAX_PROFILE_ID = 2**63 - 1
+
+
+def parse_ids(values: List[str]) -> List[int]:
+    """
+    Collect the IDs of a batch lookup, given as repeated and/or comma-separated
+    values, without duplicates and in the order they first appear.
+    """
+    ids = []
+    for value in values:
+        for part in value.split(","):
+            part = part.strip()
+            if not part:
+                continue
+            try:
+                profile_id = int(part)
+            except ValueError:
+                raise InvalidIdsError(f"Invalid profile ID {part!r}") from None
+            if not 1 <= profile_id <= MAX_PROFILE_ID:
+                raise InvalidIdsError(f"Profile ID {part!r} out of range")
+            ids.append(profile_id)
+    if not ids:
+        raise InvalidIdsError("No profile IDs given")
+    return list(dict.fromkeys(ids))
+
+
+def summarize_bulk_create(
+    profiles: List[Dict], results: List[Optional[Profile]]
+) -> Dict:
+    """Build the per-item report of a bulk creation."""
+    items = []
+    for index, (data, profile) in enumerate(zip(profiles, results)):
+        if profile is not None:
+            items.append({"index": index, "email": data["email"], "status": "created",
+                          "profile": profile})
+        else:
+            items.append({"index": index, "email": data["email"], "status": "conflict",
+                          "detail": "El email ya está registrado"})
+    created = sum(1 for profile in results if profile is not None)
+    return {"created": created, "conflicts": len(results) - created, "results": items}
+
+
 class ProfileApi:
     """API for profile-related operations."""
 
@@ -17,15 +116,97 @@ class ProfileApi:
         # Use the service to create and persist the profile
         return self.profile_service.create_profile(name, email, specialty, linkedin)
 
-    def get_profile(self, profile_id: int) -> Optional[Profile]:
+    def create_profiles(self, profiles: List[Dict]) -> List[Optional[Profile]]:
+        """
+        Create many profiles at once.
+        Each item holds the create_profile arguments; the result is aligned with
+        the input and holds None for every duplicate email.
+        """
+        return self.profile_service.create_profiles(profiles)
+
+    def get_profile(self, profile_id: int, include_history: bool = False) -> Optional[Profile]:
         """Get a profile by ID."""
         # Use the service to get the profile
-        return self.profile_service.get_profile(profile_id)
+        return self.profile_service.get_profile(profile_id, include_history=include_history)
 
-    def get_profiles(self, skip: int = 0, limit: int = 10) -> List[Profile]:
+    def get_profiles_batch(self, profile_ids: List[int]) -> Tuple[List[Profile], List[int]]:
+        """
+        Get many profiles by ID with a single query.
+        Returns the profiles found, in the order of ``profile_ids``, and the missing IDs.
+        """
+        found = self.profile_service.get_profiles_by_ids(profile_ids)
+        profiles = [found[i] for i in profile_ids if found[i] is not None]
+        return profiles, [i for i in profile_ids if found[i] is None]
+
+    def get_profiles(
+        self, skip: int = 0, limit: int = 10, include_history: bool = False
+    ) -> List[Profile]:
         """Get all profiles with pagination."""
         # Use the service to get all profiles
-        return self.profile_service.get_profiles(skip, limit)
+        return self.profile_service.get_profiles(skip, limit, include_history=include_history)
+
+    def get_profiles_page(
+        self,
+        skip: int = 0,
+        limit: int = 10,
+        after: Optional[str] = None,
+        order_by: str = "id",
+        filters: Optional[Dict] = None,
+    ) -> Tuple[List[Profile], Optional[str]]:
+        """
+        Get a page of the profiles matching ``filters`` and the opaque cursor of the next one.
+        ``after`` switches from offset to keyset pagination; it raises
+        InvalidCursorError when the token cannot be decoded, and InvalidFilterError
+        for an unknown status.
+        """
+        keyset = decode_cursor(after, order_by) if after else None
+        profiles = self.profile_service.get_profiles(
+            skip, limit, after=keyset, order_by=order_by, filters=build_filter(filters)
+        )
+        return profiles, next_cursor(profiles, limit, order_by)
+
+    def get_history_page(
+        self,
+        profile_id: int,
+        limit: int = 10,
+        after: Optional[str] = None,
+        filters: Optional[Dict] = None,
+    ) -> Optional[Tuple[List[ProfileHistory], Optional[str]]]:
+        """
+        Get a page of a profile's status history, oldest first, and the cursor of the
+        next one; None when the profile does not exist. Raises InvalidCursorError and
+        InvalidFilterError like get_profiles_page.
+        """
+        keyset = decode_cursor(after, HISTORY_ORDER) if after else None
+        entries = self.profile_service.get_history(
+            profile_id, limit, keyset, build_filter(filters, HistoryFilter)
+        )
+        if entries is None:
+            return None
+        return entries, next_history_cursor(entries, limit)
+
+    def search_profiles(
+        self, query: str, limit: int = 10, after: Optional[str] = None
+    ) -> Tuple[List[Profile], Optional[str]]:
+        """Search profiles by relevance; returns a page and the cursor of the next one."""
+        keyset = decode_cursor(after, SEARCH_ORDER) if after else None
+        results = self.profile_service.search_profiles(query, limit, keyset)
+        return [profile for profile, _ in results], next_search_cursor(results, limit)
+
+    def export_profiles(self) -> Iterator[Tuple]:
+        """Stream every profile as a plain row for bulk export."""
+        return self.profile_service.stream_profiles()
+
+    def import_profiles(
+        self,
+        upload: BinaryIO,
+        import_format: str,
+        batch_size: int = DEFAULT_IMPORT_BATCH_SIZE,
+    ) -> ImportReport:
+        """Stream-parse a CSV/NDJSON upload and upsert its valid rows in batches."""
+        report = ImportReport()
+        profiles = read_profiles(upload, import_format, report)
+        return self.profile_service.import_profiles(profiles, batch_size, report)
 
     def update_profile(
         self,
@@ -36,36 +217,26 @@ class ProfileApi:
         linkedin: Optional[str] = None,
         status: Optional[str] = None,
     ) -> Optional[Profile]:
-        """Update a profile."""
-        profile = self.profile_service.get_profile(profile_id)
+        """Update a profile; the read it starts from bypasses the cache."""
+        profile = self.profile_service.get_profile_for_update(profile_id)
         if not profile:
             return None
 
         # Convert status string to enum if provided
-        status_enum = None
-        if status:
-            try:
-                # Handle both "inactive" and "INACTIVE" formats
-                if status.upper() == "INACTIVE":
-                    status_enum = ProfileStatus.INACTIVE
-                elif status.upper() == "ACTIVE":
-                    status_enum = ProfileStatus.ACTIVE
-                elif status.upper() == "SUSPENDED":
-                    status_enum = ProfileStatus.SUSPENDED
-                elif status.upper() == "DELETED":
-                    status_enum = ProfileStatus.DELETED
-                else:
-                    # Try direct conversion as fallback
-                    status_enum = ProfileStatus(status)
-            except ValueError:
-                # Invalid status value, ignore it
-                pass
+        status_enum = parse_status(status)
 
         # Use the service to update the profile
         return self.profile_service.update_profile(
             profile, name, email, specialty, linkedin, status_enum
         )
 
+    def patch_profile(self, profile_id: int, changes: Dict) -> Optional[Profile]:
+        """Apply only the supplied fields to a profile; unknown statuses are ignored."""
+        changes = dict(changes)
+        if "status" in changes:
+            changes["status"] = parse_status(changes["status"])
+        return self.profile_service.patch_profile(profile_id, changes)
+
     def delete_profile(self, profile_id: int) -> Optional[Profile]:
         """Delete a profile."""
         # Use the service to delete the profile
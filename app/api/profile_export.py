@@ -0,0 +1,79 @@
+import csv
+import enum
+import io
+from datetime import datetime
+from typing import AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, List, Literal, Union
+
+import orjson
+
+from app.entities import PROFILE_FIELDS
+
+# 🔹 Formatos de exportación soportados
+ExportFormat = Literal["ndjson", "csv"]
+
+EXPORT_MEDIA_TYPES: Dict[str, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+# Rows serialized per chunk written to the response
+EXPORT_CHUNK_ROWS = 500
+
+
+def _plain(value):
+    """Convert a column value to what ProfileResponse would emit."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, enum.Enum):
+        return value.value
+    return value
+
+
+def encode_ndjson(rows: List) -> bytes:
+    """Serialize rows as newline-delimited JSON objects; orjson encodes enums and datetimes."""
+    return b"".join(
+        orjson.dumps(dict(zip(PROFILE_FIELDS, row)), option=orjson.OPT_APPEND_NEWLINE)
+        for row in rows
+    )
+
+
+def encode_csv(rows: List, header: bool = False) -> str:
+    """Serialize rows as CSV, optionally preceded by the header line."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(PROFILE_FIELDS)
+    writer.writerows([["" if v is None else _plain(v) for v in row] for row in rows])
+    return buffer.getvalue()
+
+
+def _encode(export_format: str, rows: List, first: bool) -> Union[str, bytes]:
+    if export_format == "csv":
+        return encode_csv(rows, header=first)
+    return encode_ndjson(rows)
+
+
+def iter_export(rows: Iterable, export_format: str) -> Iterator[Union[str, bytes]]:
+    """Serialize a row stream incrementally, one chunk of rows at a time."""
+    batch, first = [], True
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= EXPORT_CHUNK_ROWS:
+            yield _encode(export_format, batch, first)
+            batch, first = [], False
+    if batch or first:
+        yield _encode(export_format, batch, first)
+
+
+async def aiter_export(
+    rows: AsyncIterable, export_format: str
+) -> AsyncIterator[Union[str, bytes]]:
+    """Asyncio counterpart of iter_export."""
+    batch, first = [], True
+    async for row in rows:
+        batch.append(row)
+        if len(batch) >= EXPORT_CHUNK_ROWS:
+            yield _encode(export_format, batch, first)
+            batch, first = [], False
+    if batch or first:
+        yield _encode(export_format, batch, first)
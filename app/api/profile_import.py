@@ -0,0 +1,82 @@
+import csv
+import json
+from typing import BinaryIO, Dict, Iterable, Iterator, Literal, Optional, Tuple
+
+from pydantic import ValidationError
+
+from app.api.profile_schemas import ProfileCreate
+from app.services.profile_import import ImportReport
+
+# 🔹 Formatos de importación soportados
+ImportFormat = Literal["csv", "ndjson"]
+
+_EXTENSIONS = {".csv": "csv", ".ndjson": "ndjson", ".jsonl": "ndjson"}
+
+
+def detect_format(filename: Optional[str], explicit: Optional[str] = None) -> str:
+    """Pick the import format from the explicit value or the file extension."""
+    if explicit:
+        return explicit
+    for extension, import_format in _EXTENSIONS.items():
+        if (filename or "").lower().endswith(extension):
+            return import_format
+    raise ValueError(f"Cannot infer the import format of {filename!r}")
+
+
+def iter_csv_records(lines: Iterable[str]) -> Iterator[Tuple[int, Dict]]:
+    """Yield (line number, record) pairs from CSV text with a header row."""
+    reader = csv.DictReader(lines)
+    for record in reader:
+        # Empty cells mean "not provided", as a missing key would in NDJSON
+        yield reader.line_num, {k: (v if v != "" else None) for k, v in record.items() if k}
+
+
+def iter_ndjson_records(lines: Iterable[str]) -> Iterator[Tuple[int, object]]:
+    """Yield (line number, record) pairs from NDJSON text; bad lines yield the exception."""
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield line_number, json.loads(line)
+        except ValueError as exc:
+            yield line_number, exc
+
+
+def iter_valid_profiles(
+    records: Iterable[Tuple[int, object]], report: ImportReport
+) -> Iterator[Dict]:
+    """Validate records against ProfileCreate, recording rejections in ``report``."""
+    for line_number, record in records:
+        if isinstance(record, Exception):
+            report.reject(line_number, f"JSON inválido: {record}")
+            continue
+        try:
+            yield ProfileCreate.model_validate(record).model_dump()
+        except ValidationError as exc:
+            errors = "; ".join(
+                f"{'.'.join(map(str, error['loc'])) or 'row'}: {error['msg']}"
+                for error in exc.errors()
+            )
+            report.reject(line_number, errors)
+
+
+def decode_lines(upload: BinaryIO, report: ImportReport) -> Iterator[str]:
+    """
+    Decode a binary upload as UTF-8 one line at a time. A line that is not valid UTF-8
+    (e.g. a Windows-1252 export) is rejected and read as blank, so line numbers still
+    match and the rows around it are imported.
+    """
+    for line_number, line in enumerate(upload, start=1):
+        try:
+            # utf-8-sig drops the BOM that Excel writes at the start of the file
+            yield line.decode("utf-8-sig" if line_number == 1 else "utf-8")
+        except UnicodeDecodeError as exc:
+            report.reject(line_number, f"Codificación inválida, se espera UTF-8: {exc.reason}")
+            yield ""
+
+
+def read_profiles(upload: BinaryIO, import_format: str, report: ImportReport) -> Iterator[Dict]:
+    """Parse a binary upload as a stream of validated ProfileCreate dicts."""
+    text = decode_lines(upload, report)
+    records = iter_csv_records(text) if import_format == "csv" else iter_ndjson_records(text)
+    return iter_valid_profiles(records, report)
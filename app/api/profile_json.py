@@ -0,0 +1,57 @@
+from operator import attrgetter
+from typing import Any, Dict, Optional
+
+import orjson
+from fastapi import Response
+
+from app.entities import HISTORY_FIELDS, PROFILE_FIELDS, Profile, ProfileHistory
+
+# Pre-built getter of every ProfileResponse field, in PROFILE_FIELDS order
+_profile_values = attrgetter(*PROFILE_FIELDS)
+_history_values = attrgetter(*HISTORY_FIELDS)
+
+
+def profile_fields(profile: Profile) -> Dict:
+    """The ProfileResponse fields of a profile; orjson encodes its enum and datetimes."""
+    return dict(zip(PROFILE_FIELDS, _profile_values(profile)))
+
+
+def entity_fields(entity: Any) -> Dict:
+    """orjson ``default`` hook for the domain entities it cannot encode by itself."""
+    if isinstance(entity, ProfileHistory):
+        return dict(zip(HISTORY_FIELDS, _history_values(entity)))
+    if isinstance(entity, Profile):
+        return profile_fields(entity)
+    raise TypeError(f"{type(entity).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Serialize profiles, history entries, lists of them or plain JSON data to the bytes
+    ProfileResponse/ProfileHistoryResponse would produce: status as its value, naive
+    datetimes in ISO 8601.
+    """
+    return orjson.dumps(content, default=entity_fields)
+
+
+class ProfileJSONResponse(Response):
+    """
+    JSON response rendered by orjson straight from domain profiles. Routes return it
+    instead of the profiles, which skips response_model validation and the stdlib
+    encoder; response_model stays on the route for the OpenAPI schema only.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def profile_response(content: Any, response: Optional[Response] = None) -> ProfileJSONResponse:
+    """
+    Wrap ``content`` in a ProfileJSONResponse. Headers already set on the route's
+    ``response`` parameter (ETag, X-Next-Cursor) are carried over, since FastAPI
+    drops them when a route returns a Response of its own.
+    """
+    headers = dict(response.headers) if response is not None else None
+    return ProfileJSONResponse(content, headers=headers)
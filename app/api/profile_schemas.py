@@ -1,6 +1,6 @@
 from pydantic import BaseModel, EmailStr
 from datetime import datetime
-from typing import Optional
+from typing import List, Literal, Optional
 
 
 # 🔹 Esquema para crear un perfil
@@ -28,4 +28,71 @@ class ProfileResponse(ProfileCreate):
     end_date: Optional[datetime] = None
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+# 🔹 Filtros de GET /profiles/ (rangos de fechas: desde inclusivo, hasta exclusivo)
+class ProfileFilterParams(BaseModel):
+    status: Optional[str] = None
+    specialty: Optional[str] = None
+    start_date_from: Optional[datetime] = None
+    start_date_to: Optional[datetime] = None
+    end_date_from: Optional[datetime] = None
+    end_date_to: Optional[datetime] = None
+    include_deleted: bool = True
+
+
+# 🔹 Entrada del historial de estados de un perfil
+class ProfileHistoryResponse(BaseModel):
+    id: int
+    profile_id: int
+    status: str
+    changed_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+# 🔹 Filtros de GET /profiles/{profile_id}/history (desde inclusivo, hasta exclusivo)
+class HistoryFilterParams(BaseModel):
+    status: Optional[str] = None
+    changed_from: Optional[datetime] = None
+    changed_to: Optional[datetime] = None
+
+
+# 🔹 Máximo de perfiles por llamada a POST /profiles/bulk
+MAX_BULK_PROFILES = 10000
+
+# 🔹 Máximo de IDs por llamada a GET /profiles/batch
+MAX_BATCH_IDS = 100
+
+
+# 🔹 Resultado por elemento de una creación masiva
+class BulkProfileResult(BaseModel):
+    index: int
+    email: str
+    status: Literal["created", "conflict"]
+    profile: Optional[ProfileResponse] = None
+    detail: Optional[str] = None
+
+
+# 🔹 Respuesta de la creación masiva
+class BulkProfileResponse(BaseModel):
+    created: int
+    conflicts: int
+    results: List[BulkProfileResult]
+
+
+# 🔹 Fila rechazada durante una importación
+class ImportRowError(BaseModel):
+    line: int
+    error: str
+
+
+# 🔹 Resumen de una importación masiva
+class ImportReportResponse(BaseModel):
+    inserted: int
+    updated: int
+    skipped: int
+    rejected: int
+    errors: List[ImportRowError]
@@ -1,8 +1,43 @@
-from fastapi import APIRouter, Depends, HTTPException
-from app.api.profile_api import ProfileApi
-from app.api.profile_schemas import ProfileCreate, ProfileUpdate, ProfileResponse
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+)
+from fastapi.responses import StreamingResponse
+from app.api.etag import not_modified, profile_etag, profiles_etag
+from app.api.pagination import InvalidCursorError, ProfileOrder
+from app.api.profile_api import (
+    InvalidFilterError,
+    InvalidIdsError,
+    ProfileApi,
+    parse_ids,
+    summarize_bulk_create,
+)
+from app.api.profile_import import ImportFormat, detect_format
+from app.api.profile_json import profile_response
+from app.api.profile_export import EXPORT_MEDIA_TYPES, ExportFormat, iter_export
+from app.api.profile_schemas import (
+    MAX_BATCH_IDS,
+    MAX_BULK_PROFILES,
+    BulkProfileResponse,
+    HistoryFilterParams,
+    ImportReportResponse,
+    ProfileCreate,
+    ProfileFilterParams,
+    ProfileHistoryResponse,
+    ProfileResponse,
+    ProfileUpdate,
+)
 from app.config.dependencies import get_profile_api
-from typing import List
+from app.entities import DuplicateEmailError
+from app.services.profile_import import DEFAULT_IMPORT_BATCH_SIZE
+from typing import List, Optional
 
 router = APIRouter()
 
@@ -10,27 +45,160 @@ router = APIRouter()
 # 🔹 Crear un nuevo perfil
 @router.post("/profiles/", response_model=ProfileResponse)
 def create_new_profile(profile: ProfileCreate, profile_service: ProfileApi = Depends(get_profile_api)):
-    return profile_service.create_profile(
+    created_profile = profile_service.create_profile(
         name=profile.name,
         email=profile.email,
         specialty=profile.specialty,
         linkedin=profile.linkedin,
     )
+    return profile_response(created_profile)
+
+
+# 🔹 Crear perfiles en lote (inserciones masivas en una sola transacción)
+@router.post("/profiles/bulk", response_model=BulkProfileResponse)
+def create_profiles_bulk(
+    profiles: List[ProfileCreate] = Body(..., max_length=MAX_BULK_PROFILES),
+    profile_service: ProfileApi = Depends(get_profile_api),
+):
+    data = [profile.model_dump() for profile in profiles]
+    return summarize_bulk_create(data, profile_service.create_profiles(data))
+
+
+# 🔹 Importar perfiles desde un archivo CSV/NDJSON (upsert por email en lotes)
+@router.post("/profiles/import", response_model=ImportReportResponse)
+def import_profiles(
+    file: UploadFile = File(...),
+    format: Optional[ImportFormat] = None,
+    batch_size: int = Query(DEFAULT_IMPORT_BATCH_SIZE, ge=1, le=10000),
+    profile_service: ProfileApi = Depends(get_profile_api),
+):
+    try:
+        import_format = detect_format(file.filename, format)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Formato de importación no soportado")
+    return profile_service.import_profiles(file.file, import_format, batch_size).to_dict()
+
+
+# 🔹 Exportar todos los perfiles en streaming (NDJSON o CSV)
+@router.get("/profiles/export")
+def export_profiles(
+    format: ExportFormat = "ndjson", profile_service: ProfileApi = Depends(get_profile_api)
+):
+    return StreamingResponse(
+        iter_export(profile_service.export_profiles(), format),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="profiles.{format}"'},
+    )
+
+
+# 🔹 Buscar perfiles por nombre, especialidad o email (ordenados por relevancia, con cursor)
+@router.get("/profiles/search", response_model=List[ProfileResponse])
+def search_profiles(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(10, ge=1, le=100),
+    after: Optional[str] = None,
+    profile_service: ProfileApi = Depends(get_profile_api),
+):
+    try:
+        profiles, next_cursor = profile_service.search_profiles(q, limit, after)
+    except InvalidCursorError:
+        raise HTTPException(status_code=400, detail="Cursor inválido")
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return profile_response(profiles, response)
+
+
+# 🔹 Obtener varios perfiles por ID en una sola consulta (?ids=1,2,3 o ?ids=1&ids=2),
+# en el orden pedido y sin duplicados; los IDs inexistentes van en X-Missing-Ids
+@router.get("/profiles/batch", response_model=List[ProfileResponse])
+def read_profiles_batch(
+    request: Request,
+    response: Response,
+    ids: List[str] = Query(...),
+    profile_service: ProfileApi = Depends(get_profile_api),
+):
+    try:
+        profile_ids = parse_ids(ids)
+    except InvalidIdsError:
+        raise HTTPException(status_code=400, detail="IDs inválidos")
+    if len(profile_ids) > MAX_BATCH_IDS:
+        raise HTTPException(status_code=400, detail=f"Máximo {MAX_BATCH_IDS} IDs por petición")
+    profiles, missing = profile_service.get_profiles_batch(profile_ids)
+    if missing:
+        response.headers["X-Missing-Ids"] = ",".join(map(str, missing))
+    etag = profiles_etag(profiles)
+    return not_modified(request, response, etag) or profile_response(profiles, response)
 
 
 # 🔹 Obtener un perfil por ID
 @router.get("/profiles/{profile_id}", response_model=ProfileResponse)
-def read_profile(profile_id: int, profile_service: ProfileApi = Depends(get_profile_api)):
+def read_profile(
+    profile_id: int,
+    request: Request,
+    response: Response,
+    profile_service: ProfileApi = Depends(get_profile_api),
+):
     profile = profile_service.get_profile(profile_id)
     if not profile:
         raise HTTPException(status_code=404, detail="Perfil no encontrado")
-    return profile
+    # 🔹 GET condicional: 304 sin serializar el cuerpo si el cliente ya tiene esta versión
+    etag = profile_etag(profile)
+    return not_modified(request, response, etag) or profile_response(profile, response)
+
+
+# 🔹 Historial de estados de un perfil, del más antiguo al más reciente (keyset con `after`),
+# filtrado por estado y rango de fechas
+@router.get("/profiles/{profile_id}/history", response_model=List[ProfileHistoryResponse])
+def read_profile_history(
+    profile_id: int,
+    response: Response,
+    limit: int = Query(10, ge=1, le=100),
+    after: Optional[str] = None,
+    filters: HistoryFilterParams = Depends(),
+    profile_service: ProfileApi = Depends(get_profile_api),
+):
+    try:
+        page = profile_service.get_history_page(
+            profile_id, limit, after, filters.model_dump()
+        )
+    except InvalidCursorError:
+        raise HTTPException(status_code=400, detail="Cursor inválido")
+    except InvalidFilterError:
+        raise HTTPException(status_code=400, detail="Estado inválido")
+    if page is None:
+        raise HTTPException(status_code=404, detail="Perfil no encontrado")
+    entries, next_cursor = page
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return profile_response(entries, response)
 
 
-# 🔹 Obtener todos los perfiles
+# 🔹 Obtener todos los perfiles (offset con skip/limit o keyset con el cursor `after`),
+# filtrados por estado, especialidad y rangos de fechas
 @router.get("/profiles/", response_model=List[ProfileResponse])
-def read_profiles(skip: int = 0, limit: int = 10, profile_service: ProfileApi = Depends(get_profile_api)):
-    return profile_service.get_profiles(skip, limit)
+def read_profiles(
+    request: Request,
+    response: Response,
+    skip: int = 0,
+    limit: int = 10,
+    after: Optional[str] = None,
+    order_by: ProfileOrder = "id",
+    filters: ProfileFilterParams = Depends(),
+    profile_service: ProfileApi = Depends(get_profile_api),
+):
+    try:
+        profiles, next_cursor = profile_service.get_profiles_page(
+            skip, limit, after, order_by, filters.model_dump()
+        )
+    except InvalidCursorError:
+        raise HTTPException(status_code=400, detail="Cursor inválido")
+    except InvalidFilterError:
+        raise HTTPException(status_code=400, detail="Estado inválido")
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    etag = profiles_etag(profiles)
+    return not_modified(request, response, etag) or profile_response(profiles, response)
 
 
 # 🔹 Actualizar un perfil
@@ -46,7 +214,25 @@ def update_existing_profile(profile_id: int, profile: ProfileUpdate, profile_ser
     )
     if not updated_profile:
         raise HTTPException(status_code=404, detail="Perfil no encontrado")
-    return updated_profile
+    return profile_response(updated_profile)
+
+
+# 🔹 Actualizar solo los campos enviados (un único UPDATE, sin lectura previa)
+@router.patch("/profiles/{profile_id}", response_model=ProfileResponse)
+def patch_existing_profile(
+    profile_id: int,
+    profile: ProfileUpdate,
+    profile_service: ProfileApi = Depends(get_profile_api),
+):
+    try:
+        patched_profile = profile_service.patch_profile(
+            profile_id, profile.model_dump(exclude_unset=True)
+        )
+    except DuplicateEmailError:
+        raise HTTPException(status_code=409, detail="El email ya está registrado")
+    if not patched_profile:
+        raise HTTPException(status_code=404, detail="Perfil no encontrado")
+    return profile_response(patched_profile)
 
 
 # 🔹 Eliminar un perfil
@@ -1,5 +1,13 @@
-from app.config.database import Base, engine, get_db, SessionLocal
-from app.config.dependencies import get_profile_repository, get_profile_service
+from app.config.database import Base, engine, get_db, SessionLocal, DB_ASYNC
+from app.config.async_database import AsyncSessionLocal, get_async_db, get_async_engine
+from app.config.cache import get_profile_cache, profile_cache
+from app.config.dependencies import (
+    get_profile_repository,
+    get_profile_service,
+    get_async_profile_repository,
+    get_async_profile_service,
+    get_database_pools,
+)
 
 __all__ = [
     # Database
@@ -7,7 +15,18 @@ __all__ = [
     "engine",
     "get_db",
     "SessionLocal",
+    "DB_ASYNC",
+    # Async database
+    "AsyncSessionLocal",
+    "get_async_db",
+    "get_async_engine",
+    # Cache
+    "get_profile_cache",
+    "profile_cache",
     # Dependencies
     "get_profile_repository",
     "get_profile_service",
+    "get_async_profile_repository",
+    "get_async_profile_service",
+    "get_database_pools",
 ]
\ No newline at end of file
@@ -0,0 +1,35 @@
+import os
+from typing import Dict, Union
+from app.config.database import DB_ASYNC
+from app.services.profile_cache import ProfileCache, create_profile_cache
+from app.services.single_flight import AsyncSingleFlight, SingleFlight
+
+# 🔹 Caché de lectura de perfiles (por proceso)
+PROFILE_CACHE_BACKEND = os.getenv("PROFILE_CACHE_BACKEND", "memory")
+PROFILE_CACHE_MAXSIZE = int(os.getenv("PROFILE_CACHE_MAXSIZE", "1024"))
+PROFILE_CACHE_TTL = float(os.getenv("PROFILE_CACHE_TTL", "30"))
+
+profile_cache = create_profile_cache(
+    PROFILE_CACHE_BACKEND, PROFILE_CACHE_MAXSIZE, PROFILE_CACHE_TTL
+)
+
+
+# 🔹 Dependencia de caché para FastAPI
+def get_profile_cache() -> ProfileCache:
+    return profile_cache
+
+
+# 🔹 Lecturas concurrentes del mismo perfil comparten una sola consulta (por proceso)
+PROFILE_SINGLE_FLIGHT = os.getenv("PROFILE_SINGLE_FLIGHT", "true").lower() in ("1", "true", "yes")
+
+profile_flights = SingleFlight()
+async_profile_flights = AsyncSingleFlight()
+
+
+def get_single_flights() -> Dict[str, Union[SingleFlight, AsyncSingleFlight]]:
+    """Single-flight groups serving requests, by mode; empty when disabled."""
+    if not PROFILE_SINGLE_FLIGHT:
+        return {}
+    if DB_ASYNC:
+        return {"async": async_profile_flights}
+    return {"sync": profile_flights}
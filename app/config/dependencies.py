@@ -1,23 +1,51 @@
 from app.db.profile_repository import ProfileRepository as ProfileRepositoryImpl
+from app.db.async_profile_repository import AsyncProfileRepository
 from app.api.profile_api import ProfileApi
+from app.api.async_profile_api import AsyncProfileApi
 from app.services.profile_service import ProfileService
-from app.config.database import get_db
+from app.services.async_profile_service import AsyncProfileService
+from app.services.profile_cache import (
+    AsyncCachedProfileRepository,
+    CachedProfileRepository,
+    ProfileCache,
+)
+from app.services.single_flight import (
+    AsyncSingleFlightProfileRepository,
+    SingleFlightProfileRepository,
+)
+from app.config.database import DB_ASYNC, engine, get_db
+from app.config.history import get_history_recorder
+from app.config.async_database import get_async_db, get_async_engine
+from app.config.cache import (
+    PROFILE_SINGLE_FLIGHT,
+    async_profile_flights,
+    get_profile_cache,
+    profile_flights,
+)
 from fastapi import Depends
-from typing import Any
+from sqlalchemy.pool import Pool
+from typing import Any, Dict
 
 def get_profile_repository(db: Any) -> ProfileRepositoryImpl:
     """
     Factory function that returns a profile repository implementation.
     This hides the SQLAlchemy dependency from the routes.
     """
-    return ProfileRepositoryImpl(db)
+    return ProfileRepositoryImpl(db, get_history_recorder())
 
-def get_profile_service(db: Any = Depends(get_db)) -> ProfileService:
+def get_profile_service(
+    db: Any = Depends(get_db), cache: ProfileCache = Depends(get_profile_cache)
+) -> ProfileService:
     """
     Factory function that returns a ProfileService.
     This hides the repository dependency from the API.
+    The repository is fronted by the read-through profile cache; its misses go
+    through the single-flight group, so concurrent reads of a profile share a query.
     """
     repository = get_profile_repository(db)
+    if PROFILE_SINGLE_FLIGHT:
+        repository = SingleFlightProfileRepository(repository, profile_flights)
+    repository = CachedProfileRepository(repository, cache)
     return ProfileService(repository)
 
 def get_profile_api(profile_service: ProfileService = Depends(get_profile_service)) -> ProfileApi:
@@ -26,3 +54,43 @@ def get_profile_api(profile_service: ProfileService = Depends(get_profile_servic
     This hides the service dependency from the routes.
     """
     return ProfileApi(profile_service)
+
+
+def get_async_profile_repository(db: Any) -> AsyncProfileRepository:
+    """
+    Factory function that returns the AsyncSession-backed profile repository.
+    """
+    return AsyncProfileRepository(db, get_history_recorder())
+
+
+def get_async_profile_service(
+    db: Any = Depends(get_async_db), cache: ProfileCache = Depends(get_profile_cache)
+) -> AsyncProfileService:
+    """
+    Factory function that returns an AsyncProfileService.
+    The repository is fronted by the read-through profile cache and the single-flight group.
+    """
+    repository = get_async_profile_repository(db)
+    if PROFILE_SINGLE_FLIGHT:
+        repository = AsyncSingleFlightProfileRepository(repository, async_profile_flights)
+    repository = AsyncCachedProfileRepository(repository, cache)
+    return AsyncProfileService(repository)
+
+
+def get_async_profile_api(
+    profile_service: AsyncProfileService = Depends(get_async_profile_service),
+) -> AsyncProfileApi:
+    """
+    Factory function that returns an AsyncProfileApi.
+    """
+    return AsyncProfileApi(profile_service)
+
+
+def get_database_pools() -> Dict[str, Pool]:
+    """
+    Connection pools serving requests, by engine, for the internal telemetry endpoint.
+    Only the engine of the active mode is reported, so the other is never created.
+    """
+    if DB_ASYNC:
+        return {"async": get_async_engine().pool}
+    return {"sync": engine.pool}
@@ -0,0 +1,102 @@
+import asyncio
+import os
+from typing import Awaitable, Callable, Dict, Optional
+from sqlalchemy import text
+from app.config.database import DB_ASYNC, DB_POOL_SIZE, engine
+from app.config.async_database import get_async_engine
+
+# 🔹 Espera a la base de datos al arrancar: backoff exponencial entre estos límites (segundos)
+STARTUP_BACKOFF_INITIAL = float(os.getenv("STARTUP_BACKOFF_INITIAL", "0.5"))
+STARTUP_BACKOFF_MAX = float(os.getenv("STARTUP_BACKOFF_MAX", "30"))
+
+# 🔹 Conexiones que se abren al arrancar para que el pool esté caliente
+DB_POOL_WARM = int(os.getenv("DB_POOL_WARM", str(DB_POOL_SIZE)))
+
+
+class Readiness:
+    """Startup state of the database connection, as reported by /readyz."""
+
+    def __init__(self):
+        self.ready = False
+        self.attempts = 0
+        self.last_error: Optional[str] = None
+
+    def to_dict(self) -> Dict:
+        return {"ready": self.ready, "attempts": self.attempts, "last_error": self.last_error}
+
+
+readiness = Readiness()
+
+
+def _check_sync_database(warm: int) -> None:
+    connections = []
+    try:
+        for _ in range(max(warm, 1)):
+            connections.append(engine.connect())
+        connections[0].execute(text("SELECT 1"))
+    finally:
+        # Closing returns the connections to the pool, which is then warm
+        for connection in connections:
+            connection.close()
+
+
+async def _check_async_database(warm: int) -> None:
+    connections = []
+    try:
+        for _ in range(max(warm, 1)):
+            connections.append(await get_async_engine().connect())
+        await connections[0].execute(text("SELECT 1"))
+    finally:
+        for connection in connections:
+            await connection.close()
+
+
+async def check_database(warm: int = 0) -> None:
+    """
+    Run SELECT 1 on the engine serving requests, raising if the database is unreachable.
+    With ``warm`` the pool opens that many connections first.
+    """
+    if DB_ASYNC:
+        await _check_async_database(warm)
+    else:
+        await asyncio.to_thread(_check_sync_database, warm)
+
+
+async def wait_for_database(
+    state: Readiness,
+    check: Callable[[int], Awaitable[None]] = check_database,
+    initial_delay: float = STARTUP_BACKOFF_INITIAL,
+    max_delay: float = STARTUP_BACKOFF_MAX,
+    warm: int = DB_POOL_WARM,
+    sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+) -> None:
+    """
+    Retry the database check with exponential backoff until it succeeds, then mark
+    ``state`` ready. Runs in the background so the worker serves /healthz meanwhile.
+    """
+    delay = initial_delay
+    while True:
+        state.attempts += 1
+        try:
+            await check(warm)
+        except Exception as exc:
+            state.last_error = str(exc)
+            print(f"⚠️ Base de datos no disponible (intento {state.attempts}). "
+                  f"Reintentando en {delay:g}s...")
+            await sleep(delay)
+            delay = min(delay * 2, max_delay)
+            continue
+
+        state.ready = True
+        state.last_error = None
+        print("✅ Conexión con la base de datos lista")
+        return
+
+
+# 🔹 Dependencias de salud para FastAPI
+def get_readiness() -> Readiness:
+    return readiness
+
+
+def get_database_check() -> Callable[[int], Awaitable[None]]:
+    return check_database
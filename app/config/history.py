@@ -0,0 +1,31 @@
+import os
+from typing import Optional
+from app.config.database import engine
+from app.db.history_recorder import HistoryRecorder
+
+# 🔹 Retención del historial de estados: días que se conservan en la base (0 conserva todo)
+HISTORY_RETENTION_DAYS = int(os.getenv("HISTORY_RETENTION_DAYS", "365"))
+
+# 🔹 Directorio donde se archivan, comprimidas, las filas que salen de la retención
+HISTORY_ARCHIVE_DIR = os.getenv("HISTORY_ARCHIVE_DIR", "archive/profile_history")
+
+# 🔹 Particiones mensuales (PostgreSQL) que se crean por adelantado
+HISTORY_PARTITION_MONTHS_AHEAD = int(os.getenv("HISTORY_PARTITION_MONTHS_AHEAD", "3"))
+
+# 🔹 Escritura diferida del historial (write-behind): las filas se encolan tras el commit
+# y un hilo las inserta por lotes; desactivada, cada escritura las inserta en su transacción
+HISTORY_WRITE_BEHIND = os.getenv("HISTORY_WRITE_BEHIND", "false").lower() in ("1", "true", "yes")
+HISTORY_FLUSH_SIZE = int(os.getenv("HISTORY_FLUSH_SIZE", "500"))
+HISTORY_FLUSH_INTERVAL = float(os.getenv("HISTORY_FLUSH_INTERVAL", "1"))
+HISTORY_QUEUE_MAXSIZE = int(os.getenv("HISTORY_QUEUE_MAXSIZE", "10000"))
+
+history_recorder = (
+    HistoryRecorder(engine, HISTORY_FLUSH_SIZE, HISTORY_FLUSH_INTERVAL, HISTORY_QUEUE_MAXSIZE)
+    if HISTORY_WRITE_BEHIND
+    else None
+)
+
+
+# 🔹 Dependencia del recorder para FastAPI (None en modo síncrono)
+def get_history_recorder() -> Optional[HistoryRecorder]:
+    return history_recorder
@@ -0,0 +1,15 @@
+import hmac
+import os
+from typing import Optional
+from fastapi import Header, HTTPException
+
+# 🔹 Token de los endpoints internos (/internal/*); sin token quedan deshabilitados
+INTERNAL_API_TOKEN = os.getenv("INTERNAL_API_TOKEN", "")
+
+
+# 🔹 Dependencia que exige la cabecera X-Internal-Token
+def require_internal_token(x_internal_token: Optional[str] = Header(None)) -> None:
+    if not INTERNAL_API_TOKEN or not hmac.compare_digest(
+        (x_internal_token or "").encode(), INTERNAL_API_TOKEN.encode()
+    ):
+        raise HTTPException(status_code=403, detail="Token interno inválido")
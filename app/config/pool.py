@@ -0,0 +1,142 @@
+import threading
+import time
+import uuid
+from typing import Dict, Optional
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, Pool, QueuePool
+
+
+class PoolTelemetry:
+    """Checkout counters and wait times of a connection pool."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.checkout_failures = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def record(self, waited: float, failed: bool = False) -> None:
+        with self._lock:
+            if failed:
+                self.checkout_failures += 1
+            else:
+                self.checkouts += 1
+            self.wait_seconds_total += waited
+            self.wait_seconds_max = max(self.wait_seconds_max, waited)
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            attempts = self.checkouts + self.checkout_failures
+            average = self.wait_seconds_total / attempts if attempts else 0.0
+            return {
+                "checkouts": self.checkouts,
+                "checkout_failures": self.checkout_failures,
+                "wait_seconds_total": round(self.wait_seconds_total, 6),
+                "wait_seconds_avg": round(average, 6),
+                "wait_seconds_max": round(self.wait_seconds_max, 6),
+            }
+
+
+class _InstrumentedPoolMixin:
+    """
+    Times every checkout from the pool queue, including the wait for a free
+    connection (or a new one) and checkouts that fail with pool_timeout.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.telemetry = PoolTelemetry()
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except Exception:
+            self.telemetry.record(time.perf_counter() - started, failed=True)
+            raise
+        self.telemetry.record(time.perf_counter() - started)
+        return connection
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    """QueuePool that records checkout telemetry."""
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records checkout telemetry."""
+
+
+def _unique_statement_name() -> str:
+    return f"__asyncpg_{uuid.uuid4()}__"
+
+
+def _without_prepared_statements(driver: str) -> Dict:
+    """
+    Driver arguments that avoid named server-side prepared statements, which break
+    when PgBouncer in transaction mode hands each transaction a different backend.
+    """
+    if driver == "asyncpg":
+        return {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": _unique_statement_name,
+        }
+    if driver == "psycopg":
+        return {"prepare_threshold": None}
+    # psycopg2 never prepares statements server-side
+    return {}
+
+
+def pool_options(
+    url: str,
+    pool_size: int = 5,
+    max_overflow: int = 10,
+    pool_timeout: float = 30,
+    pool_recycle: int = 1800,
+    pool_pre_ping: bool = True,
+    pgbouncer: bool = False,
+) -> Dict:
+    """
+    Keyword arguments for create_engine / create_async_engine.
+    SQLite keeps SQLAlchemy's default pool, which depends on the database being a file
+    or in memory. PgBouncer mode disables client-side pooling, leaving it to PgBouncer.
+    """
+    dialect = make_url(url).get_dialect()
+    if dialect.name == "sqlite":
+        return {}
+
+    if pgbouncer:
+        return {
+            "poolclass": NullPool,
+            "connect_args": _without_prepared_statements(dialect.driver),
+        }
+
+    return {
+        "poolclass": InstrumentedAsyncQueuePool if dialect.is_async else InstrumentedQueuePool,
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_timeout": pool_timeout,
+        "pool_recycle": pool_recycle,
+        "pool_pre_ping": pool_pre_ping,
+    }
+
+
+def pool_stats(pool: Pool) -> Dict:
+    """Live occupancy of a pool, plus checkout telemetry when the pool records it."""
+    stats: Dict = {"pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update(
+            {
+                "size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                # Negative while the pool has not yet opened pool_size connections
+                "overflow": pool.overflow(),
+                "timeout": pool.timeout(),
+            }
+        )
+    telemetry: Optional[PoolTelemetry] = getattr(pool, "telemetry", None)
+    if telemetry is not None:
+        stats.update(telemetry.snapshot())
+    return stats
@@ -0,0 +1,167 @@
+import logging
+import os
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator, List, Optional, Tuple
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# 🔹 Sentencias más lentas que este umbral (ms) se registran en el log; 0 lo desactiva
+DB_SLOW_QUERY_MS = float(os.getenv("DB_SLOW_QUERY_MS", "200"))
+
+# 🔹 Una misma sentencia repetida estas veces en una petición se registra como posible N+1
+DB_N_PLUS_ONE_THRESHOLD = int(os.getenv("DB_N_PLUS_ONE_THRESHOLD", "10"))
+
+NO_ROUTE = "-"
+
+
+class QueryStats:
+    """
+    SQL statements executed, and the time spent in them, within one unit of work.
+    Statements also count towards the enclosing QueryStats, if any.
+    """
+
+    def __init__(
+        self,
+        parent: Optional["QueryStats"] = None,
+        route: Optional[Callable[[], str]] = None,
+    ):
+        self.count = 0
+        self.seconds = 0.0
+        self.statements: Counter = Counter()
+        self.parent = parent
+        self._route = route
+
+    @property
+    def route(self) -> str:
+        """Route template of the request being measured; resolved lazily, after routing."""
+        if self._route is not None:
+            return self._route()
+        return self.parent.route if self.parent is not None else NO_ROUTE
+
+    def record(self, statement: str, seconds: float) -> None:
+        stats = self
+        while stats is not None:
+            stats.count += 1
+            stats.seconds += seconds
+            stats.statements[statement] += 1
+            stats = stats.parent
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """Statements executed at least ``threshold`` times, most repeated first."""
+        return [(sql, n) for sql, n in self.statements.most_common() if n >= threshold]
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Raised when a request runs more SQL statements than the declared query budget."""
+
+    def __init__(self, stats: QueryStats, budget: int):
+        listing = "\n".join(
+            f"  {n}x {_compact(sql)}" for sql, n in stats.statements.most_common()
+        )
+        super().__init__(
+            f"{stats.route} ran {stats.count} SQL statements, budget is {budget}:\n{listing}"
+        )
+
+
+# 🔹 Estadísticas de la petición en curso; se propagan al threadpool con el contexto
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+_query_budget: ContextVar[Optional[int]] = ContextVar("query_budget", default=None)
+
+
+@contextmanager
+def collect_queries(route: Optional[Callable[[], str]] = None) -> Iterator[QueryStats]:
+    """Count the statements that every engine executes inside the ``with`` block."""
+    stats = QueryStats(parent=_current_stats.get(), route=route)
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+@contextmanager
+def request_queries(route: Callable[[], str]) -> Iterator[QueryStats]:
+    """
+    collect_queries for one HTTP request: afterwards logs statements repeated like an
+    N+1 pattern and enforces the query budget, when one is active.
+    """
+    with collect_queries(route) as stats:
+        yield stats
+
+    if DB_N_PLUS_ONE_THRESHOLD > 0:
+        for statement, times in stats.repeated(DB_N_PLUS_ONE_THRESHOLD):
+            logger.warning(
+                "Possible N+1 in %s: statement ran %d times: %s",
+                stats.route, times, _compact(statement),
+            )
+
+    budget = _query_budget.get()
+    if budget is not None and stats.count > budget:
+        raise QueryBudgetExceeded(stats, budget)
+
+
+@contextmanager
+def query_budget(max_queries: int) -> Iterator[None]:
+    """
+    Opt-in check for tests: every request handled inside the ``with`` block fails with
+    QueryBudgetExceeded if it runs more than ``max_queries`` statements.
+    """
+    token = _query_budget.set(max_queries)
+    try:
+        yield
+    finally:
+        _query_budget.reset(token)
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    """The QueryStats being collected for the current request, if any."""
+    return _current_stats.get()
+
+
+def _compact(statement: str, limit: int = 300) -> str:
+    statement = re.sub(r"\s+", " ", statement).strip()
+    return statement if len(statement) <= limit else statement[:limit] + "..."
+
+
+def parameters_shape(parameters, executemany: bool = False) -> str:
+    """Describe bound parameters by type only, so values never reach the logs."""
+    if executemany:
+        rows = list(parameters or ())
+        return f"{len(rows)} x {parameters_shape(rows[0])}" if rows else "0 rows"
+    if isinstance(parameters, dict):
+        return "{" + ", ".join(f"{k}: {type(v).__name__}" for k, v in parameters.items()) + "}"
+    if isinstance(parameters, (list, tuple)):
+        return "(" + ", ".join(type(v).__name__ for v in parameters) + ")"
+    return "()"
+
+
+# 🔹 Listeners globales: cubren los motores sync y async (su sync_engine) y los de tests
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._query_started = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _stop_query_timer(conn, cursor, statement, parameters, context, executemany):
+    if context is None:
+        return
+    elapsed = time.perf_counter() - context._query_started
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(statement, elapsed)
+
+    if DB_SLOW_QUERY_MS > 0 and elapsed * 1000 >= DB_SLOW_QUERY_MS:
+        logger.warning(
+            "Slow query (%.1f ms) in %s: %s parameters=%s",
+            elapsed * 1000,
+            stats.route if stats is not None else NO_ROUTE,
+            _compact(statement),
+            parameters_shape(parameters, executemany),
+        )
@@ -1,3 +1,4 @@
 from app.db.profile_repository import ProfileRepository
+from app.db.async_profile_repository import AsyncProfileRepository
 
-__all__ = ["ProfileRepository"]
+__all__ = ["ProfileRepository", "AsyncProfileRepository"]
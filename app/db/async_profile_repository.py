@@ -0,0 +1,270 @@
+import asyncio
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from sqlalchemy import Row
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.entities import DuplicateEmailError, HistoryFilter, Profile, ProfileFilter, ProfileHistory
+from app.db.history_recorder import HistoryRecorder
+from app.db.profile_queries import (
+    align_created,
+    chunked,
+    delete_history_of,
+    delete_profile_by_id,
+    first_by_email,
+    history_from_row,
+    history_row,
+    insert_history_rows,
+    insert_profile,
+    insert_profiles_skipping_conflicts,
+    map_to_domain,
+    patch_profile_by_id,
+    pending_history_rows,
+    profile_results,
+    profile_row,
+    select_history,
+    select_ids_by_email,
+    select_profile,
+    select_profile_exists,
+    select_profile_for_update,
+    select_profile_rows,
+    select_profiles_by_ids,
+    select_profiles,
+    search_profiles,
+    update_profile_by_id,
+    update_profiles_by_id,
+    update_row,
+)
+
+
+class AsyncProfileRepository:
+    """Asyncio counterpart of ProfileRepository, backed by an AsyncSession."""
+
+    def __init__(self, db: AsyncSession, history_recorder: Optional[HistoryRecorder] = None):
+        self.db = db
+        # Write-behind queue for history rows; None writes them in the same transaction
+        self.history_recorder = history_recorder
+
+    async def _add_history(self, rows: List[Dict]) -> List[Dict]:
+        """
+        Insert history rows in the current transaction or, with write-behind on, hold
+        them back to be queued once it commits (see _queue_history).
+        """
+        if rows and self.history_recorder is None:
+            await self.db.execute(insert_history_rows(), rows)
+            return []
+        return rows
+
+    async def _queue_history(self, rows: List[Dict]) -> None:
+        """Queue committed history rows; while the queue is full they are written right away."""
+        if rows and not self.history_recorder.record(rows):
+            await self.db.execute(insert_history_rows(), rows)
+            await self.db.commit()
+
+    async def create(self, profile: Profile) -> Profile:
+        """Create a new profile and its initial history entry in one transaction."""
+        row = (await self.db.execute(insert_profile(profile))).one()
+        history = await self._add_history([history_row(row.id, profile.status, row.start_date)])
+        await self.db.commit()
+        await self._queue_history(history)
+
+        return map_to_domain(row)
+
+    async def create_many(self, profiles: List[Profile]) -> List[Optional[Profile]]:
+        """
+        Create profiles and their initial history with set-based INSERTs in one transaction.
+        Returns a list aligned with the input holding None for duplicate emails.
+        """
+        first = first_by_email(profiles)
+        unique = [profiles[index] for index in first.values()]
+        stmt = insert_profiles_skipping_conflicts(self.db.get_bind().dialect.name)
+
+        created = {}
+        for chunk in chunked(unique):
+            result = await self.db.execute(stmt.values([profile_row(p) for p in chunk]))
+            created.update({row.email: row.id for row in result})
+
+        history = [
+            history_row(created[p.email], p.status, p.start_date)
+            for p in unique
+            if p.email in created
+        ]
+        history = await self._add_history(history)
+        await self.db.commit()
+        await self._queue_history(history)
+
+        return align_created(profiles, first, created)
+
+    async def upsert_many(self, profiles: List[Profile]) -> Tuple[int, int, int]:
+        """
+        Insert or update a batch of profiles keyed by email, in one transaction.
+        New profiles get their initial history row; existing ones have name, specialty
+        and linkedin overwritten. When an email repeats, the last occurrence wins.
+        Returns the (inserted, updated, skipped) counts; skipped rows are earlier
+        occurrences of a repeated email and new rows a concurrent insert got in first.
+        """
+        latest = {profile.email: profile for profile in profiles}
+        existing = {}
+        for emails in chunked(list(latest)):
+            existing.update((await self.db.execute(select_ids_by_email(emails))).all())
+
+        new = [p for email, p in latest.items() if email not in existing]
+        stmt = insert_profiles_skipping_conflicts(self.db.get_bind().dialect.name)
+        inserted = {}
+        for chunk in chunked(new):
+            result = await self.db.execute(stmt.values([profile_row(p) for p in chunk]))
+            inserted.update({row.email: row.id for row in result})
+
+        history = await self._add_history([
+            history_row(inserted[p.email], p.status, p.start_date)
+            for p in new if p.email in inserted
+        ])
+
+        updates = [
+            update_row(existing[email], p) for email, p in latest.items() if email in existing
+        ]
+        if updates:
+            await self.db.execute(update_profiles_by_id(), updates)
+        await self.db.commit()
+        await self._queue_history(history)
+
+        skipped = len(profiles) - len(inserted) - len(updates)
+        return len(inserted), len(updates), skipped
+
+    async def get_by_id(self, profile_id: int, include_history: bool = False) -> Optional[Profile]:
+        """Get a profile by ID, optionally with its status history."""
+        result = await self.db.execute(select_profile(profile_id, include_history))
+        rows = profile_results(result, include_history)
+        if not rows:
+            return None
+        return map_to_domain(rows[0], include_history)
+
+    async def get_for_update(self, profile_id: int) -> Optional[Profile]:
+        """
+        Read a profile to modify it, always from the database; on PostgreSQL the row
+        stays locked until the write that follows commits, so no update is lost.
+        """
+        row = (await self.db.execute(select_profile_for_update(profile_id))).first()
+        return map_to_domain(row) if row else None
+
+    async def get_many(self, profile_ids: List[int]) -> Dict[int, Profile]:
+        """Get the existing profiles among ``profile_ids`` by ID, one IN query per chunk."""
+        profiles = {}
+        for chunk in chunked(list(dict.fromkeys(profile_ids))):
+            for row in await self.db.execute(select_profiles_by_ids(chunk)):
+                profiles[row.id] = map_to_domain(row)
+        return profiles
+
+    async def get_all(
+        self,
+        skip: int = 0,
+        limit: int = 10,
+        after: Optional[Tuple] = None,
+        order_by: str = "id",
+        include_history: bool = False,
+        filters: Optional[ProfileFilter] = None,
+    ) -> List[Profile]:
+        """Get the profiles matching ``filters`` with offset or keyset pagination."""
+        stmt = select_profiles(skip, limit, after, order_by, include_history, filters)
+        rows = profile_results(await self.db.execute(stmt), include_history)
+        return [map_to_domain(row, include_history) for row in rows]
+
+    async def get_history(
+        self,
+        profile_id: int,
+        limit: int = 10,
+        after: Optional[Tuple] = None,
+        filters: Optional[HistoryFilter] = None,
+    ) -> Optional[List[ProfileHistory]]:
+        """
+        Get a keyset page of a profile's status history, oldest first; None when the
+        profile does not exist. Existence is only checked when the page comes back empty.
+        """
+        result = await self.db.execute(select_history(profile_id, limit, after, filters))
+        entries = [history_from_row(row) for row in result]
+        if entries:
+            return entries
+        exists = (await self.db.execute(select_profile_exists(profile_id))).first()
+        return entries if exists else None
+
+    async def search(
+        self, query: str, limit: int = 10, after: Optional[Tuple] = None
+    ) -> List[Tuple[Profile, float]]:
+        """Full-text search; (profile, rank) pairs, best match first."""
+        stmt = search_profiles(self.db.get_bind().dialect.name, query, limit, after)
+        if stmt is None:
+            return []
+        rows = (await self.db.execute(stmt)).all()
+        return [(map_to_domain(row), row.rank) for row in rows]
+
+    async def stream_rows(self) -> AsyncIterator[Row]:
+        """Yield every profile as a plain row, fetched in server-side batches."""
+        result = await self.db.stream(select_profile_rows())
+        try:
+            async for partition in result.partitions():
+                for row in partition:
+                    yield row
+        finally:
+            await result.close()
+
+    async def update(self, profile: Profile) -> Optional[Profile]:
+        """Update a profile and store its new history entries, in one transaction."""
+        row = (await self.db.execute(update_profile_by_id(profile))).first()
+        if not row:
+            await self.db.rollback()
+            return None
+
+        # Only a status change adds an entry (apply_profile_changes); others write no history
+        pending = await self._add_history(pending_history_rows(row.id, profile))
+        await self.db.commit()
+        await self._queue_history(pending)
+
+        return map_to_domain(row)
+
+    async def patch(self, profile_id: int, changes: Dict) -> Optional[Profile]:
+        """
+        Update only the given columns in one transaction, without reading the profile first.
+        A history entry is appended only when the status actually changes. Raises
+        DuplicateEmailError when the new email belongs to another profile.
+        """
+        if not changes:
+            return await self.get_by_id(profile_id)
+
+        row, history = None, []
+        status = changes.get("status")
+        try:
+            if status is not None:
+                # Matches only if the status differs, so a row back means a real transition
+                stmt = patch_profile_by_id(profile_id, changes, status_differs=True)
+                row = (await self.db.execute(stmt)).first()
+                if row:
+                    history = await self._add_history(
+                        [history_row(row.id, status, datetime.utcnow())]
+                    )
+            if row is None:
+                row = (await self.db.execute(patch_profile_by_id(profile_id, changes))).first()
+        except IntegrityError as exc:
+            # email is the only unique column a PATCH can change
+            await self.db.rollback()
+            raise DuplicateEmailError(f"Email {changes.get('email')!r} is already in use") from exc
+        if row is None:
+            await self.db.rollback()
+            return None
+        await self.db.commit()
+        await self._queue_history(history)
+
+        return map_to_domain(row)
+
+    async def delete(self, profile_id: int) -> Optional[Profile]:
+        """Delete a profile and its history, returning the profile as it was stored."""
+        if self.history_recorder is not None:
+            # Queued rows of this profile must land before its history is deleted
+            await asyncio.to_thread(self.history_recorder.flush)
+        await self.db.execute(delete_history_of(profile_id))
+        row = (await self.db.execute(delete_profile_by_id(profile_id))).first()
+        if not row:
+            await self.db.rollback()
+            return None
+        await self.db.commit()
+
+        return map_to_domain(row)
@@ -0,0 +1,187 @@
+import logging
+import threading
+import time
+from typing import Dict, List, Optional
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError
+from app.db.profile_queries import insert_history_rows
+
+logger = logging.getLogger(__name__)
+
+
+class HistoryRecorder:
+    """
+    Write-behind buffer for profile_history rows.
+    Repositories hand it the rows of a write once that write has committed; a
+    background thread inserts them in batches when ``flush_size`` rows are queued or
+    ``flush_interval`` seconds have passed, whichever comes first. The queue holds at
+    most ``max_queued`` rows: when it is full (or the recorder is not running),
+    record() returns False and the caller writes its rows itself, so a slow database
+    pushes back on requests instead of growing the queue. stop() writes whatever is
+    left; rows still queued when the process is killed are lost.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        flush_size: int = 500,
+        flush_interval: float = 1.0,
+        max_queued: int = 10000,
+    ):
+        self.engine = engine
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.max_queued = max_queued
+        self._rows: List[Dict] = []
+        self._writing = 0
+        self._flush_requested = False
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)
+        self._idle = threading.Condition(self._lock)
+        self.written = 0
+        self.flushes = 0
+        self.failed_flushes = 0
+        self.rejected = 0
+        self.dropped = 0
+
+    def start(self) -> None:
+        """Start the background flusher."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._stopping = False
+            self._thread = threading.Thread(
+                target=self._run, name="history-recorder", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self, timeout: float = 30.0) -> None:
+        """Stop the flusher and write every queued row (on shutdown)."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+            self._stopping = True
+            self._wake.notify()
+        if thread is not None:
+            thread.join(timeout)
+        with self._lock:
+            leftover, self._rows = self._rows, []
+        if leftover:
+            self._write(leftover)
+        if self._rows:
+            logger.error("Lost %d history rows that could not be written on shutdown",
+                         len(self._rows))
+
+    def record(self, rows: List[Dict]) -> bool:
+        """Queue the history rows of a committed write; False when the caller must write them."""
+        with self._lock:
+            if self._thread is None or len(self._rows) + len(rows) > self.max_queued:
+                self.rejected += len(rows)
+                return False
+            self._rows.extend(rows)
+            if len(self._rows) >= self.flush_size:
+                self._wake.notify()
+        return True
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """Wait until every row queued so far is written; False on timeout."""
+        deadline = time.monotonic() + timeout
+        with self._lock:
+            if self._thread is None:
+                return not self._rows
+            self._flush_requested = True
+            self._wake.notify()
+            while self._rows or self._writing:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._idle.wait(remaining)
+        return True
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "queued": len(self._rows) + self._writing,
+                "max_queued": self.max_queued,
+                "written": self.written,
+                "flushes": self.flushes,
+                "failed_flushes": self.failed_flushes,
+                "rejected": self.rejected,
+                "dropped": self.dropped,
+            }
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                deadline = time.monotonic() + self.flush_interval
+                while (not self._stopping and not self._flush_requested
+                       and len(self._rows) < self.flush_size):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._wake.wait(remaining)
+                if self._stopping:
+                    # stop() writes what is left once the thread is gone
+                    self._idle.notify_all()
+                    return
+                batch, self._rows = self._rows, []
+                self._writing = len(batch)
+                self._flush_requested = False
+            written = self._write(batch) if batch else True
+            with self._lock:
+                self._writing = 0
+                self._idle.notify_all()
+            if not written:
+                # The batch is back in the queue; give the database a moment (stop() cuts it short)
+                retry_at = time.monotonic() + self.flush_interval
+                with self._lock:
+                    while not self._stopping and time.monotonic() < retry_at:
+                        self._wake.wait(retry_at - time.monotonic())
+
+    def _write(self, batch: List[Dict]) -> bool:
+        """
+        Insert a batch with one multi-row INSERT in one transaction; False (with the
+        batch queued again) when the database could not be reached. Rows that violate a
+        constraint, e.g. of a profile deleted meanwhile, are dropped one by one so they
+        cannot block the rest.
+        """
+        try:
+            self._insert(batch)
+        except IntegrityError:
+            return self._write_one_by_one(batch)
+        except Exception:
+            return self._requeue(batch)
+        with self._lock:
+            self.written += len(batch)
+            self.flushes += 1
+        return True
+
+    def _write_one_by_one(self, batch: List[Dict]) -> bool:
+        for index, row in enumerate(batch):
+            try:
+                self._insert([row])
+            except IntegrityError as exc:
+                logger.warning("Dropping history row of profile %s: %s", row["profile_id"],
+                               exc.orig)
+                with self._lock:
+                    self.dropped += 1
+            except Exception:
+                return self._requeue(batch[index:])
+            else:
+                with self._lock:
+                    self.written += 1
+        with self._lock:
+            self.flushes += 1
+        return True
+
+    def _insert(self, rows: List[Dict]) -> None:
+        with self.engine.begin() as conn:
+            conn.execute(insert_history_rows(), rows)
+
+    def _requeue(self, rows: List[Dict]) -> bool:
+        logger.exception("Could not write %d history rows; they stay queued", len(rows))
+        with self._lock:
+            self._rows[:0] = rows
+            self.failed_flushes += 1
+        return False
@@ -0,0 +1,263 @@
+import csv
+import enum
+import gzip
+import logging
+import os
+import re
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import delete, func, select
+from sqlalchemy.engine import Connection, Engine
+from app.db.profile_models import ProfileHistory as ProfileHistoryModel
+from app.entities import HISTORY_FIELDS
+
+logger = logging.getLogger(__name__)
+
+# 🔹 Particiones mensuales de profile_history en PostgreSQL (migración 0006)
+PARTITION_PREFIX = "profile_history_p"
+PARTITION_NAME = re.compile(rf"^{PARTITION_PREFIX}(\d{{4}})(\d{{2}})$")
+DEFAULT_PARTITION = "profile_history_default"
+
+# Profiles whose history is compacted per transaction
+COMPACT_BATCH_PROFILES = 10000
+
+# Rows fetched per round trip while archiving
+ARCHIVE_BATCH_SIZE = 5000
+
+
+def month_start(moment: datetime) -> datetime:
+    return datetime(moment.year, moment.month, 1)
+
+
+def add_months(month: datetime, months: int) -> datetime:
+    index = month.year * 12 + month.month - 1 + months
+    return datetime(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: datetime) -> str:
+    return f"{PARTITION_PREFIX}{month:%Y%m}"
+
+
+def is_partitioned(conn: Connection) -> bool:
+    """Whether profile_history is a partitioned table (PostgreSQL after migration 0006)."""
+    if conn.dialect.name != "postgresql":
+        return False
+    return conn.exec_driver_sql(
+        "SELECT 1 FROM pg_partitioned_table WHERE partrelid = 'profile_history'::regclass"
+    ).first() is not None
+
+
+def history_partitions(conn: Connection) -> List[Tuple[str, datetime]]:
+    """(name, first day of the month) of every monthly partition, oldest first."""
+    names = conn.exec_driver_sql(
+        "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+        "WHERE i.inhparent = 'profile_history'::regclass"
+    ).scalars()
+    months = []
+    for name in names:
+        match = PARTITION_NAME.match(name)
+        if match:
+            months.append((name, datetime(int(match[1]), int(match[2]), 1)))
+    return sorted(months, key=lambda item: item[1])
+
+
+def ensure_partitions(conn: Connection, now: datetime, months_ahead: int) -> List[str]:
+    """
+    Create the monthly partitions from the current month to ``months_ahead`` months on.
+    A month whose rows already landed in the default partition is skipped (and logged):
+    PostgreSQL refuses to create a partition that would take rows out of it.
+    """
+    existing = {name for name, _ in history_partitions(conn)}
+    created = []
+    month = month_start(now)
+    for _ in range(months_ahead + 1):
+        name, following = partition_name(month), add_months(month, 1)
+        if name not in existing:
+            stray = conn.exec_driver_sql(
+                f"SELECT 1 FROM {DEFAULT_PARTITION} "
+                "WHERE changed_at >= %(start)s AND changed_at < %(end)s LIMIT 1",
+                {"start": month, "end": following},
+            ).first()
+            if stray:
+                logger.warning("Skipping %s: the default partition holds rows of that month", name)
+            else:
+                conn.exec_driver_sql(
+                    f"CREATE TABLE {name} PARTITION OF profile_history "
+                    f"FOR VALUES FROM ('{month:%Y-%m-%d}') TO ('{following:%Y-%m-%d}')"
+                )
+                created.append(name)
+        month = following
+    return created
+
+
+def history_table_bytes(conn: Connection) -> Optional[int]:
+    """
+    Space used by profile_history and its indexes (every partition on PostgreSQL),
+    or None when the database cannot tell.
+    """
+    if conn.dialect.name == "postgresql":
+        return conn.exec_driver_sql(
+            "SELECT coalesce(sum(pg_total_relation_size(relid)), 0) "
+            "FROM pg_partition_tree('profile_history')"
+        ).scalar()
+    if conn.dialect.name == "sqlite":
+        names = [index.name for index in ProfileHistoryModel.__table__.indexes]
+        placeholders = ", ".join("?" for _ in names)
+        try:
+            return conn.exec_driver_sql(
+                "SELECT coalesce(sum(pgsize), 0) FROM dbstat "
+                f"WHERE name = 'profile_history' OR name IN ({placeholders})",
+                tuple(names),
+            ).scalar()
+        except Exception:
+            # SQLite built without SQLITE_ENABLE_DBSTAT_VTAB
+            return None
+    return None
+
+
+def _archive_value(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, enum.Enum):
+        return value.value
+    return value
+
+
+def archive_history(
+    engine: Engine, cutoff: datetime, archive_dir: str, now: Optional[datetime] = None
+) -> Dict:
+    """
+    Move the history entries older than ``cutoff`` to a gzip-compressed CSV file in
+    ``archive_dir``, then remove them: whole monthly partitions are dropped, the rest
+    deleted. Reading, writing the file and deleting happen in one transaction (repeatable
+    read on PostgreSQL), so the DELETE only reaches rows that made it into the archive;
+    partitions wholly before ``cutoff`` get no new rows, as entries are written with the
+    current time. If the removal fails the file is deleted again.
+    """
+    now = now or datetime.utcnow()
+    table = ProfileHistoryModel.__table__
+    os.makedirs(archive_dir, exist_ok=True)
+    path = os.path.join(
+        archive_dir, f"profile_history_until_{cutoff:%Y%m%dT%H%M%S}_{now:%Y%m%dT%H%M%S}.csv.gz"
+    )
+    summary = {"archived": 0, "archive_file": None, "archive_bytes": 0, "dropped_partitions": []}
+
+    connection = engine.connect()
+    if connection.dialect.name == "postgresql":
+        connection = connection.execution_options(isolation_level="REPEATABLE READ")
+    try:
+        with connection as conn, conn.begin():
+            rows = conn.execute(
+                select(*[table.c[name] for name in HISTORY_FIELDS])
+                .where(table.c.changed_at < cutoff)
+                .order_by(table.c.changed_at, table.c.id)
+                .execution_options(yield_per=ARCHIVE_BATCH_SIZE)
+            )
+            partial = f"{path}.partial"
+            with gzip.open(partial, "wt", newline="", encoding="utf-8") as archive:
+                writer = csv.writer(archive)
+                writer.writerow(HISTORY_FIELDS)
+                for partition in rows.partitions():
+                    writer.writerows([[_archive_value(v) for v in row] for row in partition])
+                    summary["archived"] += len(partition)
+            if not summary["archived"]:
+                os.remove(partial)
+                return summary
+            os.replace(partial, path)
+
+            if is_partitioned(conn):
+                for name, month in history_partitions(conn):
+                    if add_months(month, 1) <= cutoff:
+                        conn.exec_driver_sql(f"ALTER TABLE profile_history DETACH PARTITION {name}")
+                        conn.exec_driver_sql(f"DROP TABLE {name}")
+                        summary["dropped_partitions"].append(name)
+            conn.execute(delete(table).where(table.c.changed_at < cutoff))
+    except Exception:
+        # Nothing was removed: drop the archive so a rerun does not archive the rows twice
+        for leftover in (path, f"{path}.partial"):
+            if os.path.exists(leftover):
+                os.remove(leftover)
+        raise
+
+    summary["archive_file"] = path
+    summary["archive_bytes"] = os.path.getsize(path)
+    return summary
+
+
+def compact_history(engine: Engine, batch_profiles: int = COMPACT_BATCH_PROFILES) -> int:
+    """
+    Collapse runs of consecutive entries with the same status into their first entry,
+    one transaction per ``batch_profiles`` profiles. Returns the entries removed.
+    """
+    table = ProfileHistoryModel.__table__
+    with engine.connect() as conn:
+        lowest, highest = conn.execute(
+            select(func.min(table.c.profile_id), func.max(table.c.profile_id))
+        ).one()
+    if lowest is None:
+        return 0
+
+    removed = 0
+    for first in range(lowest, highest + 1, batch_profiles):
+        previous = func.lag(table.c.status).over(
+            partition_by=table.c.profile_id, order_by=(table.c.changed_at, table.c.id)
+        )
+        ordered = (
+            select(table.c.id, table.c.status, previous.label("previous"))
+            .where(table.c.profile_id.between(first, first + batch_profiles - 1))
+            .subquery("ordered")
+        )
+        repeated = select(ordered.c.id).where(ordered.c.status == ordered.c.previous)
+        with engine.begin() as conn:
+            removed += conn.execute(delete(table).where(table.c.id.in_(repeated))).rowcount
+    return removed
+
+
+def _vacuum(engine: Engine) -> None:
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.exec_driver_sql(
+            "VACUUM" if conn.dialect.name == "sqlite" else "VACUUM (ANALYZE) profile_history"
+        )
+
+
+def run_retention(
+    engine: Engine,
+    retention_days: int,
+    archive_dir: str,
+    months_ahead: int = 3,
+    compact: bool = True,
+    vacuum: bool = False,
+    now: Optional[datetime] = None,
+) -> Dict:
+    """
+    The history maintenance job: create upcoming partitions, archive and remove entries
+    older than ``retention_days`` (0 keeps everything), compact repeated statuses and,
+    with ``vacuum``, return the freed space to the database. Returns a summary with
+    the space used by profile_history before and after.
+    """
+    now = now or datetime.utcnow()
+    with engine.connect() as conn:
+        bytes_before = history_table_bytes(conn)
+
+    summary = {"created_partitions": [], "archived": 0, "archive_file": None,
+               "archive_bytes": 0, "dropped_partitions": [], "compacted": 0}
+    with engine.begin() as conn:
+        if is_partitioned(conn):
+            summary["created_partitions"] = ensure_partitions(conn, now, months_ahead)
+    if retention_days > 0:
+        cutoff = now - timedelta(days=retention_days)
+        summary.update(archive_history(engine, cutoff, archive_dir, now))
+    if compact:
+        summary["compacted"] = compact_history(engine)
+    if vacuum:
+        _vacuum(engine)
+
+    with engine.connect() as conn:
+        bytes_after = history_table_bytes(conn)
+    summary["bytes_before"] = bytes_before
+    summary["bytes_after"] = bytes_after
+    if bytes_before is not None and bytes_after is not None:
+        summary["reclaimed_bytes"] = bytes_before - bytes_after
+    else:
+        summary["reclaimed_bytes"] = None
+    return summary
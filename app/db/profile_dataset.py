@@ -0,0 +1,256 @@
+import csv
+import enum
+import io
+import random
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from sqlalchemy import Table, func, select
+from sqlalchemy.engine import Connection, Engine
+from app.db.profile_models import Profile as ProfileModel, ProfileHistory as ProfileHistoryModel
+from app.db.profile_models import SQLITE_SEARCH_DDL
+from app.entities import ProfileStatus
+
+# 🔹 Vocabulario de los perfiles sintéticos (también lo usan los benchmarks para buscar/filtrar)
+SPECIALTIES = [
+    "Backend", "Frontend", "Data Engineering", "DevOps",
+    "Machine Learning", "Mobile", "QA Automation", "Security",
+]
+FIRST_NAMES = [
+    "Ana", "Bruno", "Carla", "Diego", "Elena", "Felipe", "Gabriela", "Hugo",
+    "Isabel", "Javier", "Karen", "Luis", "Marta", "Nicolas", "Olga", "Pablo",
+]
+LAST_NAMES = [
+    "Garcia", "Martinez", "Lopez", "Gonzalez", "Rodriguez", "Fernandez", "Perez",
+    "Sanchez", "Ramirez", "Torres", "Flores", "Rivera", "Gomez", "Diaz", "Cruz",
+]
+
+# Share of each status among generated profiles
+STATUS_WEIGHTS = {
+    ProfileStatus.ACTIVE: 70,
+    ProfileStatus.INACTIVE: 15,
+    ProfileStatus.SUSPENDED: 10,
+    ProfileStatus.DELETED: 5,
+}
+
+# 🔹 Entradas de historial por perfil, "cantidad:peso" (cola larga por defecto)
+DEFAULT_HISTORY_DISTRIBUTION = "0:20,1:35,2:25,5:15,20:5"
+
+DEFAULT_CHUNK_SIZE = 10000
+
+# Generated start dates fall within this many days after EPOCH
+EPOCH = datetime(2018, 1, 1)
+SPAN_DAYS = 6 * 365
+
+PROFILE_COLUMNS = (
+    "id", "name", "email", "specialty", "linkedin", "status", "start_date", "end_date",
+)
+HISTORY_COLUMNS = ("profile_id", "status", "changed_at")
+
+
+class HistoryDistribution:
+    """Weighted choice of how many history entries a generated profile gets."""
+
+    def __init__(self, counts: Sequence[int], weights: Sequence[float]):
+        if not counts or len(counts) != len(weights) or min(counts) < 0 or min(weights) < 0:
+            raise ValueError("History distribution needs non-negative counts and weights")
+        self.counts = list(counts)
+        self.weights = list(weights)
+
+    @classmethod
+    def parse(cls, spec: str) -> "HistoryDistribution":
+        """Parse "3" (always three) or "count:weight,..." such as "0:20,1:50,5:30"."""
+        try:
+            if ":" not in spec:
+                return cls([int(spec)], [1])
+            pairs = [item.split(":") for item in spec.split(",") if item.strip()]
+            return cls([int(c) for c, _ in pairs], [float(w) for _, w in pairs])
+        except ValueError as exc:
+            raise ValueError(f"Invalid history distribution {spec!r}") from exc
+
+    def sample(self, rng: random.Random) -> int:
+        return rng.choices(self.counts, weights=self.weights)[0]
+
+    def mean(self) -> float:
+        return sum(c * w for c, w in zip(self.counts, self.weights)) / sum(self.weights)
+
+
+def generate_chunk(
+    seed: int, chunk_index: int, first_id: int, chunk_size: int, last_id: int,
+    history: HistoryDistribution,
+) -> Tuple[List[Dict], List[Dict]]:
+    """
+    Rows of the profiles (and their history) in one chunk. The chunk's random stream
+    depends only on the seed and the chunk index, so chunks can be regenerated alone.
+    """
+    rng = random.Random(f"{seed}:{chunk_index}")
+    statuses = list(STATUS_WEIGHTS)
+    status_weights = list(STATUS_WEIGHTS.values())
+    start = first_id + chunk_index * chunk_size
+    profiles, entries = [], []
+    for profile_id in range(start, min(start + chunk_size, last_id + 1)):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        status = rng.choices(statuses, weights=status_weights)[0]
+        start_date = EPOCH + timedelta(seconds=rng.randrange(SPAN_DAYS * 86400))
+        end_date = None
+        if status in (ProfileStatus.INACTIVE, ProfileStatus.DELETED):
+            end_date = start_date + timedelta(days=rng.randrange(1, 720))
+        handle = f"{first}.{last}.{profile_id}".lower()
+        profiles.append({
+            "id": profile_id,
+            "name": f"{first} {last}",
+            "email": f"{handle}@example.com",
+            "specialty": rng.choice(SPECIALTIES),
+            "linkedin": f"https://linkedin.com/in/{handle.replace('.', '-')}",
+            "status": status,
+            "start_date": start_date,
+            "end_date": end_date,
+        })
+
+        # Status changes after the start date, the last one being the current status
+        changed_at = start_date
+        count = history.sample(rng)
+        for n in range(count):
+            changed_at += timedelta(hours=rng.randrange(1, 24 * 90))
+            entries.append({
+                "profile_id": profile_id,
+                "status": status if n == count - 1 else rng.choice(statuses),
+                "changed_at": changed_at,
+            })
+    return profiles, entries
+
+
+def _copy_value(value):
+    if isinstance(value, enum.Enum):
+        # The Enum column stores member names
+        return value.name
+    if isinstance(value, datetime):
+        return value.isoformat(sep=" ")
+    return value
+
+
+def _copy_rows(conn: Connection, table: Table, columns: Sequence[str], rows: List[Dict]):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        # None is written as an empty unquoted field, which COPY reads as NULL
+        writer.writerow([_copy_value(row[column]) for column in columns])
+    buffer.seek(0)
+
+    statement = f"COPY {table.name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)"
+    cursor = conn.connection.cursor()
+    try:
+        if hasattr(cursor, "copy_expert"):
+            cursor.copy_expert(statement, buffer)  # psycopg2
+        else:
+            with cursor.copy(statement) as copy:  # psycopg 3
+                copy.write(buffer.getvalue())
+    finally:
+        cursor.close()
+
+
+def load_rows(conn: Connection, table: Table, columns: Sequence[str], rows: List[Dict]):
+    """Bulk-load rows: COPY on PostgreSQL, one executemany INSERT elsewhere."""
+    if not rows:
+        return
+    if conn.dialect.name == "postgresql":
+        _copy_rows(conn, table, columns, rows)
+    else:
+        conn.execute(table.insert(), rows)
+
+
+# FTS5 trigger that indexes profiles one INSERT at a time
+FTS_INSERT_TRIGGER = "profiles_fts_insert"
+
+
+def _load_profiles_sqlite(conn: Connection, rows: List[Dict]) -> None:
+    """
+    Insert a chunk of profiles and index it in the FTS5 table with a single INSERT ...
+    SELECT, instead of the per-row trigger (over twice as slow). SQLite DDL is
+    transactional and the write lock keeps other writers out, so nobody sees the
+    trigger missing.
+    """
+    # pysqlite only opens the transaction before DML; open it now so the DDL is part of it
+    if not conn.connection.dbapi_connection.in_transaction:
+        conn.exec_driver_sql("BEGIN")
+    has_trigger = conn.exec_driver_sql(
+        "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = ?",
+        (FTS_INSERT_TRIGGER,),
+    ).first()
+    if not has_trigger:
+        load_rows(conn, ProfileModel.__table__, PROFILE_COLUMNS, rows)
+        return
+
+    conn.exec_driver_sql(f"DROP TRIGGER {FTS_INSERT_TRIGGER}")
+    load_rows(conn, ProfileModel.__table__, PROFILE_COLUMNS, rows)
+    conn.exec_driver_sql(
+        "INSERT INTO profiles_fts (rowid, name, specialty, email) "
+        "SELECT id, name, specialty, email FROM profiles WHERE id BETWEEN ? AND ?",
+        (rows[0]["id"], rows[-1]["id"]),
+    )
+    conn.exec_driver_sql(next(ddl for ddl in SQLITE_SEARCH_DDL if FTS_INSERT_TRIGGER in ddl))
+
+
+def loaded_until(conn: Connection, first_id: int, last_id: int) -> int:
+    """Highest generated profile id already in the database, or first_id - 1."""
+    highest = conn.execute(
+        select(func.max(ProfileModel.id)).where(ProfileModel.id.between(first_id, last_id))
+    ).scalar()
+    return highest if highest is not None else first_id - 1
+
+
+def _sync_sequences(conn: Connection) -> None:
+    # Explicit ids leave the serial sequence behind; the next INSERT would collide
+    for table in (ProfileModel.__table__, ProfileHistoryModel.__table__):
+        conn.exec_driver_sql(
+            f"SELECT setval(pg_get_serial_sequence('{table.name}', 'id'), "
+            f"(SELECT coalesce(max(id), 0) + 1 FROM {table.name}), false)"
+        )
+
+
+def generate_dataset(
+    engine: Engine,
+    total: int,
+    seed: int = 0,
+    history: Optional[HistoryDistribution] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    first_id: int = 1,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> Dict:
+    """
+    Populate ``total`` profiles with ids first_id..first_id+total-1, plus their history.
+    Each chunk is committed in its own transaction, and a rerun resumes after the last
+    profile loaded, producing the same rows as an uninterrupted run with the same seed.
+    """
+    history = history or HistoryDistribution.parse(DEFAULT_HISTORY_DISTRIBUTION)
+    last_id = first_id + total - 1
+    with engine.connect() as conn:
+        done = loaded_until(conn, first_id, last_id)
+
+    summary = {"profiles": 0, "history": 0, "resumed_from": done + 1 - first_id}
+    for chunk_index in range((done + 1 - first_id) // chunk_size, -(-total // chunk_size)):
+        profiles, entries = generate_chunk(
+            seed, chunk_index, first_id, chunk_size, last_id, history
+        )
+        # A chunk cut short by an earlier run with another chunk size: skip what exists
+        profiles = [row for row in profiles if row["id"] > done]
+        entries = [row for row in entries if row["profile_id"] > done]
+        if not profiles:
+            # Last chunk of a run that already completed
+            continue
+        with engine.begin() as conn:
+            if conn.dialect.name == "postgresql":
+                conn.exec_driver_sql("SET LOCAL synchronous_commit = off")
+            if conn.dialect.name == "sqlite":
+                _load_profiles_sqlite(conn, profiles)
+            else:
+                load_rows(conn, ProfileModel.__table__, PROFILE_COLUMNS, profiles)
+            load_rows(conn, ProfileHistoryModel.__table__, HISTORY_COLUMNS, entries)
+        summary["profiles"] += len(profiles)
+        summary["history"] += len(entries)
+        if progress is not None:
+            progress(profiles[-1]["id"] - first_id + 1, total)
+
+    if engine.dialect.name == "postgresql":
+        with engine.begin() as conn:
+            _sync_sequences(conn)
+    return summary
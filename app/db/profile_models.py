@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, ForeignKey, Enum, DateTime
+from sqlalchemy import DDL, Column, Integer, String, ForeignKey, Enum, DateTime, Index, event, text
 from sqlalchemy.orm import relationship
 from app.config.database import Base
 from app.entities import ProfileStatus
@@ -21,6 +21,21 @@ class Profile(Base):
     # Relación con el historial de estados
     history = relationship("ProfileHistory", back_populates="profile", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # Índice para la paginación keyset ordenada por fecha de inicio
+        Index("ix_profiles_start_date_id", "start_date", "id"),
+        # Filtros por estado y especialidad (GET /profiles/?status=&specialty=)
+        Index("ix_profiles_status_specialty", "status", "specialty"),
+        # Listados sin perfiles eliminados (?include_deleted=false), parcial para no indexarlos
+        Index(
+            "ix_profiles_live_start_date_id",
+            "start_date",
+            "id",
+            postgresql_where=text("status <> 'DELETED'"),
+            sqlite_where=text("status <> 'DELETED'"),
+        ),
+    )
+
 
 # 🔹 Historial de estados del perfil
 class ProfileHistory(Base):
@@ -33,3 +48,63 @@ class ProfileHistory(Base):
 
     # Relación inversa con Profile
     profile = relationship("Profile", back_populates="history")
+
+    __table_args__ = (
+        # Historial paginado por perfil (GET /profiles/{id}/history), keyset sobre (changed_at, id)
+        Index("ix_profile_history_profile_id_changed_at", "profile_id", "changed_at", "id"),
+    )
+
+
+# 🔹 Búsqueda de texto completo (GET /profiles/search), fuera del ORM porque depende del dialecto.
+# Las migraciones crean estos objetos; los eventos los replican en create_all (tests).
+# La fuente de verdad es migrations/versions/0003_profile_search.py: SEARCH_TEXT y el DDL de
+# abajo son copias suyas y cualquier cambio debe hacerse en ambos sitios.
+# Texto sobre el que se calcula la similitud por trigramas
+SEARCH_TEXT = "(name || ' ' || specialty || ' ' || email)"
+
+POSTGRESQL_SEARCH_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "ALTER TABLE profiles ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS ("
+    "setweight(to_tsvector('simple', coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(specialty, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(email, '')), 'C')) STORED",
+    "CREATE INDEX IF NOT EXISTS ix_profiles_search_vector ON profiles USING gin (search_vector)",
+    "CREATE INDEX IF NOT EXISTS ix_profiles_search_trgm ON profiles "
+    f"USING gin ({SEARCH_TEXT} gin_trgm_ops)",
+]
+
+# SQLite: tabla FTS5 con contenido externo, sincronizada por triggers
+SQLITE_SEARCH_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS profiles_fts USING fts5("
+    "name, specialty, email, content='profiles', content_rowid='id')",
+    "CREATE TRIGGER IF NOT EXISTS profiles_fts_insert AFTER INSERT ON profiles BEGIN "
+    "INSERT INTO profiles_fts (rowid, name, specialty, email) "
+    "VALUES (new.id, new.name, new.specialty, new.email); END",
+    "CREATE TRIGGER IF NOT EXISTS profiles_fts_delete AFTER DELETE ON profiles BEGIN "
+    "INSERT INTO profiles_fts (profiles_fts, rowid, name, specialty, email) "
+    "VALUES ('delete', old.id, old.name, old.specialty, old.email); END",
+    "CREATE TRIGGER IF NOT EXISTS profiles_fts_update AFTER UPDATE ON profiles BEGIN "
+    "INSERT INTO profiles_fts (profiles_fts, rowid, name, specialty, email) "
+    "VALUES ('delete', old.id, old.name, old.specialty, old.email); "
+    "INSERT INTO profiles_fts (rowid, name, specialty, email) "
+    "VALUES (new.id, new.name, new.specialty, new.email); END",
+]
+
+for statement in POSTGRESQL_SEARCH_DDL:
+    event.listen(
+        Profile.__table__, "after_create", DDL(statement).execute_if(dialect="postgresql")
+    )
+for statement in SQLITE_SEARCH_DDL:
+    event.listen(Profile.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+event.listen(
+    Profile.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS profiles_fts").execute_if(dialect="sqlite"),
+)
+
+
+def is_search_object(name: str) -> bool:
+    """Whether a reflected column, index or table belongs to the search machinery above."""
+    return name in (
+        "search_vector", "ix_profiles_search_vector", "ix_profiles_search_trgm"
+    ) or name.startswith("profiles_fts")
@@ -0,0 +1,459 @@
+import re
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import (
+    Delete,
+    Insert,
+    Select,
+    Update,
+    bindparam,
+    Float,
+    and_,
+    cast,
+    delete,
+    func,
+    insert,
+    literal,
+    literal_column,
+    or_,
+    select,
+    table,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import selectinload
+from app.entities import (
+    HISTORY_FIELDS,
+    PROFILE_FIELDS,
+    HistoryFilter,
+    Profile,
+    ProfileFilter,
+    ProfileHistory,
+    ProfileStatus,
+)
+from app.db.profile_models import SEARCH_TEXT
+from app.db.profile_models import Profile as ProfileModel
+from app.db.profile_models import ProfileHistory as ProfileHistoryModel
+from app.db.profile_models import ProfileStatus as ProfileStatusModel
+
+# Statement builders and mappers shared by the sync and async repositories.
+
+# Rows per multi-VALUES INSERT; keeps bulk statements under the drivers' bind-parameter limits
+BULK_CHUNK_SIZE = 1000
+
+# Rows fetched per round trip when streaming the whole table
+STREAM_BATCH_SIZE = 1000
+
+# Leading columns of a row that make up a domain Profile
+PROFILE_WIDTH = len(PROFILE_FIELDS)
+
+
+def select_profile_source(include_history: bool) -> Select:
+    """
+    Start a profiles SELECT. Without history it returns plain profile_columns() rows,
+    which skip ORM instance construction and identity-map bookkeeping (map_to_domain
+    reads both). With history it returns models whose history is batch-loaded with
+    one extra SELECT per query.
+    """
+    if include_history:
+        return select(ProfileModel).options(selectinload(ProfileModel.history))
+    return select(*profile_columns())
+
+
+def profile_results(result, include_history: bool) -> List:
+    """The models or rows of a select_profile_source() result, to feed map_to_domain."""
+    return result.scalars().all() if include_history else result.all()
+
+
+def select_profile(profile_id: int, include_history: bool = False) -> Select:
+    """SELECT a single profile by primary key."""
+    return select_profile_source(include_history).where(ProfileModel.id == profile_id)
+
+
+def select_profile_for_update(profile_id: int) -> Select:
+    """
+    SELECT a profile about to be modified, as a plain row. FOR UPDATE locks it on
+    PostgreSQL until the write commits; SQLite omits the clause.
+    """
+    return select(*profile_columns()).where(ProfileModel.id == profile_id).with_for_update()
+
+
+def select_profiles_by_ids(profile_ids: List[int]) -> Select:
+    """SELECT the profiles whose ID is in ``profile_ids``, as plain rows in no particular order."""
+    return select(*profile_columns()).where(ProfileModel.id.in_(profile_ids))
+
+
+def filter_profiles(stmt: Select, filters: Optional[ProfileFilter]) -> Select:
+    """
+    Add the WHERE clauses of ``filters`` to a profiles SELECT.
+    Status and specialty equality use ix_profiles_status_specialty; excluding deleted
+    profiles repeats the predicate of the partial ix_profiles_live_start_date_id.
+    """
+    if filters is None:
+        return stmt
+    if filters.status is not None:
+        stmt = stmt.where(ProfileModel.status == ProfileStatusModel(filters.status.value))
+    if filters.specialty is not None:
+        stmt = stmt.where(ProfileModel.specialty == filters.specialty)
+    if filters.start_date_from is not None:
+        stmt = stmt.where(ProfileModel.start_date >= filters.start_date_from)
+    if filters.start_date_to is not None:
+        stmt = stmt.where(ProfileModel.start_date < filters.start_date_to)
+    if filters.end_date_from is not None:
+        stmt = stmt.where(ProfileModel.end_date >= filters.end_date_from)
+    if filters.end_date_to is not None:
+        stmt = stmt.where(ProfileModel.end_date < filters.end_date_to)
+    if not filters.include_deleted:
+        stmt = stmt.where(ProfileModel.status != ProfileStatusModel.DELETED)
+    return stmt
+
+
+def select_profiles(
+    skip: int = 0,
+    limit: int = 10,
+    after: Optional[Tuple] = None,
+    order_by: str = "id",
+    include_history: bool = False,
+    filters: Optional[ProfileFilter] = None,
+) -> Select:
+    """
+    SELECT a page of profiles, optionally narrowed by ``filters``.
+    When ``after`` holds the keyset of the previous page's last row, the page is
+    fetched with a seek predicate instead of OFFSET so its cost does not grow with depth.
+    """
+    stmt = select_profile_source(include_history)
+    stmt = filter_profiles(stmt, filters)
+    if order_by == "start_date":
+        if after is not None:
+            stmt = stmt.where(tuple_(ProfileModel.start_date, ProfileModel.id) > tuple_(*after))
+        stmt = stmt.order_by(ProfileModel.start_date, ProfileModel.id)
+    else:
+        if after is not None:
+            stmt = stmt.where(ProfileModel.id > after[0])
+        stmt = stmt.order_by(ProfileModel.id)
+
+    if after is None:
+        stmt = stmt.offset(skip)
+    return stmt.limit(limit)
+
+
+def select_profile_rows(batch_size: int = STREAM_BATCH_SIZE) -> Select:
+    """
+    SELECT every profile as plain rows, streamed in ``batch_size`` partitions.
+    No ORM objects or identity map are involved, and drivers that support it
+    (psycopg2, asyncpg) use a server-side cursor, so memory stays flat.
+    """
+    return (
+        select(*profile_columns())
+        .order_by(ProfileModel.__table__.c.id)
+        .execution_options(yield_per=batch_size)
+    )
+
+
+def select_history(
+    profile_id: int,
+    limit: int = 10,
+    after: Optional[Tuple] = None,
+    filters: Optional[HistoryFilter] = None,
+) -> Select:
+    """
+    SELECT a page of one profile's status history as plain rows, oldest first.
+    ``after`` is the (changed_at, id) keyset of the previous page's last entry; the
+    page is read in order from ix_profile_history_profile_id_changed_at.
+    """
+    table = ProfileHistoryModel.__table__
+    stmt = select(*[table.c[name] for name in HISTORY_FIELDS]).where(
+        table.c.profile_id == profile_id
+    )
+    if filters is not None:
+        if filters.status is not None:
+            stmt = stmt.where(table.c.status == ProfileStatusModel(filters.status.value))
+        if filters.changed_from is not None:
+            stmt = stmt.where(table.c.changed_at >= filters.changed_from)
+        if filters.changed_to is not None:
+            stmt = stmt.where(table.c.changed_at < filters.changed_to)
+    if after is not None:
+        stmt = stmt.where(tuple_(table.c.changed_at, table.c.id) > tuple_(*after))
+    return stmt.order_by(table.c.changed_at, table.c.id).limit(limit)
+
+
+def select_profile_exists(profile_id: int) -> Select:
+    """SELECT 1 when the profile exists, no row otherwise."""
+    table = ProfileModel.__table__
+    return select(literal(1)).where(table.c.id == profile_id)
+
+
+def search_terms(query: str) -> List[str]:
+    """Split a free-text query into lowercase word tokens; punctuation never reaches SQL."""
+    return re.findall(r"\w+", query.lower())
+
+
+def _postgresql_search_rank(terms: List[str]):
+    """(match condition, rank) over the tsvector column and the trigram index."""
+    # Every term as a prefix, so partial words match while the user types
+    tsquery = func.to_tsquery("simple", " & ".join(f"{term}:*" for term in terms))
+    vector = literal_column("profiles.search_vector")
+    text = literal_column(SEARCH_TEXT)
+    phrase = literal(" ".join(terms))
+    condition = or_(vector.op("@@")(tsquery), phrase.op("<%")(text))
+    rank = func.ts_rank_cd(vector, tsquery) + func.word_similarity(phrase, text)
+    return condition, rank
+
+
+def _sqlite_search_rank(terms: List[str]):
+    """(match condition, rank) over the FTS5 table; bm25 is negated so higher ranks first."""
+    fts = literal_column("profiles_fts")
+    match = " ".join(f'"{term}"*' for term in terms)
+    # Column weights: name, specialty, email
+    rank = -func.bm25(fts, 10.0, 5.0, 1.0)
+    return fts.op("MATCH")(match), rank
+
+
+def _portable_search_rank(terms: List[str]):
+    """
+    (match condition, rank) for databases without a search index: every term must
+    appear in name, specialty or email. It scans the table and does not rank, so
+    results come in id order.
+    """
+    profiles = ProfileModel.__table__
+    text = func.lower(profiles.c.name + " " + profiles.c.specialty + " " + profiles.c.email)
+    condition = and_(*[text.contains(term, autoescape=True) for term in terms])
+    return condition, literal(0.0)
+
+
+def search_profiles(
+    dialect_name: str, query: str, limit: int = 10, after: Optional[Tuple] = None
+) -> Optional[Select]:
+    """
+    SELECT the profiles matching ``query`` with their relevance as ``rank``, best first.
+    ``after`` is the (rank, id) keyset of the previous page's last row. Returns None
+    when the query has no searchable words. Databases other than PostgreSQL and SQLite
+    get an unranked substring match instead of a 500.
+    """
+    terms = search_terms(query)
+    if not terms:
+        return None
+
+    profiles = ProfileModel.__table__
+    if dialect_name == "postgresql":
+        condition, rank = _postgresql_search_rank(terms)
+        ranked = select(*profile_columns(), cast(rank, Float).label("rank")).where(condition)
+    elif dialect_name == "sqlite":
+        condition, rank = _sqlite_search_rank(terms)
+        fts = table("profiles_fts", literal_column("rowid"))
+        ranked = (
+            select(*profile_columns(), cast(rank, Float).label("rank"))
+            .select_from(fts)
+            .join(profiles, fts.c.rowid == profiles.c.id)
+            .where(condition)
+        )
+    else:
+        condition, rank = _portable_search_rank(terms)
+        ranked = select(*profile_columns(), cast(rank, Float).label("rank")).where(condition)
+
+    ranked = ranked.subquery("ranked")
+    stmt = select(ranked)
+    if after is not None:
+        after_rank, after_id = after
+        stmt = stmt.where(
+            or_(
+                ranked.c.rank < after_rank,
+                and_(ranked.c.rank == after_rank, ranked.c.id > after_id),
+            )
+        )
+    return stmt.order_by(ranked.c.rank.desc(), ranked.c.id).limit(limit)
+
+
+def profile_columns() -> List:
+    """The profiles columns that make up a domain Profile, in PROFILE_FIELDS order."""
+    table = ProfileModel.__table__
+    return [table.c[name] for name in PROFILE_FIELDS]
+
+
+def insert_profile(entity: Profile) -> Insert:
+    """INSERT a single profile, returning the stored row."""
+    table = ProfileModel.__table__
+    return insert(table).values(profile_row(entity)).returning(*profile_columns())
+
+
+def update_profile_by_id(entity: Profile) -> Update:
+    """UPDATE every mutable column of a profile, returning the stored row (none if missing)."""
+    table = ProfileModel.__table__
+    return (
+        update(table)
+        .where(table.c.id == entity.id)
+        .values(profile_row(entity))
+        .returning(*profile_columns())
+    )
+
+
+def patch_profile_by_id(profile_id: int, changes: Dict, status_differs: bool = False) -> Update:
+    """
+    UPDATE only the columns in ``changes``, returning the stored row (none if missing).
+    With ``status_differs`` the row only matches if its status is not already the new one,
+    so a returned row means the status actually changed.
+    """
+    table = ProfileModel.__table__
+    values = dict(changes)
+    if "status" in values:
+        values["status"] = ProfileStatusModel(values["status"].value)
+    stmt = update(table).where(table.c.id == profile_id)
+    if status_differs:
+        stmt = stmt.where(table.c.status != values["status"])
+    return stmt.values(values).returning(*profile_columns())
+
+
+def delete_profile_by_id(profile_id: int) -> Delete:
+    """DELETE a profile, returning the removed row (none if missing)."""
+    table = ProfileModel.__table__
+    return delete(table).where(table.c.id == profile_id).returning(*profile_columns())
+
+
+def delete_history_of(profile_id: int) -> Delete:
+    """DELETE the status history of a profile; it must go before the profile row."""
+    table = ProfileHistoryModel.__table__
+    return delete(table).where(table.c.profile_id == profile_id)
+
+
+def profile_from_row(row) -> Profile:
+    """
+    Build a domain Profile from a row of profile_columns(); trailing columns such as the
+    search rank are ignored. The Enum column already yields ProfileStatus members.
+    """
+    return Profile(*row[:PROFILE_WIDTH])
+
+
+def map_to_domain(model, include_history: bool = False) -> Profile:
+    """
+    Map a row of profile_columns(), or with ``include_history`` a database model
+    loaded with its history, to a domain entity.
+    """
+    if not include_history:
+        return profile_from_row(model)
+
+    profile = Profile(
+        model.id, model.name, model.email, model.specialty, model.linkedin,
+        model.status, model.start_date, model.end_date,
+    )
+    profile.history = [
+        ProfileHistory(history.id, history.profile_id, history.status, history.changed_at)
+        for history in model.history
+    ]
+    return profile
+
+
+def history_from_row(row) -> ProfileHistory:
+    """Build a domain ProfileHistory from a row of select_history()."""
+    return ProfileHistory(*row)
+
+
+def profile_row(entity: Profile) -> Dict:
+    """Column values of a new profile, for set-based INSERTs."""
+    return {
+        "name": entity.name,
+        "email": entity.email,
+        "specialty": entity.specialty,
+        "linkedin": entity.linkedin,
+        "status": ProfileStatusModel(entity.status.value),
+        "start_date": entity.start_date,
+        "end_date": entity.end_date,
+    }
+
+
+def history_row(profile_id: int, status: ProfileStatus, changed_at: datetime) -> Dict:
+    """Column values of a profile_history entry, for set-based INSERTs."""
+    return {
+        "profile_id": profile_id,
+        "status": ProfileStatusModel(status.value),
+        "changed_at": changed_at,
+    }
+
+
+def pending_history_rows(profile_id: int, entity: Profile) -> List[Dict]:
+    """Column values of the history entries added to ``entity`` but not stored yet."""
+    return [
+        history_row(profile_id, entry.status, entry.changed_at)
+        for entry in entity.history
+        if entry.id is None
+    ]
+
+
+def insert_profiles_skipping_conflicts(dialect_name: str) -> Insert:
+    """
+    Multi-row INSERT into profiles that skips rows whose email already exists.
+    The inserted rows come back through RETURNING; missing emails are the conflicts.
+    """
+    table = ProfileModel.__table__
+    if dialect_name == "postgresql":
+        stmt = postgresql_insert(table).on_conflict_do_nothing(index_elements=[table.c.email])
+    elif dialect_name == "sqlite":
+        stmt = sqlite_insert(table).on_conflict_do_nothing(index_elements=[table.c.email])
+    else:
+        stmt = insert(table)
+    return stmt.returning(table.c.id, table.c.email)
+
+
+def select_ids_by_email(emails: List[str]) -> Select:
+    """SELECT (email, id) of the profiles whose email is in ``emails``."""
+    table = ProfileModel.__table__
+    return select(table.c.email, table.c.id).where(table.c.email.in_(emails))
+
+
+def update_profiles_by_id() -> Update:
+    """Executemany UPDATE of the importable columns, keyed by profile ID."""
+    table = ProfileModel.__table__
+    return (
+        update(table)
+        .where(table.c.id == bindparam("b_id"))
+        .values(
+            name=bindparam("b_name"),
+            specialty=bindparam("b_specialty"),
+            linkedin=bindparam("b_linkedin"),
+        )
+    )
+
+
+def update_row(profile_id: int, entity: Profile) -> Dict:
+    """Parameters for update_profiles_by_id."""
+    return {
+        "b_id": profile_id,
+        "b_name": entity.name,
+        "b_specialty": entity.specialty,
+        "b_linkedin": entity.linkedin,
+    }
+
+
+def insert_history_rows() -> Insert:
+    """Executemany INSERT into profile_history."""
+    return insert(ProfileHistoryModel.__table__)
+
+
+def first_by_email(profiles: List[Profile]) -> Dict[str, int]:
+    """Index of the first occurrence of each email; later repeats are conflicts."""
+    first: Dict[str, int] = {}
+    for index, profile in enumerate(profiles):
+        first.setdefault(profile.email, index)
+    return first
+
+
+def align_created(
+    profiles: List[Profile], first: Dict[str, int], created: Dict[str, int]
+) -> List[Optional[Profile]]:
+    """Pair every input profile with its new ID, or None when it was a conflict."""
+    results = []
+    for index, profile in enumerate(profiles):
+        if first[profile.email] == index and profile.email in created:
+            profile.id = created[profile.email]
+            profile.history = []
+            results.append(profile)
+        else:
+            results.append(None)
+    return results
+
+
+def chunked(items: List, size: int = BULK_CHUNK_SIZE):
+    """Split a list into consecutive chunks of at most ``size`` items."""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
@@ -1,149 +1,274 @@
-from typing import List, Optional
 from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+from sqlalchemy import Row
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from app.entities import Profile, ProfileHistory, ProfileStatus
-from app.db.profile_models import Profile as ProfileModel
-from app.db.profile_models import ProfileHistory as ProfileHistoryModel
-from app.db.profile_models import ProfileStatus as ProfileStatusModel
+from app.entities import DuplicateEmailError, HistoryFilter, Profile, ProfileFilter, ProfileHistory
+from app.db.history_recorder import HistoryRecorder
+from app.db.profile_queries import (
+    align_created,
+    chunked,
+    delete_history_of,
+    delete_profile_by_id,
+    first_by_email,
+    history_from_row,
+    history_row,
+    insert_history_rows,
+    insert_profile,
+    insert_profiles_skipping_conflicts,
+    map_to_domain,
+    patch_profile_by_id,
+    pending_history_rows,
+    profile_results,
+    profile_row,
+    select_history,
+    select_ids_by_email,
+    select_profile,
+    select_profile_exists,
+    select_profile_for_update,
+    select_profile_rows,
+    select_profiles_by_ids,
+    select_profiles,
+    search_profiles,
+    update_profile_by_id,
+    update_profiles_by_id,
+    update_row,
+)
 
 
 class ProfileRepository:
     """Repository for profile-related database operations."""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, history_recorder: Optional[HistoryRecorder] = None):
         self.db = db
+        # Write-behind queue for history rows; None writes them in the same transaction
+        self.history_recorder = history_recorder
 
-    def _map_to_domain(self, model: ProfileModel) -> Profile:
-        """Map a database model to a domain entity."""
-        profile = Profile(
-            id=model.id,
-            name=model.name,
-            email=model.email,
-            specialty=model.specialty,
-            linkedin=model.linkedin,
-            status=ProfileStatus(model.status.value),
-            start_date=model.start_date,
-            end_date=model.end_date,
-        )
-
-        # Map history entries
-        profile.history = [
-            ProfileHistory(
-                id=history.id,
-                profile_id=history.profile_id,
-                status=ProfileStatus(history.status.value),
-                changed_at=history.changed_at,
-                profile=profile,
-            )
-            for history in model.history
-        ]
+    def _map_to_domain(self, model, include_history: bool = False) -> Profile:
+        """Map a profile_columns() row, or a model loaded with history, to a domain entity."""
+        return map_to_domain(model, include_history)
+
+    def _add_history(self, rows: List[Dict]) -> List[Dict]:
+        """
+        Insert history rows in the current transaction or, with write-behind on, hold
+        them back to be queued once it commits (see _queue_history).
+        """
+        if rows and self.history_recorder is None:
+            self.db.execute(insert_history_rows(), rows)
+            return []
+        return rows
 
-        return profile
-
-    def _map_to_model(self, entity: Profile) -> ProfileModel:
-        """Map a domain entity to a database model."""
-        # If entity has an ID, it might already exist in the database
-        if entity.id:
-            model = self.db.query(ProfileModel).filter(ProfileModel.id == entity.id).first()
-            if model:
-                # Update existing model
-                model.name = entity.name
-                model.email = entity.email
-                model.specialty = entity.specialty
-                model.linkedin = entity.linkedin
-                model.status = ProfileStatusModel(entity.status.value)
-                model.start_date = entity.start_date
-                model.end_date = entity.end_date
-                return model
-
-        # Create new model
-        model = ProfileModel(
-            id=entity.id,
-            name=entity.name,
-            email=entity.email,
-            specialty=entity.specialty,
-            linkedin=entity.linkedin,
-            status=ProfileStatusModel(entity.status.value),
-            start_date=entity.start_date,
-            end_date=entity.end_date,
-        )
-
-        return model
+    def _queue_history(self, rows: List[Dict]) -> None:
+        """Queue committed history rows; while the queue is full they are written right away."""
+        if rows and not self.history_recorder.record(rows):
+            self.db.execute(insert_history_rows(), rows)
+            self.db.commit()
 
     def create(self, profile: Profile) -> Profile:
-        """Create a new profile."""
-        model = self._map_to_model(profile)
-        self.db.add(model)
+        """
+        Create a new profile and its initial history entry in one transaction.
+        The INSERT returns the stored row, so nothing is re-read after the commit.
+        """
+        row = self.db.execute(insert_profile(profile)).one()
+        history = self._add_history([history_row(row.id, profile.status, row.start_date)])
         self.db.commit()
-        self.db.refresh(model)
+        self._queue_history(history)
+
+        return self._map_to_domain(row)
+
+    def create_many(self, profiles: List[Profile]) -> List[Optional[Profile]]:
+        """
+        Create profiles and their initial history with set-based INSERTs in one transaction.
+        Returns a list aligned with the input holding None for every profile whose email
+        already exists (in the table or earlier in the batch).
+        """
+        first = first_by_email(profiles)
+        unique = [profiles[index] for index in first.values()]
+        stmt = insert_profiles_skipping_conflicts(self.db.get_bind().dialect.name)
 
-        # Set the ID from the database
-        profile.id = model.id
+        created = {}
+        for chunk in chunked(unique):
+            result = self.db.execute(stmt.values([profile_row(p) for p in chunk]))
+            created.update({row.email: row.id for row in result})
 
-        # Create history entry
-        history_model = ProfileHistoryModel(
-            profile_id=model.id, status=ProfileStatusModel(profile.status.value)
-        )
-        self.db.add(history_model)
+        history = [
+            history_row(created[p.email], p.status, p.start_date)
+            for p in unique
+            if p.email in created
+        ]
+        history = self._add_history(history)
         self.db.commit()
+        self._queue_history(history)
 
-        return self._map_to_domain(model)
+        return align_created(profiles, first, created)
 
-    def get_by_id(self, profile_id: int) -> Optional[Profile]:
-        """Get a profile by ID."""
-        model = self.db.query(ProfileModel).filter(ProfileModel.id == profile_id).first()
-        if not model:
-            return None
-        return self._map_to_domain(model)
-
-    def get_all(self, skip: int = 0, limit: int = 10) -> List[Profile]:
-        """Get all profiles with pagination."""
-        models = self.db.query(ProfileModel).offset(skip).limit(limit).all()
-        return [self._map_to_domain(model) for model in models]
-
-    def update(self, profile: Profile) -> Profile:
-        """Update a profile."""
-        # Get the existing model
-        model = self.db.query(ProfileModel).filter(ProfileModel.id == profile.id).first()
-        if not model:
-            return None
+    def upsert_many(self, profiles: List[Profile]) -> Tuple[int, int, int]:
+        """
+        Insert or update a batch of profiles keyed by email, in one transaction.
+        New profiles get their initial history row; existing ones have name, specialty
+        and linkedin overwritten. When an email repeats, the last occurrence wins.
+        Returns the (inserted, updated, skipped) counts; skipped rows are earlier
+        occurrences of a repeated email and new rows a concurrent insert got in first.
+        """
+        latest = {profile.email: profile for profile in profiles}
+        existing = {}
+        for emails in chunked(list(latest)):
+            existing.update(self.db.execute(select_ids_by_email(emails)).all())
 
-        # Update model fields
-        model.name = profile.name
-        model.email = profile.email
-        model.specialty = profile.specialty
-        model.linkedin = profile.linkedin
-        model.status = ProfileStatusModel(profile.status.value)
-        model.start_date = profile.start_date
-        model.end_date = profile.end_date
+        new = [p for email, p in latest.items() if email not in existing]
+        stmt = insert_profiles_skipping_conflicts(self.db.get_bind().dialect.name)
+        inserted = {}
+        for chunk in chunked(new):
+            result = self.db.execute(stmt.values([profile_row(p) for p in chunk]))
+            inserted.update({row.email: row.id for row in result})
 
-        # Commit changes
+        history = self._add_history([
+            history_row(inserted[p.email], p.status, p.start_date)
+            for p in new if p.email in inserted
+        ])
+
+        updates = [
+            update_row(existing[email], p) for email, p in latest.items() if email in existing
+        ]
+        if updates:
+            self.db.execute(update_profiles_by_id(), updates)
         self.db.commit()
-        self.db.refresh(model)
-
-        # Create history entry for status changes
-        # This matches the behavior in the original crud.py
-        history_model = ProfileHistoryModel(
-            profile_id=model.id, status=ProfileStatusModel(profile.status.value)
-        )
-        self.db.add(history_model)
+        self._queue_history(history)
+
+        skipped = len(profiles) - len(inserted) - len(updates)
+        return len(inserted), len(updates), skipped
+
+    def get_by_id(self, profile_id: int, include_history: bool = False) -> Optional[Profile]:
+        """Get a profile by ID, optionally with its status history."""
+        result = self.db.execute(select_profile(profile_id, include_history))
+        rows = profile_results(result, include_history)
+        if not rows:
+            return None
+        return self._map_to_domain(rows[0], include_history)
+
+    def get_for_update(self, profile_id: int) -> Optional[Profile]:
+        """
+        Read a profile to modify it, always from the database; on PostgreSQL the row
+        stays locked until the write that follows commits, so no update is lost.
+        """
+        row = self.db.execute(select_profile_for_update(profile_id)).first()
+        return self._map_to_domain(row) if row else None
+
+    def get_many(self, profile_ids: List[int]) -> Dict[int, Profile]:
+        """Get the existing profiles among ``profile_ids`` by ID, one IN query per chunk."""
+        profiles = {}
+        for chunk in chunked(list(dict.fromkeys(profile_ids))):
+            for row in self.db.execute(select_profiles_by_ids(chunk)):
+                profiles[row.id] = self._map_to_domain(row)
+        return profiles
+
+    def get_all(
+        self,
+        skip: int = 0,
+        limit: int = 10,
+        after: Optional[Tuple] = None,
+        order_by: str = "id",
+        include_history: bool = False,
+        filters: Optional[ProfileFilter] = None,
+    ) -> List[Profile]:
+        """Get the profiles matching ``filters`` with offset or keyset pagination."""
+        stmt = select_profiles(skip, limit, after, order_by, include_history, filters)
+        rows = profile_results(self.db.execute(stmt), include_history)
+        return [self._map_to_domain(row, include_history) for row in rows]
+
+    def get_history(
+        self,
+        profile_id: int,
+        limit: int = 10,
+        after: Optional[Tuple] = None,
+        filters: Optional[HistoryFilter] = None,
+    ) -> Optional[List[ProfileHistory]]:
+        """
+        Get a keyset page of a profile's status history, oldest first; None when the
+        profile does not exist. Existence is only checked when the page comes back empty.
+        """
+        result = self.db.execute(select_history(profile_id, limit, after, filters))
+        entries = [history_from_row(row) for row in result]
+        if entries:
+            return entries
+        exists = self.db.execute(select_profile_exists(profile_id)).first()
+        return entries if exists else None
+
+    def search(
+        self, query: str, limit: int = 10, after: Optional[Tuple] = None
+    ) -> List[Tuple[Profile, float]]:
+        """Full-text search; (profile, rank) pairs, best match first."""
+        stmt = search_profiles(self.db.get_bind().dialect.name, query, limit, after)
+        if stmt is None:
+            return []
+        rows = self.db.execute(stmt).all()
+        return [(self._map_to_domain(row), row.rank) for row in rows]
+
+    def stream_rows(self) -> Iterator[Row]:
+        """Yield every profile as a plain row, fetched in server-side batches."""
+        result = self.db.execute(select_profile_rows())
+        try:
+            for partition in result.partitions():
+                yield from partition
+        finally:
+            result.close()
+
+    def update(self, profile: Profile) -> Optional[Profile]:
+        """Update a profile and store its new history entries, in one transaction."""
+        row = self.db.execute(update_profile_by_id(profile)).first()
+        if not row:
+            self.db.rollback()
+            return None
+
+        # Only a status change adds an entry (apply_profile_changes); others write no history
+        pending = self._add_history(pending_history_rows(row.id, profile))
         self.db.commit()
-        self.db.refresh(model)
+        self._queue_history(pending)
 
-        return self._map_to_domain(model)
+        return self._map_to_domain(row)
 
-    def delete(self, profile_id: int) -> Optional[Profile]:
-        """Delete a profile."""
-        model = self.db.query(ProfileModel).filter(ProfileModel.id == profile_id).first()
-        if not model:
+    def patch(self, profile_id: int, changes: Dict) -> Optional[Profile]:
+        """
+        Update only the given columns in one transaction, without reading the profile first.
+        A history entry is appended only when the status actually changes. Raises
+        DuplicateEmailError when the new email belongs to another profile.
+        """
+        if not changes:
+            return self.get_by_id(profile_id)
+
+        row, history = None, []
+        status = changes.get("status")
+        try:
+            if status is not None:
+                # Matches only if the status differs, so a row back means a real transition
+                stmt = patch_profile_by_id(profile_id, changes, status_differs=True)
+                row = self.db.execute(stmt).first()
+                if row:
+                    history = self._add_history([history_row(row.id, status, datetime.utcnow())])
+            if row is None:
+                row = self.db.execute(patch_profile_by_id(profile_id, changes)).first()
+        except IntegrityError as exc:
+            # email is the only unique column a PATCH can change
+            self.db.rollback()
+            raise DuplicateEmailError(f"Email {changes.get('email')!r} is already in use") from exc
+        if row is None:
+            self.db.rollback()
             return None
+        self.db.commit()
+        self._queue_history(history)
 
-        # Map to domain entity before deletion
-        profile = self._map_to_domain(model)
+        return self._map_to_domain(row)
 
-        # Actually delete the profile from the database
-        # This matches the behavior in the original crud.py
-        self.db.delete(model)
+    def delete(self, profile_id: int) -> Optional[Profile]:
+        """Delete a profile and its history, returning the profile as it was stored."""
+        if self.history_recorder is not None:
+            # Queued rows of this profile must land before its history is deleted
+            self.history_recorder.flush()
+        self.db.execute(delete_history_of(profile_id))
+        row = self.db.execute(delete_profile_by_id(profile_id)).first()
+        if not row:
+            self.db.rollback()
+            return None
         self.db.commit()
 
-        return profile
+        return self._map_to_domain(row)
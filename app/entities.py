@@ -14,7 +14,24 @@ class ProfileStatus(enum.Enum):
     DELETED = "deleted"
 
 
+# Public fields of a profile, in the order API responses and exports present them
+PROFILE_FIELDS = (
+    "id", "name", "email", "specialty", "linkedin", "status", "start_date", "end_date"
+)
+
+# Fields of a status history entry, in the order API responses present them
+HISTORY_FIELDS = ("id", "profile_id", "status", "changed_at")
+
+
 class Profile:
+    """
+    A profile and, when loaded, its status history. Slotted: lists and exports build
+    one per row, and slots keep them smaller and faster to create than __dict__ objects.
+    Positional arguments follow PROFILE_FIELDS, so a row of those columns maps directly.
+    """
+
+    __slots__ = PROFILE_FIELDS + ("history",)
+
     def __init__(
         self,
         id: Optional[int] = None,
@@ -39,16 +56,68 @@ class Profile:
 
 
 class ProfileHistory:
+    """
+    A status change of a profile. It refers to its profile by ``profile_id`` only;
+    a reference back to the Profile would make every profile with history a cycle
+    that only the garbage collector can free.
+    """
+
+    __slots__ = HISTORY_FIELDS
+
     def __init__(
         self,
         id: Optional[int] = None,
         profile_id: int = None,
         status: ProfileStatus = None,
         changed_at: datetime = None,
-        profile: Optional[Profile] = None,
     ):
         self.id = id
         self.profile_id = profile_id
         self.status = status
         self.changed_at = changed_at or datetime.utcnow()
-        self.profile = profile
\ No newline at end of file
+
+
+class ProfileFilter:
+    """
+    Criteria for listing profiles. Unset criteria do not filter.
+    Date ranges include their lower bound and exclude their upper bound.
+    """
+
+    def __init__(
+        self,
+        status: Optional[ProfileStatus] = None,
+        specialty: Optional[str] = None,
+        start_date_from: Optional[datetime] = None,
+        start_date_to: Optional[datetime] = None,
+        end_date_from: Optional[datetime] = None,
+        end_date_to: Optional[datetime] = None,
+        include_deleted: bool = True,
+    ):
+        self.status = status
+        self.specialty = specialty
+        self.start_date_from = start_date_from
+        self.start_date_to = start_date_to
+        self.end_date_from = end_date_from
+        self.end_date_to = end_date_to
+        self.include_deleted = include_deleted
+
+
+class HistoryFilter:
+    """
+    Criteria for listing the status history of a profile. Unset criteria do not filter.
+    The time range includes its lower bound and excludes its upper bound.
+    """
+
+    def __init__(
+        self,
+        status: Optional[ProfileStatus] = None,
+        changed_from: Optional[datetime] = None,
+        changed_to: Optional[datetime] = None,
+    ):
+        self.status = status
+        self.changed_from = changed_from
+        self.changed_to = changed_to
+
+
+class DuplicateEmailError(ValueError):
+    """Raised when a write would give a profile an email another profile already has."""
@@ -1,11 +1,35 @@
-import time
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
-from app.config.database import engine, Base
+from app.config.database import DB_ASYNC
+from app.config.health import readiness, wait_for_database
+from app.config.history import history_recorder
 from app.api.routes import router  # Importa las rutas
+from app.api.async_routes import router as async_router
+from app.api.health_routes import router as health_router
+from app.api.internal_routes import router as internal_router
+from app.api.metrics import MetricsMiddleware, router as metrics_router
 
-app = FastAPI()
+
+# 🔹 Arranque sin bloqueo: el esquema lo aplica Alembic antes de lanzar los workers
+# (`alembic upgrade head`); aquí solo se espera a la base de datos en segundo plano
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    startup = asyncio.create_task(wait_for_database(readiness))
+    if history_recorder is not None:
+        history_recorder.start()
+    yield
+    startup.cancel()
+    with suppress(asyncio.CancelledError):
+        await startup
+    # 🔹 Escribir el historial aún encolado antes de que el worker termine
+    if history_recorder is not None:
+        await asyncio.to_thread(history_recorder.stop)
+
+
+app = FastAPI(lifespan=lifespan)
 
 # 🔹 Habilitar CORS
 app.add_middleware(
@@ -14,24 +38,17 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag"],
 )
 
-# 🔹 Asegurar que la base de datos y las tablas se creen antes de arrancar
-MAX_RETRIES = 5
-for i in range(MAX_RETRIES):
-    try:
-        Base.metadata.create_all(bind=engine)  # Crear tablas en PostgreSQL
-        print("✅ Tablas creadas en PostgreSQL")
-        break
-    except Exception:
-        print(f"⚠️ Intento {i+1}/{MAX_RETRIES} fallido. Reintentando en 5s...")
-        time.sleep(5)
-else:
-    print("❌ No se pudo conectar a la base de datos.")
-    raise ConnectionError("Error al conectar con la base de datos")
-
-# 🔹 Incluir rutas de la API
-app.include_router(router)
+# 🔹 Métricas Prometheus por plantilla de ruta (middleware más externo: mide la petición entera)
+app.add_middleware(MetricsMiddleware)
+
+# 🔹 Incluir rutas de la API (async def + AsyncSession cuando DB_ASYNC=true)
+app.include_router(async_router if DB_ASYNC else router)
+app.include_router(health_router)
+app.include_router(internal_router)
+app.include_router(metrics_router)
 
 
 @app.get("/", response_class=JSONResponse)
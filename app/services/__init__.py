@@ -1,3 +1,4 @@
 from app.services.profile_service import ProfileService
+from app.services.async_profile_service import AsyncProfileService
 
-__all__ = ["ProfileService"]
+__all__ = ["ProfileService", "AsyncProfileService"]
@@ -0,0 +1,135 @@
+import asyncio
+from typing import AsyncIterator, Dict, Iterable, Optional, List, Tuple
+from app.entities import HistoryFilter, Profile, ProfileFilter, ProfileHistory, ProfileStatus
+from app.services.profile_import import DEFAULT_IMPORT_BATCH_SIZE, ImportReport, batched
+from app.services.profile_loader import AsyncProfileLoader
+from app.services.profile_service import apply_profile_changes, build_profile, patch_changes
+
+
+class AsyncProfileService:
+    """Asyncio counterpart of ProfileService; shares its business rules."""
+
+    def __init__(self, profile_repository):
+        self.profile_repository = profile_repository
+        # Lookups by ID, memoized for the lifetime of the service (one request)
+        self.loader = AsyncProfileLoader(profile_repository)
+
+    async def create_profile(
+        self, name: str, email: str, specialty: str, linkedin: Optional[str] = None
+    ) -> Profile:
+        """Create a new profile with initial status."""
+        profile = build_profile(name, email, specialty, linkedin)
+        return await self.profile_repository.create(profile)
+
+    async def create_profiles(self, profiles: List[Dict]) -> List[Optional[Profile]]:
+        """Create many profiles in one batch; None marks duplicate emails."""
+        entities = [build_profile(**data) for data in profiles]
+        return await self.profile_repository.create_many(entities)
+
+    async def import_profiles(
+        self,
+        profiles: Iterable[Dict],
+        batch_size: int = DEFAULT_IMPORT_BATCH_SIZE,
+        report: Optional[ImportReport] = None,
+    ) -> ImportReport:
+        """
+        Upsert a stream of profiles by email, one transaction per batch.
+        ``profiles`` is a blocking iterator (the upload is parsed and validated as it
+        is read), so each batch is pulled in a worker thread, off the event loop.
+        """
+        report = report or ImportReport()
+        batches = batched(profiles, batch_size)
+        while True:
+            batch = await asyncio.to_thread(next, batches, None)
+            if batch is None:
+                break
+            inserted, updated, skipped = await self.profile_repository.upsert_many(
+                [build_profile(**data) for data in batch]
+            )
+            report.inserted += inserted
+            report.updated += updated
+            report.skipped += skipped
+        self.loader.clear()
+        return report
+
+    async def update_profile(
+        self,
+        profile: Profile,
+        name: Optional[str] = None,
+        email: Optional[str] = None,
+        specialty: Optional[str] = None,
+        linkedin: Optional[str] = None,
+        status: Optional[ProfileStatus] = None,
+    ) -> Profile:
+        """Update a profile and record status changes."""
+        apply_profile_changes(profile, name, email, specialty, linkedin, status)
+        updated = await self.profile_repository.update(profile)
+        self.loader.forget(profile.id)
+        return updated
+
+    async def patch_profile(self, profile_id: int, changes: Dict) -> Optional[Profile]:
+        """Update only the supplied fields, without loading the profile first."""
+        patched = await self.profile_repository.patch(profile_id, patch_changes(changes))
+        self.loader.forget(profile_id)
+        return patched
+
+    async def delete_profile(self, profile_id: int) -> Optional[Profile]:
+        """Delete a profile, returning it as it was stored; None when it does not exist."""
+        deleted = await self.profile_repository.delete(profile_id)
+        self.loader.prime(profile_id, None)
+        return deleted
+
+    async def get_profile(
+        self, profile_id: int, include_history: bool = False
+    ) -> Optional[Profile]:
+        """Get a profile by ID; concurrent lookups without history share one query."""
+        if include_history:
+            return await self.profile_repository.get_by_id(profile_id, include_history=True)
+        return await self.loader.load(profile_id)
+
+    async def get_profile_for_update(self, profile_id: int) -> Optional[Profile]:
+        """Get a profile to modify, read from the database and never from a cache."""
+        return await self.profile_repository.get_for_update(profile_id)
+
+    async def get_profiles_by_ids(self, profile_ids: List[int]) -> Dict[int, Optional[Profile]]:
+        """Get many profiles by ID, without history; each ID maps to its profile or None."""
+        return await self.loader.load_many(profile_ids)
+
+    async def get_profiles(
+        self,
+        skip: int = 0,
+        limit: int = 10,
+        after: Optional[Tuple] = None,
+        order_by: str = "id",
+        include_history: bool = False,
+        filters: Optional[ProfileFilter] = None,
+    ) -> List[Profile]:
+        """Get the profiles matching ``filters`` with offset or keyset pagination."""
+        return await self.profile_repository.get_all(
+            skip,
+            limit,
+            after=after,
+            order_by=order_by,
+            include_history=include_history,
+            filters=filters,
+        )
+
+    async def get_history(
+        self,
+        profile_id: int,
+        limit: int = 10,
+        after: Optional[Tuple] = None,
+        filters: Optional[HistoryFilter] = None,
+    ) -> Optional[List[ProfileHistory]]:
+        """Get a keyset page of a profile's status history; None when it does not exist."""
+        return await self.profile_repository.get_history(profile_id, limit, after, filters)
+
+    async def search_profiles(
+        self, query: str, limit: int = 10, after: Optional[Tuple] = None
+    ) -> List[Tuple[Profile, float]]:
+        """Rank profiles matching ``query`` by relevance."""
+        return await self.profile_repository.search(query, limit, after)
+
+    def stream_profiles(self) -> AsyncIterator[Tuple]:
+        """Yield every profile as a plain row, ordered by ID."""
+        return self.profile_repository.stream_rows()
@@ -0,0 +1,296 @@
+import copy
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+from app.entities import Profile
+
+
+def clone_profile(profile: Profile) -> Profile:
+    """Copy a profile so callers can mutate it without touching the cached entry."""
+    clone = copy.copy(profile)
+    clone.history = list(profile.history)
+    return clone
+
+
+class ProfileCache(ABC):
+    """
+    Interface of profile cache backends, keyed by profile ID.
+    A backend missing any of these methods fails when it is instantiated.
+    """
+
+    @abstractmethod
+    def get(self, profile_id: int) -> Optional[Profile]:
+        """The cached profile, or None on a miss."""
+
+    @abstractmethod
+    def set(self, profile_id: int, profile: Profile, epoch: Optional[int] = None) -> None:
+        """Store a profile, unless the cache was invalidated since ``epoch`` was read."""
+
+    @abstractmethod
+    def epoch(self) -> int:
+        """Counter bumped by every invalidation; read it before loading from the database."""
+
+    @abstractmethod
+    def invalidate(self, profile_id: int) -> None:
+        """Drop one profile."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Drop every profile."""
+
+    @abstractmethod
+    def stats(self) -> Dict[str, int]:
+        """Counters for the internal statistics endpoint."""
+
+
+class NullProfileCache(ProfileCache):
+    """Backend that never stores anything; every read goes to the repository."""
+
+    def get(self, profile_id: int) -> Optional[Profile]:
+        return None
+
+    def set(self, profile_id: int, profile: Profile, epoch: Optional[int] = None) -> None:
+        pass
+
+    def epoch(self) -> int:
+        return 0
+
+    def invalidate(self, profile_id: int) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+    def stats(self) -> Dict[str, int]:
+        return {}
+
+
+class InMemoryProfileCache(ProfileCache):
+    """
+    In-process LRU cache with a per-entry TTL.
+    Entries live in this worker only, so other workers may serve a stale profile
+    for at most ``ttl`` seconds after a write.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: "OrderedDict[int, Tuple[float, Profile]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._epoch = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, profile_id: int) -> Optional[Profile]:
+        with self._lock:
+            entry = self._entries.get(profile_id)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, profile = entry
+            if expires_at <= self._clock():
+                del self._entries[profile_id]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(profile_id)
+            self.hits += 1
+        return clone_profile(profile)
+
+    def set(self, profile_id: int, profile: Profile, epoch: Optional[int] = None) -> None:
+        if self.maxsize <= 0 or self.ttl <= 0:
+            return
+        entry = (self._clock() + self.ttl, clone_profile(profile))
+        with self._lock:
+            # A write landed while this profile was being loaded: it may already be stale
+            if epoch is not None and epoch != self._epoch:
+                return
+            self._entries[profile_id] = entry
+            self._entries.move_to_end(profile_id)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def epoch(self) -> int:
+        return self._epoch
+
+    def invalidate(self, profile_id: int) -> None:
+        with self._lock:
+            self._epoch += 1
+            if self._entries.pop(profile_id, None) is not None:
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._epoch += 1
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
+
+
+# 🔹 Backends disponibles; otros (p. ej. Redis) se registran con register_cache_backend
+CACHE_BACKENDS: Dict[str, Callable[..., ProfileCache]] = {
+    "memory": InMemoryProfileCache,
+    "none": lambda **_: NullProfileCache(),
+}
+
+
+def register_cache_backend(name: str, factory: Callable[..., ProfileCache]) -> None:
+    """Make a cache backend selectable through PROFILE_CACHE_BACKEND."""
+    CACHE_BACKENDS[name] = factory
+
+
+def create_profile_cache(backend: str, maxsize: int, ttl: float) -> ProfileCache:
+    """Instantiate a registered cache backend."""
+    try:
+        factory = CACHE_BACKENDS[backend]
+    except KeyError:
+        raise ValueError(f"Unknown profile cache backend {backend!r}") from None
+    return factory(maxsize=maxsize, ttl=ttl)
+
+
+class CachedProfileRepository:
+    """
+    Read-through cache in front of a profile repository.
+    get_by_id and get_many are served from the cache; writes invalidate the affected entries.
+    Every other method is delegated to the wrapped repository unchanged.
+    """
+
+    def __init__(self, repository, cache: ProfileCache):
+        self.repository = repository
+        self.cache = cache
+
+    def __getattr__(self, name):
+        return getattr(self.repository, name)
+
+    def get_by_id(self, profile_id: int, include_history: bool = False) -> Optional[Profile]:
+        # Entries hold profiles without history; history reads always hit the database
+        if include_history:
+            return self.repository.get_by_id(profile_id, include_history=True)
+        profile = self.cache.get(profile_id)
+        if profile is None:
+            epoch = self.cache.epoch()
+            profile = self.repository.get_by_id(profile_id)
+            if profile is not None:
+                self.cache.set(profile_id, profile, epoch)
+        return profile
+
+    def get_many(self, profile_ids: List[int]) -> Dict[int, Profile]:
+        # Cached entries are served as they are; the misses are read in one batch
+        profiles = {}
+        for profile_id in profile_ids:
+            cached = self.cache.get(profile_id)
+            if cached is not None:
+                profiles[profile_id] = cached
+        misses = [profile_id for profile_id in profile_ids if profile_id not in profiles]
+        if misses:
+            epoch = self.cache.epoch()
+            loaded = self.repository.get_many(misses)
+            for profile_id, profile in loaded.items():
+                self.cache.set(profile_id, profile, epoch)
+            profiles.update(loaded)
+        return profiles
+
+    def update(self, profile: Profile) -> Optional[Profile]:
+        try:
+            return self.repository.update(profile)
+        finally:
+            self.cache.invalidate(profile.id)
+
+    def patch(self, profile_id: int, changes: Dict) -> Optional[Profile]:
+        try:
+            return self.repository.patch(profile_id, changes)
+        finally:
+            self.cache.invalidate(profile_id)
+
+    def delete(self, profile_id: int) -> Optional[Profile]:
+        try:
+            return self.repository.delete(profile_id)
+        finally:
+            self.cache.invalidate(profile_id)
+
+    def upsert_many(self, profiles: List[Profile]) -> Tuple[int, int, int]:
+        inserted, updated, skipped = self.repository.upsert_many(profiles)
+        # Updated IDs are not known here; drop everything rather than serve stale rows
+        if updated:
+            self.cache.clear()
+        return inserted, updated, skipped
+
+
+class AsyncCachedProfileRepository(CachedProfileRepository):
+    """Read-through cache in front of an AsyncProfileRepository."""
+
+    async def get_by_id(
+        self, profile_id: int, include_history: bool = False
+    ) -> Optional[Profile]:
+        if include_history:
+            return await self.repository.get_by_id(profile_id, include_history=True)
+        profile = self.cache.get(profile_id)
+        if profile is None:
+            epoch = self.cache.epoch()
+            profile = await self.repository.get_by_id(profile_id)
+            if profile is not None:
+                self.cache.set(profile_id, profile, epoch)
+        return profile
+
+    async def get_many(self, profile_ids: List[int]) -> Dict[int, Profile]:
+        profiles = {}
+        for profile_id in profile_ids:
+            cached = self.cache.get(profile_id)
+            if cached is not None:
+                profiles[profile_id] = cached
+        misses = [profile_id for profile_id in profile_ids if profile_id not in profiles]
+        if misses:
+            epoch = self.cache.epoch()
+            loaded = await self.repository.get_many(misses)
+            for profile_id, profile in loaded.items():
+                self.cache.set(profile_id, profile, epoch)
+            profiles.update(loaded)
+        return profiles
+
+    async def update(self, profile: Profile) -> Optional[Profile]:
+        try:
+            return await self.repository.update(profile)
+        finally:
+            self.cache.invalidate(profile.id)
+
+    async def patch(self, profile_id: int, changes: Dict) -> Optional[Profile]:
+        try:
+            return await self.repository.patch(profile_id, changes)
+        finally:
+            self.cache.invalidate(profile_id)
+
+    async def delete(self, profile_id: int) -> Optional[Profile]:
+        try:
+            return await self.repository.delete(profile_id)
+        finally:
+            self.cache.invalidate(profile_id)
+
+    async def upsert_many(self, profiles: List[Profile]) -> Tuple[int, int, int]:
+        inserted, updated, skipped = await self.repository.upsert_many(profiles)
+        if updated:
+            self.cache.clear()
+        return inserted, updated, skipped
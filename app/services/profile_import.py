@@ -0,0 +1,48 @@
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List
+
+# Rows upserted per transaction during an import
+DEFAULT_IMPORT_BATCH_SIZE = 1000
+
+# Rejections listed in the report; the rest are only counted
+MAX_REPORTED_ERRORS = 100
+
+
+class ImportReport:
+    """
+    Summary of a bulk import: inserted, updated and rejected rows, plus the valid rows
+    skipped because a later row of the same batch has their email or a concurrent
+    insert got in first.
+    """
+
+    def __init__(self):
+        self.inserted = 0
+        self.updated = 0
+        self.skipped = 0
+        self.rejected = 0
+        self.errors: List[Dict] = []
+
+    def reject(self, line: int, error: str) -> None:
+        """Count a rejected row, keeping the first MAX_REPORTED_ERRORS details."""
+        self.rejected += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"line": line, "error": error})
+
+    def to_dict(self) -> Dict:
+        return {
+            "inserted": self.inserted,
+            "updated": self.updated,
+            "skipped": self.skipped,
+            "rejected": self.rejected,
+            "errors": self.errors,
+        }
+
+
+def batched(rows: Iterable, size: int) -> Iterator[List]:
+    """Group an iterable into lists of at most ``size`` items without materializing it."""
+    iterator = iter(rows)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
@@ -0,0 +1,111 @@
+import asyncio
+from typing import Dict, List, Optional, Tuple
+
+from app.entities import Profile
+
+
+class ProfileLoader:
+    """
+    Request-scoped memo of profile lookups by ID (without history), in front of a
+    repository. Each ID is read at most once per request; load_many reads every ID
+    not loaded yet with a single get_many. Writes made through the same service
+    prime or drop the affected entries, so reads after a write see it.
+    """
+
+    def __init__(self, repository):
+        self.repository = repository
+        self._loaded: Dict[int, Optional[Profile]] = {}
+
+    def load(self, profile_id: int) -> Optional[Profile]:
+        """The profile with this ID, or None when it does not exist."""
+        if profile_id not in self._loaded:
+            self._loaded[profile_id] = self.repository.get_by_id(profile_id)
+        return self._loaded[profile_id]
+
+    def load_many(self, profile_ids: List[int]) -> Dict[int, Optional[Profile]]:
+        """Each requested ID mapped to its profile, or None when it does not exist."""
+        missing = [i for i in dict.fromkeys(profile_ids) if i not in self._loaded]
+        if missing:
+            found = self.repository.get_many(missing)
+            for profile_id in missing:
+                self._loaded[profile_id] = found.get(profile_id)
+        return {profile_id: self._loaded[profile_id] for profile_id in profile_ids}
+
+    def prime(self, profile_id: int, profile: Optional[Profile]) -> None:
+        """Record the stored state of a profile after a write (None once deleted)."""
+        self._loaded[profile_id] = profile
+
+    def forget(self, profile_id: int) -> None:
+        """Drop one profile, so the next load reads it again."""
+        self._loaded.pop(profile_id, None)
+
+    def clear(self) -> None:
+        """Forget every loaded profile, after writes whose affected IDs are unknown."""
+        self._loaded.clear()
+
+
+class AsyncProfileLoader:
+    """
+    Asyncio counterpart of ProfileLoader that also coalesces concurrent lookups:
+    every load() awaited in the same event loop iteration (e.g. under asyncio.gather)
+    is answered by one get_many. Failed reads are not memoized.
+    """
+
+    def __init__(self, repository):
+        self.repository = repository
+        self._loaded: Dict[int, asyncio.Future] = {}
+        self._queue: List[Tuple[int, asyncio.Future]] = []
+        self._dispatch_task: Optional[asyncio.Task] = None
+
+    async def load(self, profile_id: int) -> Optional[Profile]:
+        """The profile with this ID, or None when it does not exist."""
+        future = self._loaded.get(profile_id)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._loaded[profile_id] = loop.create_future()
+            self._queue.append((profile_id, future))
+            if len(self._queue) == 1:
+                # Runs once the callers scheduled alongside this one have queued their IDs
+                self._dispatch_task = loop.create_task(self._dispatch())
+        return await future
+
+    async def load_many(self, profile_ids: List[int]) -> Dict[int, Optional[Profile]]:
+        """Each requested ID mapped to its profile, or None when it does not exist."""
+        unique = list(dict.fromkeys(profile_ids))
+        profiles = dict(zip(unique, await asyncio.gather(*map(self.load, unique))))
+        return {profile_id: profiles[profile_id] for profile_id in profile_ids}
+
+    async def _dispatch(self) -> None:
+        batch, self._queue = self._queue, []
+        try:
+            if len(batch) == 1:
+                # A lone ID goes through get_by_id, which single-flight shares across requests
+                profile_id = batch[0][0]
+                found = {profile_id: await self.repository.get_by_id(profile_id)}
+            else:
+                found = await self.repository.get_many([profile_id for profile_id, _ in batch])
+        except Exception as exc:
+            for profile_id, future in batch:
+                if self._loaded.get(profile_id) is future:
+                    del self._loaded[profile_id]
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        # Futures replaced by prime() meanwhile still answer the callers awaiting them
+        for profile_id, future in batch:
+            if not future.done():
+                future.set_result(found.get(profile_id))
+
+    def prime(self, profile_id: int, profile: Optional[Profile]) -> None:
+        """Record the stored state of a profile after a write (None once deleted)."""
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(profile)
+        self._loaded[profile_id] = future
+
+    def forget(self, profile_id: int) -> None:
+        """Drop one profile, so the next load reads it again."""
+        self._loaded.pop(profile_id, None)
+
+    def clear(self) -> None:
+        """Forget every loaded profile, after writes whose affected IDs are unknown."""
+        self._loaded = {k: f for k, f in self._loaded.items() if not f.done()}
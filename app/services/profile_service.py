@@ -1,6 +1,72 @@
 from datetime import datetime
-from typing import Optional, List
-from app.entities import Profile, ProfileHistory, ProfileStatus
+from typing import Dict, Iterable, Iterator, Optional, List, Tuple
+from app.entities import HistoryFilter, Profile, ProfileFilter, ProfileHistory, ProfileStatus
+from app.services.profile_import import DEFAULT_IMPORT_BATCH_SIZE, ImportReport, batched
+from app.services.profile_loader import ProfileLoader
+
+
+# Optional columns a PATCH may clear by sending null; nulls for the rest are ignored
+CLEARABLE_FIELDS = ("linkedin",)
+
+
+def patch_changes(changes: Dict) -> Dict:
+    """Keep the supplied PATCH fields that can be written as given."""
+    return {
+        field: value
+        for field, value in changes.items()
+        if value is not None or field in CLEARABLE_FIELDS
+    }
+
+
+def build_profile(
+    name: str, email: str, specialty: str, linkedin: Optional[str] = None
+) -> Profile:
+    """Build a new ACTIVE profile with its initial history entry."""
+    profile = Profile(
+        name=name,
+        email=email,
+        specialty=specialty,
+        linkedin=linkedin,
+        status=ProfileStatus.ACTIVE,
+        start_date=datetime.utcnow(),
+    )
+
+    # Create initial history entry
+    history = ProfileHistory(
+        profile_id=profile.id,
+        status=profile.status,
+        changed_at=datetime.utcnow(),
+    )
+
+    profile.history.append(history)
+    return profile
+
+
+def apply_profile_changes(
+    profile: Profile,
+    name: Optional[str] = None,
+    email: Optional[str] = None,
+    specialty: Optional[str] = None,
+    linkedin: Optional[str] = None,
+    status: Optional[ProfileStatus] = None,
+) -> Profile:
+    """Apply the provided changes to a profile and record status changes."""
+    if name is not None:
+        profile.name = name
+    if email is not None:
+        profile.email = email
+    if specialty is not None:
+        profile.specialty = specialty
+    if linkedin is not None:
+        profile.linkedin = linkedin
+
+    # If status changed, record it in history
+    if status is not None and profile.status != status:
+        profile.status = status
+        history = ProfileHistory(profile_id=profile.id, status=status, changed_at=datetime.utcnow())
+        profile.history.append(history)
+
+    return profile
 
 
 class ProfileService:
@@ -8,33 +74,48 @@ class ProfileService:
 
     def __init__(self, profile_repository):
         self.profile_repository = profile_repository
+        # Lookups by ID, memoized for the lifetime of the service (one request)
+        self.loader = ProfileLoader(profile_repository)
 
     def create_profile(
         self, name: str, email: str, specialty: str, linkedin: Optional[str] = None
     ) -> Profile:
         """Create a new profile with initial status."""
-        profile = Profile(
-            name=name,
-            email=email,
-            specialty=specialty,
-            linkedin=linkedin,
-            status=ProfileStatus.ACTIVE,
-            start_date=datetime.utcnow(),
-        )
-
-        # Create initial history entry
-        history = ProfileHistory(
-            profile_id=profile.id,
-            status=profile.status,
-            changed_at=datetime.utcnow(),
-            profile=profile,
-        )
-
-        profile.history.append(history)
+        profile = build_profile(name, email, specialty, linkedin)
 
         # Persist to database using repository
         return self.profile_repository.create(profile)
 
+    def create_profiles(self, profiles: List[Dict]) -> List[Optional[Profile]]:
+        """
+        Create many profiles in one batch.
+        Returns a list aligned with the input holding None for duplicate emails.
+        """
+        entities = [build_profile(**data) for data in profiles]
+        return self.profile_repository.create_many(entities)
+
+    def import_profiles(
+        self,
+        profiles: Iterable[Dict],
+        batch_size: int = DEFAULT_IMPORT_BATCH_SIZE,
+        report: Optional[ImportReport] = None,
+    ) -> ImportReport:
+        """
+        Upsert a stream of profiles by email in fixed-size batches.
+        Each batch is its own transaction, so memory stays bounded and the rows
+        of completed batches survive a failure later in the stream.
+        """
+        report = report or ImportReport()
+        for batch in batched(profiles, batch_size):
+            inserted, updated, skipped = self.profile_repository.upsert_many(
+                [build_profile(**data) for data in batch]
+            )
+            report.inserted += inserted
+            report.updated += updated
+            report.skipped += skipped
+        self.loader.clear()
+        return report
+
     def update_profile(
         self,
         profile: Profile,
@@ -45,51 +126,83 @@ class ProfileService:
         status: Optional[ProfileStatus] = None,
     ) -> Profile:
         """Update a profile and record status changes."""
-        if name is not None:
-            profile.name = name
-        if email is not None:
-            profile.email = email
-        if specialty is not None:
-            profile.specialty = specialty
-        if linkedin is not None:
-            profile.linkedin = linkedin
-
-        # If status changed, record it in history
-        if status is not None and profile.status != status:
-            profile.status = status
-            history = ProfileHistory(
-                profile_id=profile.id, status=status, changed_at=datetime.utcnow(), profile=profile
-            )
-            profile.history.append(history)
+        apply_profile_changes(profile, name, email, specialty, linkedin, status)
 
         # Persist changes to database using repository
-        return self.profile_repository.update(profile)
+        updated = self.profile_repository.update(profile)
+        self.loader.forget(profile.id)
+        return updated
+
+    def patch_profile(self, profile_id: int, changes: Dict) -> Optional[Profile]:
+        """
+        Update only the supplied fields, without loading the profile first.
+        A status history entry is recorded only when the status actually changes.
+        """
+        patched = self.profile_repository.patch(profile_id, patch_changes(changes))
+        self.loader.forget(profile_id)
+        return patched
 
     def delete_profile(self, profile_id: int) -> Optional[Profile]:
-        """Mark a profile as deleted."""
-        profile = self.profile_repository.get_by_id(profile_id)
-        if not profile:
-            return None
-
-        profile.status = ProfileStatus.DELETED
-        profile.end_date = datetime.utcnow()
-
-        # Record the deletion in history
-        history = ProfileHistory(
-            profile_id=profile.id,
-            status=ProfileStatus.DELETED,
-            changed_at=datetime.utcnow(),
-            profile=profile,
+        """Delete a profile, returning it as it was stored; None when it does not exist."""
+        deleted = self.profile_repository.delete(profile_id)
+        self.loader.prime(profile_id, None)
+        return deleted
+
+    def get_profile(self, profile_id: int, include_history: bool = False) -> Optional[Profile]:
+        """Get a profile by ID; lookups without history go through the request's loader."""
+        if include_history:
+            return self.profile_repository.get_by_id(profile_id, include_history=True)
+        return self.loader.load(profile_id)
+
+    def get_profile_for_update(self, profile_id: int) -> Optional[Profile]:
+        """
+        Get a profile to modify and write back with update_profile. It is read from the
+        database, never from a cache, so the write cannot revert newer changes.
+        """
+        return self.profile_repository.get_for_update(profile_id)
+
+    def get_profiles_by_ids(self, profile_ids: List[int]) -> Dict[int, Optional[Profile]]:
+        """
+        Get many profiles by ID, without history, with one query for every ID not
+        loaded yet in this request. Each ID maps to its profile or None.
+        """
+        return self.loader.load_many(profile_ids)
+
+    def get_profiles(
+        self,
+        skip: int = 0,
+        limit: int = 10,
+        after: Optional[Tuple] = None,
+        order_by: str = "id",
+        include_history: bool = False,
+        filters: Optional[ProfileFilter] = None,
+    ) -> List[Profile]:
+        """Get the profiles matching ``filters`` with offset or keyset pagination."""
+        return self.profile_repository.get_all(
+            skip,
+            limit,
+            after=after,
+            order_by=order_by,
+            include_history=include_history,
+            filters=filters,
         )
-        profile.history.append(history)
-
-        # Use repository to delete the profile
-        return self.profile_repository.delete(profile_id)
 
-    def get_profile(self, profile_id: int) -> Optional[Profile]:
-        """Get a profile by ID."""
-        return self.profile_repository.get_by_id(profile_id)
-
-    def get_profiles(self, skip: int = 0, limit: int = 10) -> List[Profile]:
-        """Get all profiles with pagination."""
-        return self.profile_repository.get_all(skip, limit)
\ No newline at end of file
+    def get_history(
+        self,
+        profile_id: int,
+        limit: int = 10,
+        after: Optional[Tuple] = None,
+        filters: Optional[HistoryFilter] = None,
+    ) -> Optional[List[ProfileHistory]]:
+        """Get a keyset page of a profile's status history; None when it does not exist."""
+        return self.profile_repository.get_history(profile_id, limit, after, filters)
+
+    def search_profiles(
+        self, query: str, limit: int = 10, after: Optional[Tuple] = None
+    ) -> List[Tuple[Profile, float]]:
+        """Rank profiles matching ``query`` by relevance across name, specialty and email."""
+        return self.profile_repository.search(query, limit, after)
+
+    def stream_profiles(self) -> Iterator[Tuple]:
+        """Yield every profile as a plain row, ordered by ID."""
+        return self.profile_repository.stream_rows()
@@ -0,0 +1,221 @@
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from app.entities import Profile
+from app.services.profile_cache import clone_profile
+
+
+class _Call:
+    """A call in flight; followers wait on ``done`` and then read its outcome."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Collapses concurrent calls with the same key into one execution.
+    The first caller (the leader) runs the function; callers arriving while it runs
+    wait for it and share its result or exception instead of running it again.
+    Nothing is kept once the call returns: this deduplicates, it does not cache.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """Run ``fn`` unless a call with ``key`` is in flight; returns (result, shared)."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.executed += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+    def forget(self, key: Hashable) -> None:
+        """Let the next call with ``key`` run anew instead of joining the one in flight."""
+        with self._lock:
+            self._calls.pop(key, None)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "in_flight": len(self._calls),
+                "executed": self.executed,
+                "coalesced": self.coalesced,
+            }
+
+
+class AsyncSingleFlight:
+    """
+    Asyncio counterpart of SingleFlight, for one event loop.
+    If the leader is cancelled (e.g. its client disconnected) the callers waiting
+    on it start over, and one of them runs the function instead.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """Await ``fn`` unless a call with ``key`` is in flight; returns (result, shared)."""
+        while key in self._calls:
+            future = self._calls[key]
+            self.coalesced += 1
+            try:
+                # shield: a follower being cancelled must not cancel the shared call
+                return await asyncio.shield(future), True
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                self.coalesced -= 1
+
+        future = self._calls[key] = asyncio.get_running_loop().create_future()
+        self.executed += 1
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Retrieved here so an exception nobody else awaited is not logged as lost
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+        return result, False
+
+    def forget(self, key: Hashable) -> None:
+        """Let the next call with ``key`` run anew instead of joining the one in flight."""
+        self._calls.pop(key, None)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "in_flight": len(self._calls),
+            "executed": self.executed,
+            "coalesced": self.coalesced,
+        }
+
+
+def _own_copy(profile: Optional[Profile]) -> Optional[Profile]:
+    # Callers mutate what they get (update_profile does), possibly before the followers
+    # resume: the shared result is never handed out, every caller gets its own copy
+    return clone_profile(profile) if profile is not None else None
+
+
+class SingleFlightProfileRepository:
+    """
+    Deduplicates concurrent get_by_id calls for the same profile across requests:
+    one query runs and every caller gets its own copy of the result. Writes forget the
+    profile's call in flight, so reads after a write never join a read from before it.
+    Every other method is delegated to the wrapped repository unchanged.
+    """
+
+    def __init__(self, repository, flights: SingleFlight):
+        self.repository = repository
+        self.flights = flights
+
+    def __getattr__(self, name):
+        return getattr(self.repository, name)
+
+    def get_by_id(self, profile_id: int, include_history: bool = False) -> Optional[Profile]:
+        profile, _ = self.flights.do(
+            (profile_id, include_history),
+            lambda: self.repository.get_by_id(profile_id, include_history=include_history),
+        )
+        return _own_copy(profile)
+
+    def _forget(self, profile_id: int) -> None:
+        self.flights.forget((profile_id, False))
+        self.flights.forget((profile_id, True))
+
+    def update(self, profile: Profile) -> Optional[Profile]:
+        try:
+            return self.repository.update(profile)
+        finally:
+            self._forget(profile.id)
+
+    def patch(self, profile_id: int, changes: Dict) -> Optional[Profile]:
+        try:
+            return self.repository.patch(profile_id, changes)
+        finally:
+            self._forget(profile_id)
+
+    def delete(self, profile_id: int) -> Optional[Profile]:
+        try:
+            return self.repository.delete(profile_id)
+        finally:
+            self._forget(profile_id)
+
+
+class AsyncSingleFlightProfileRepository:
+    """Asyncio counterpart of SingleFlightProfileRepository."""
+
+    def __init__(self, repository, flights: AsyncSingleFlight):
+        self.repository = repository
+        self.flights = flights
+
+    def __getattr__(self, name):
+        return getattr(self.repository, name)
+
+    async def get_by_id(self, profile_id: int, include_history: bool = False) -> Optional[Profile]:
+        profile, _ = await self.flights.do(
+            (profile_id, include_history),
+            lambda: self.repository.get_by_id(profile_id, include_history=include_history),
+        )
+        return _own_copy(profile)
+
+    def _forget(self, profile_id: int) -> None:
+        self.flights.forget((profile_id, False))
+        self.flights.forget((profile_id, True))
+
+    async def update(self, profile: Profile) -> Optional[Profile]:
+        try:
+            return await self.repository.update(profile)
+        finally:
+            self._forget(profile.id)
+
+    async def patch(self, profile_id: int, changes: Dict) -> Optional[Profile]:
+        try:
+            return await self.repository.patch(profile_id, changes)
+        finally:
+            self._forget(profile_id)
+
+    async def delete(self, profile_id: int) -> Optional[Profile]:
+        try:
+            return await self.repository.delete(profile_id)
+        finally:
+            self._forget(profile_id)
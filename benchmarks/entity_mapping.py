@@ -0,0 +1,141 @@
+"""
+Measure the per-row cost of mapping database rows to domain profiles.
+
+Maps synthetic profile rows (and, with history, model-like objects) through
+profile_from_row/map_to_domain and reports, per profile, the best mapping time,
+the memory retained by the resulting objects and the objects only the garbage
+collector's cycle detection could free. The same figures are shown for
+__dict__ entities with a history back-reference, which is what the slotted
+entities replaced.
+
+Usage:
+    python benchmarks/entity_mapping.py [--rows N] [--history N] [--repeat N]
+"""
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# app.config must be imported before app.db
+import app.config  # noqa: E402,F401
+from app.db.profile_dataset import HistoryDistribution, generate_chunk  # noqa: E402
+from app.db.profile_queries import map_to_domain, profile_from_row  # noqa: E402
+from app.entities import PROFILE_FIELDS  # noqa: E402
+
+
+class DictProfile:
+    """Reference: a plain __dict__ profile, as the entities used to be."""
+
+    def __init__(self, id=None, name="", email="", specialty="", linkedin=None,
+                 status=None, start_date=None, end_date=None, history=None):
+        self.id = id
+        self.name = name
+        self.email = email
+        self.specialty = specialty
+        self.linkedin = linkedin
+        self.status = status
+        self.start_date = start_date or datetime.utcnow()
+        self.end_date = end_date
+        self.history = history or []
+
+
+class DictProfileHistory:
+    """Reference: a plain __dict__ history entry pointing back at its profile."""
+
+    def __init__(self, id=None, profile_id=None, status=None, changed_at=None, profile=None):
+        self.id = id
+        self.profile_id = profile_id
+        self.status = status
+        self.changed_at = changed_at or datetime.utcnow()
+        self.profile = profile
+
+
+def dict_map(model, include_history=False):
+    profile = DictProfile(
+        id=model.id, name=model.name, email=model.email, specialty=model.specialty,
+        linkedin=model.linkedin, status=model.status, start_date=model.start_date,
+        end_date=model.end_date,
+    )
+    if include_history:
+        profile.history = [
+            DictProfileHistory(id=h.id, profile_id=h.profile_id, status=h.status,
+                               changed_at=h.changed_at, profile=profile)
+            for h in model.history
+        ]
+    return profile
+
+
+def make_inputs(rows: int, history: int):
+    profiles, entries = generate_chunk(
+        0, 0, 1, rows, rows, HistoryDistribution([history], [1])
+    )
+    tuples = [tuple(p[name] for name in PROFILE_FIELDS) for p in profiles]
+    by_profile = {}
+    for number, entry in enumerate(entries, start=1):
+        by_profile.setdefault(entry["profile_id"], []).append(
+            SimpleNamespace(id=number, **entry)
+        )
+    models = [
+        SimpleNamespace(history=by_profile.get(p["id"], []), **p) for p in profiles
+    ]
+    return tuples, models
+
+
+def measure(mapper, inputs, repeat: int):
+    """(best µs per row, retained bytes per row, cyclic objects per row)."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        mapper(inputs)
+        best = min(best, time.perf_counter() - started)
+
+    gc.collect()
+    tracemalloc.start()
+    mapped = mapper(inputs)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del mapped
+    cyclic = gc.collect()
+    count = len(inputs)
+    return best / count * 1e6, retained / count, cyclic / count
+
+
+def run(rows: int, history: int, repeat: int):
+    tuples, models = make_inputs(rows, history)
+    # The __dict__ reference reads attributes field by field, as the old mapper did
+    cases = [
+        ("rows, slotted", lambda items: [profile_from_row(row) for row in items], tuples),
+        ("rows, __dict__", lambda items: [dict_map(m) for m in items], models),
+    ]
+    if history:
+        cases += [
+            ("history, slotted", lambda items: [map_to_domain(m, True) for m in items], models),
+            ("history, __dict__", lambda items: [dict_map(m, True) for m in items], models),
+        ]
+
+    print(f"{rows} profiles, {history} history entries each, best of {repeat}")
+    print(f"{'mapping':<20}{'µs/row':>10}{'bytes/row':>12}{'cyclic/row':>12}")
+    for name, mapper, inputs in cases:
+        micros, size, cyclic = measure(mapper, inputs, repeat)
+        print(f"{name:<20}{micros:>10.3f}{size:>12.0f}{cyclic:>12.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--history", type=int, default=2,
+                        help="History entries per profile in the history cases (0 skips them)")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    run(args.rows, args.history, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,438 @@
+"""
+Benchmark every /profiles route over HTTP and compare the results with a baseline.
+
+For each database and dataset size, bulk-loads a seeded dataset of profiles with status
+history (app/db/profile_dataset.py), then drives each route in-process (Starlette
+TestClient, no network) and/or through a local uvicorn server. Reports p50/p95/p99
+latency and throughput per route, and fails when a route's p50 (and p95, given enough
+samples) or throughput regresses past the threshold against the stored baseline.
+
+The tables are dropped and reloaded for every size: point --database-url at a
+scratch database.
+
+Usage:
+    python benchmarks/http_suite.py [--database-url URL ...] [--sizes 1k,100k,1M]
+        [--transport inprocess|uvicorn|both] [--requests N] [--concurrency N]
+        [--baseline benchmarks/baseline.json] [--save-baseline] [--threshold 0.25]
+        [--tail-threshold 0.5]
+"""
+import argparse
+import csv
+import io
+import itertools
+import json
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+DEFAULT_BASELINE = os.path.join(ROOT, "benchmarks", "baseline.json")
+
+
+def parse_size(value: str) -> int:
+    """Parse dataset sizes such as 1000, 1k, 100k or 1M."""
+    multipliers = {"k": 1_000, "m": 1_000_000}
+    suffix = value[-1].lower()
+    if suffix in multipliers:
+        return int(float(value[:-1]) * multipliers[suffix])
+    return int(value)
+
+
+def size_label(size: int) -> str:
+    if size >= 1_000_000 and size % 1_000_000 == 0:
+        return f"{size // 1_000_000}M"
+    if size >= 1_000 and size % 1_000 == 0:
+        return f"{size // 1_000}k"
+    return str(size)
+
+
+def load_dataset(engine, size: int, history: str, seed: int) -> None:
+    """Recreate the schema and bulk-load ``size`` generated profiles with their history."""
+    from app.config.database import Base
+    from app.db.profile_dataset import HistoryDistribution, generate_dataset
+
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    generate_dataset(engine, size, seed=seed, history=HistoryDistribution.parse(history))
+
+
+class Scenario:
+    """One route under test; ``call`` issues a single request with a client."""
+
+    def __init__(self, name: str, call: Callable, requests: Optional[int] = None):
+        self.name = name
+        self.call = call
+        self.requests = requests
+
+
+def build_scenarios(size: int, seed: int, requests: int) -> List[Scenario]:
+    """Requests for every /profiles route, in an order where writes find their targets."""
+    from app.db.profile_dataset import FIRST_NAMES, LAST_NAMES, SPECIALTIES
+
+    rng = random.Random(seed)
+    created: List[int] = []
+    sequence = itertools.count()
+    cursor = {"after": None}
+
+    def new_profile(prefix: str) -> Dict:
+        n = next(sequence)
+        return {
+            "name": f"{prefix} {rng.choice(FIRST_NAMES)} {n}",
+            "email": f"{prefix.lower()}{n}.{seed}@bench.example.com",
+            "specialty": rng.choice(SPECIALTIES),
+            "linkedin": f"https://linkedin.com/in/{prefix.lower()}{n}",
+        }
+
+    def get_profile(client):
+        return client.get(f"/profiles/{rng.randint(1, size)}")
+
+    def get_batch(client):
+        ids = ",".join(str(rng.randint(1, size)) for _ in range(50))
+        return client.get("/profiles/batch", params={"ids": ids})
+
+    def list_offset(client):
+        return client.get("/profiles/", params={"skip": rng.randrange(size), "limit": 100})
+
+    def list_keyset(client):
+        params = {"limit": 100, "order_by": "start_date"}
+        if cursor["after"]:
+            params["after"] = cursor["after"]
+        response = client.get("/profiles/", params=params)
+        cursor["after"] = response.headers.get("X-Next-Cursor")
+        return response
+
+    def list_filtered(client):
+        return client.get("/profiles/", params={
+            "status": "ACTIVE",
+            "specialty": rng.choice(SPECIALTIES),
+            "include_deleted": "false",
+            "limit": 50,
+        })
+
+    def search(client):
+        return client.get("/profiles/search", params={"q": rng.choice(LAST_NAMES)[:4]})
+
+    def export(client):
+        return client.get("/profiles/export", params={"format": "ndjson"})
+
+    def create(client):
+        response = client.post("/profiles/", json=new_profile("Create"))
+        created.append(response.json()["id"])
+        return response
+
+    def create_bulk(client):
+        return client.post("/profiles/bulk", json=[new_profile("Bulk") for _ in range(100)])
+
+    def import_csv(client):
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=["name", "email", "specialty", "linkedin"])
+        writer.writeheader()
+        writer.writerows(new_profile("Import") for _ in range(100))
+        files = {"file": ("bench.csv", buffer.getvalue().encode(), "text/csv")}
+        return client.post("/profiles/import", files=files)
+
+    def update(client):
+        profile_id = created[rng.randrange(len(created))]
+        return client.put(f"/profiles/{profile_id}", json={"name": "Updated", "status": "INACTIVE"})
+
+    def patch(client):
+        profile_id = created[rng.randrange(len(created))]
+        return client.patch(f"/profiles/{profile_id}", json={"status": "SUSPENDED"})
+
+    def delete(client):
+        return client.delete(f"/profiles/{created.pop()}")
+
+    # Heavy routes get fewer requests; delete consumes exactly what create produced
+    few = max(requests // 10, 2)
+    return [
+        Scenario("GET /profiles/{profile_id}", get_profile),
+        Scenario("GET /profiles/batch", get_batch),
+        Scenario("GET /profiles/ offset", list_offset),
+        Scenario("GET /profiles/ keyset", list_keyset),
+        Scenario("GET /profiles/ filtered", list_filtered),
+        Scenario("GET /profiles/search", search),
+        Scenario("GET /profiles/export", export, requests=few),
+        Scenario("POST /profiles/", create),
+        Scenario("POST /profiles/bulk", create_bulk, requests=few),
+        Scenario("POST /profiles/import", import_csv, requests=few),
+        Scenario("PUT /profiles/{profile_id}", update),
+        Scenario("PATCH /profiles/{profile_id}", patch),
+        Scenario("DELETE /profiles/{profile_id}", delete),
+    ]
+
+
+def percentile(ordered: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    index = max(0, min(len(ordered) - 1, round(fraction * len(ordered) + 0.5) - 1))
+    return ordered[index]
+
+
+def measure(scenario: Scenario, clients: List, requests: int, warmup: int) -> Dict:
+    def issue(client, timings):
+        started = time.perf_counter()
+        response = scenario.call(client)
+        elapsed = time.perf_counter() - started
+        if response.status_code >= 400:
+            raise RuntimeError(f"{scenario.name}: {response.status_code} {response.text[:200]}")
+        timings.append(elapsed)
+
+    for _ in range(warmup):
+        issue(clients[0], [])
+
+    timings: List[float] = []
+
+    def worker(client, count):
+        for _ in range(count):
+            issue(client, timings)
+
+    shares = [requests // len(clients) + (i < requests % len(clients))
+              for i in range(len(clients))]
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=len(clients)) as pool:
+        for future in [pool.submit(worker, c, n) for c, n in zip(clients, shares)]:
+            future.result()
+    wall = time.perf_counter() - started
+
+    timings.sort()
+    return {
+        "requests": len(timings),
+        "p50_ms": round(percentile(timings, 0.50) * 1000, 3),
+        "p95_ms": round(percentile(timings, 0.95) * 1000, 3),
+        "p99_ms": round(percentile(timings, 0.99) * 1000, 3),
+        "rps": round(len(timings) / wall, 1),
+    }
+
+
+class InProcessTransport:
+    """The FastAPI app in this process, bound to the benchmark engine."""
+
+    name = "inprocess"
+
+    def __init__(self, engine, concurrency: int):
+        from fastapi.testclient import TestClient
+        from sqlalchemy.orm import sessionmaker
+        from app.config.cache import get_profile_cache
+        from app.config.database import get_db
+        from app.main import app
+        from app.services.profile_cache import InMemoryProfileCache
+
+        session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+        def override_get_db():
+            with session_factory() as db:
+                yield db
+
+        cache = InMemoryProfileCache()
+        self.app = app
+        app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_profile_cache] = lambda: cache
+        self.clients = [TestClient(app) for _ in range(concurrency)]
+
+    def close(self):
+        for client in self.clients:
+            client.close()
+        self.app.dependency_overrides.clear()
+
+
+class UvicornTransport:
+    """A uvicorn server in a subprocess, reached over loopback HTTP."""
+
+    name = "uvicorn"
+
+    def __init__(self, database_url: str, concurrency: int):
+        import httpx
+
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        env = dict(os.environ, DATABASE_URL=database_url)
+        self.process = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1",
+             "--port", str(port), "--log-level", "warning", "--no-access-log"],
+            cwd=ROOT,
+            env=env,
+        )
+        base_url = f"http://127.0.0.1:{port}"
+        self.clients = [httpx.Client(base_url=base_url, timeout=120)
+                        for _ in range(concurrency)]
+        self._wait_ready(self.clients[0])
+
+    def _wait_ready(self, client, timeout: float = 60):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError("uvicorn exited before becoming ready")
+            try:
+                if client.get("/readyz").status_code == 200:
+                    return
+            except Exception:
+                pass
+            time.sleep(0.2)
+        self.close()
+        raise RuntimeError("uvicorn did not become ready")
+
+    def close(self):
+        for client in self.clients:
+            client.close()
+        self.process.terminate()
+        self.process.wait(timeout=30)
+
+
+# Fewer samples than this make p95 little more than the slowest request
+MIN_SAMPLES_FOR_P95 = 50
+
+
+def compare(results: Dict, baseline: Dict, threshold: float, tail_threshold: float,
+            min_delta_ms: float) -> List[str]:
+    """
+    Keys whose p50 latency grew by more than ``threshold``, or whose p95 latency grew
+    or throughput fell by more than ``tail_threshold`` (throughput follows the mean,
+    which the slowest requests drag around as much as the tail).
+    """
+    regressions = []
+    for key, current in results.items():
+        previous = baseline.get(key)
+        if previous is None:
+            continue
+        limits = {"p50_ms": threshold}
+        if current["requests"] >= MIN_SAMPLES_FOR_P95:
+            limits["p95_ms"] = tail_threshold
+        for metric, limit in limits.items():
+            slower = current[metric] - previous[metric]
+            if slower > min_delta_ms and current[metric] > previous[metric] * (1 + limit):
+                regressions.append(f"{key}: {metric} {previous[metric]} -> {current[metric]}")
+        if current["rps"] < previous["rps"] * (1 - tail_threshold):
+            regressions.append(f"{key}: throughput {previous['rps']} -> {current['rps']} req/s")
+    return regressions
+
+
+def print_table(results: Dict, baseline: Dict) -> None:
+    print(f"{'benchmark':<62}{'n':>6}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+          f"{'req/s':>10}{'Δp50':>9}")
+    for key, r in results.items():
+        previous = baseline.get(key)
+        delta = (f"{(r['p50_ms'] / previous['p50_ms'] - 1) * 100:+.0f}%"
+                 if previous and previous["p50_ms"] else "")
+        print(f"{key:<62}{r['requests']:>6}{r['p50_ms']:>10.2f}{r['p95_ms']:>10.2f}"
+              f"{r['p99_ms']:>10.2f}{r['rps']:>10.1f}{delta:>9}")
+
+
+def run(args, database_url: str, results: Dict) -> None:
+    from sqlalchemy import create_engine
+    from sqlalchemy.engine import make_url
+
+    dialect = make_url(database_url).get_backend_name()
+    engine = create_engine(database_url)
+    transports = ["inprocess", "uvicorn"] if args.transport == "both" else [args.transport]
+    try:
+        for size in args.sizes:
+            started = time.perf_counter()
+            load_dataset(engine, size, args.history, args.seed)
+            print(f"📦 {dialect}: {size_label(size)} profiles loaded in "
+                  f"{time.perf_counter() - started:.1f}s")
+            for name in transports:
+                transport = (InProcessTransport(engine, args.concurrency) if name == "inprocess"
+                             else UvicornTransport(database_url, args.concurrency))
+                try:
+                    for scenario in build_scenarios(size, args.seed, args.requests):
+                        requests = scenario.requests or args.requests
+                        key = f"{name}/{dialect}/{size_label(size)}/{scenario.name}"
+                        results[key] = measure(
+                            scenario, transport.clients, requests, min(args.warmup, requests)
+                        )
+                finally:
+                    transport.close()
+    finally:
+        engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--database-url", action="append",
+                        help="Repeat to benchmark several databases; "
+                             "defaults to a throwaway SQLite file")
+    parser.add_argument("--sizes", default="1k",
+                        type=lambda value: [parse_size(v) for v in value.split(",")],
+                        help="Comma-separated dataset sizes, e.g. 1k,100k,1M")
+    parser.add_argument("--history", default="3",
+                        help='History entries per profile: "3" or "count:weight,..."')
+    parser.add_argument("--transport", choices=["inprocess", "uvicorn", "both"],
+                        default="inprocess")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per route")
+    parser.add_argument("--warmup", type=int, default=10, help="Unmeasured requests per route")
+    parser.add_argument("--concurrency", type=int, default=1, help="Concurrent clients")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="Store these results in the baseline instead of comparing")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Allowed relative p50 latency regression")
+    parser.add_argument("--tail-threshold", type=float, default=0.5,
+                        help="Allowed relative p95 latency/throughput regression")
+    parser.add_argument("--min-delta-ms", type=float, default=1.0,
+                        help="Ignore latency regressions smaller than this (timer noise)")
+    parser.add_argument("--output", help="Also write the results to this JSON file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        urls = args.database_url or [f"sqlite:///{os.path.join(directory, 'bench.db')}"]
+        # The app builds its engine at import time, and log lines would skew the timings
+        os.environ.setdefault("DATABASE_URL", urls[0])
+        os.environ.setdefault("DB_SLOW_QUERY_MS", "0")
+        os.environ.setdefault("DB_N_PLUS_ONE_THRESHOLD", "0")
+
+        results: Dict = {}
+        for url in urls:
+            run(args, url, results)
+
+    stored = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            stored = json.load(f)
+    baseline = stored.get("results", {})
+
+    print_table(results, {} if args.save_baseline else baseline)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"results": results}, f, indent=2)
+
+    if args.save_baseline:
+        stored["meta"] = {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "recorded": datetime.now().isoformat(timespec="seconds"),
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+        }
+        stored["results"] = {**baseline, **results}
+        with open(args.baseline, "w") as f:
+            json.dump(stored, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"💾 Baseline saved to {args.baseline}")
+        return
+
+    regressions = compare(
+        results, baseline, args.threshold, args.tail_threshold, args.min_delta_ms
+    )
+    if regressions:
+        print("❌ Regressions against the baseline:")
+        for line in regressions:
+            print(f"  {line}")
+        sys.exit(1)
+    if baseline:
+        print("✅ No regressions against the baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Measure the database round trips and latency of profile writes.
+
+Runs create, update and delete through ProfileService/ProfileRepository and
+reports, per operation, the SQL statements sent, the commits issued and the
+mean wall time.
+
+Usage:
+    python benchmarks/write_roundtrips.py [--database-url URL] [--iterations N]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# app.config must be imported before app.db
+from app.config.database import Base  # noqa: E402
+from app.db import ProfileRepository  # noqa: E402
+from app.entities import ProfileStatus  # noqa: E402
+from app.services import ProfileService  # noqa: E402
+from sqlalchemy import create_engine, event  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+
+class RoundTripCounter:
+    """Count statements and commits sent through an engine."""
+
+    def __init__(self, engine):
+        self.statements = 0
+        self.commits = 0
+        event.listen(engine, "before_cursor_execute", self._on_statement)
+        event.listen(engine, "commit", self._on_commit)
+
+    def _on_statement(self, *args):
+        self.statements += 1
+
+    def _on_commit(self, *args):
+        self.commits += 1
+
+    def reset(self):
+        self.statements = 0
+        self.commits = 0
+
+
+def run(database_url: str, iterations: int):
+    engine = create_engine(database_url)
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    counter = RoundTripCounter(engine)
+
+    results = {name: {"statements": 0, "commits": 0, "seconds": 0.0}
+               for name in ("create", "update", "delete")}
+
+    def measure(name, operation):
+        counter.reset()
+        started = time.perf_counter()
+        value = operation()
+        results[name]["seconds"] += time.perf_counter() - started
+        results[name]["statements"] += counter.statements
+        results[name]["commits"] += counter.commits
+        return value
+
+    for _ in range(iterations):
+        with session_factory() as db:
+            service = ProfileService(ProfileRepository(db))
+            email = f"bench_{uuid.uuid4().hex}@example.com"
+            profile = measure(
+                "create", lambda: service.create_profile("Bench", email, "Benchmarks")
+            )
+            measure(
+                "update",
+                lambda: service.update_profile(profile, status=ProfileStatus.INACTIVE),
+            )
+            measure("delete", lambda: service.delete_profile(profile.id))
+
+    engine.dispose()
+
+    print(f"{'operation':<10}{'statements':>12}{'commits':>10}{'mean ms':>10}")
+    for name, totals in results.items():
+        print(
+            f"{name:<10}"
+            f"{totals['statements'] / iterations:>12.1f}"
+            f"{totals['commits'] / iterations:>10.1f}"
+            f"{totals['seconds'] / iterations * 1000:>10.3f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--database-url", help="Defaults to a throwaway SQLite file")
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    if args.database_url:
+        run(args.database_url, args.iterations)
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        run(f"sqlite:///{os.path.join(directory, 'bench.db')}", args.iterations)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+# Archive, prune and compact profile_history; meant to run periodically (cron, k8s CronJob)
+# Example: python compact_history.py --retention-days 180 --vacuum
+import argparse
+import json
+import logging
+import sys
+import time
+
+from app.config.database import DATABASE_URL
+from app.config.history import (
+    HISTORY_ARCHIVE_DIR,
+    HISTORY_PARTITION_MONTHS_AHEAD,
+    HISTORY_RETENTION_DAYS,
+)
+from app.db.history_retention import run_retention
+from sqlalchemy import create_engine
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Archive history older than the retention period and compact the rest."
+    )
+    parser.add_argument("--retention-days", type=int, default=HISTORY_RETENTION_DAYS,
+                        help="Days of history kept in the database; 0 keeps everything")
+    parser.add_argument("--archive-dir", default=HISTORY_ARCHIVE_DIR,
+                        help="Where the removed entries are written as .csv.gz")
+    parser.add_argument("--months-ahead", type=int, default=HISTORY_PARTITION_MONTHS_AHEAD,
+                        help="Monthly partitions created in advance (PostgreSQL)")
+    parser.add_argument("--no-compact", action="store_true",
+                        help="Keep consecutive entries with the same status")
+    parser.add_argument("--vacuum", action="store_true",
+                        help="VACUUM afterwards so the freed space shows up in the report")
+    parser.add_argument("--database-url", default=DATABASE_URL,
+                        help="Defaults to DATABASE_URL")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+
+    print("⏳ Compactando el historial de perfiles...", file=sys.stderr)
+    engine = create_engine(args.database_url)
+    started = time.perf_counter()
+    try:
+        summary = run_retention(
+            engine, args.retention_days, args.archive_dir, months_ahead=args.months_ahead,
+            compact=not args.no_compact, vacuum=args.vacuum,
+        )
+    finally:
+        engine.dispose()
+
+    summary["seconds"] = round(time.perf_counter() - started, 1)
+    json.dump(summary, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
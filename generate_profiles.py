@@ -0,0 +1,60 @@
+# Populate the database with synthetic profiles and history for load testing
+# Example: python generate_profiles.py 1000000 --seed 7 --history "0:20,1:50,5:30"
+import argparse
+import json
+import sys
+import time
+
+from app.config.database import DATABASE_URL
+from app.db.profile_dataset import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_HISTORY_DISTRIBUTION,
+    HistoryDistribution,
+    generate_dataset,
+)
+from sqlalchemy import create_engine
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Bulk-load N deterministic synthetic profiles; reruns resume."
+    )
+    parser.add_argument("count", type=int, help="Number of profiles to generate")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="Same seed, chunk size and first id give the same rows")
+    parser.add_argument("--history", default=DEFAULT_HISTORY_DISTRIBUTION,
+                        help='History entries per profile: "3" or "count:weight,..."')
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="Profiles loaded per transaction")
+    parser.add_argument("--first-id", type=int, default=1,
+                        help="Id of the first generated profile")
+    parser.add_argument("--database-url", default=DATABASE_URL,
+                        help="Defaults to DATABASE_URL; run `alembic upgrade head` first")
+    args = parser.parse_args(argv)
+
+    try:
+        history = HistoryDistribution.parse(args.history)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    def report(loaded: int, total: int) -> None:
+        print(f"⏳ {loaded}/{total} perfiles", file=sys.stderr)
+
+    engine = create_engine(args.database_url)
+    started = time.perf_counter()
+    try:
+        summary = generate_dataset(
+            engine, args.count, seed=args.seed, history=history, chunk_size=args.chunk_size,
+            first_id=args.first_id, progress=report,
+        )
+    finally:
+        engine.dispose()
+
+    summary["seconds"] = round(time.perf_counter() - started, 1)
+    json.dump(summary, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
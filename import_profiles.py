@@ -0,0 +1,43 @@
+# Bulk-import profiles from a CSV or NDJSON file, bypassing the HTTP layer
+# Example: python import_profiles.py roster.csv --batch-size 2000
+import argparse
+import json
+import sys
+
+from app.config.database import SessionLocal
+from app.api.profile_api import ProfileApi
+from app.api.profile_import import ImportFormat, detect_format
+from app.db.profile_repository import ProfileRepository
+from app.services.profile_import import DEFAULT_IMPORT_BATCH_SIZE
+from app.services.profile_service import ProfileService
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Upsert profiles by email from a CSV/NDJSON file.")
+    parser.add_argument("path", help="CSV (with header) or NDJSON file to import")
+    parser.add_argument("--format", choices=ImportFormat.__args__, default=None,
+                        help="File format; inferred from the extension when omitted")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_IMPORT_BATCH_SIZE,
+                        help="Rows upserted per transaction")
+    args = parser.parse_args(argv)
+
+    try:
+        import_format = detect_format(args.path, args.format)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    db = SessionLocal()
+    try:
+        profile_api = ProfileApi(ProfileService(ProfileRepository(db)))
+        with open(args.path, "rb") as upload:
+            report = profile_api.import_profiles(upload, import_format, args.batch_size)
+    finally:
+        db.close()
+
+    json.dump(report.to_dict(), sys.stdout, indent=2, ensure_ascii=False)
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
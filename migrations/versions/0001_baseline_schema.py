@@ -0,0 +1,70 @@
+"""Baseline schema: profiles and profile_history
+
+Databases created before migrations existed (by Base.metadata.create_all at startup)
+already have these tables; they are adopted as-is, so this revision is safe to run
+against both an empty and an existing database.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+# Enum member names, as stored by SQLAlchemy's Enum(ProfileStatus)
+STATUSES = ("ACTIVE", "INACTIVE", "SUSPENDED", "DELETED")
+
+
+def status_type() -> sa.types.TypeEngine:
+    """The shared profilestatus type; on PostgreSQL it is created once, up front."""
+    return sa.Enum(*STATUSES, name="profilestatus").with_variant(
+        postgresql.ENUM(*STATUSES, name="profilestatus", create_type=False), "postgresql"
+    )
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    # Offline (--sql) runs cannot inspect the database and emit the full schema
+    offline = op.get_context().as_sql
+    existing = set() if offline else set(sa.inspect(bind).get_table_names())
+
+    if bind.dialect.name == "postgresql":
+        postgresql.ENUM(*STATUSES, name="profilestatus").create(bind, checkfirst=not offline)
+
+    if "profiles" not in existing:
+        op.create_table(
+            "profiles",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("name", sa.String(), nullable=False),
+            sa.Column("email", sa.String(), nullable=False, unique=True),
+            sa.Column("specialty", sa.String(), nullable=False),
+            sa.Column("linkedin", sa.String(), nullable=True),
+            sa.Column("status", status_type(), nullable=False),
+            sa.Column("start_date", sa.DateTime(), nullable=False),
+            sa.Column("end_date", sa.DateTime(), nullable=True),
+        )
+        op.create_index("ix_profiles_id", "profiles", ["id"])
+
+    if "profile_history" not in existing:
+        op.create_table(
+            "profile_history",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("profile_id", sa.Integer(), sa.ForeignKey("profiles.id"), nullable=False),
+            sa.Column("status", status_type(), nullable=False),
+            sa.Column("changed_at", sa.DateTime(), nullable=False),
+        )
+        op.create_index("ix_profile_history_id", "profile_history", ["id"])
+
+
+def downgrade() -> None:
+    op.drop_table("profile_history")
+    op.drop_table("profiles")
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        postgresql.ENUM(name="profilestatus").drop(bind, checkfirst=not op.get_context().as_sql)
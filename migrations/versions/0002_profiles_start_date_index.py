@@ -0,0 +1,28 @@
+"""Index profiles on (start_date, id) for keyset pagination
+
+create_all never adds indexes to tables that already exist, so databases created
+before this index was declared on the model do not have it yet.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if not op.get_context().as_sql:
+        inspector = sa.inspect(op.get_bind())
+        if "ix_profiles_start_date_id" in {i["name"] for i in inspector.get_indexes("profiles")}:
+            return
+    op.create_index("ix_profiles_start_date_id", "profiles", ["start_date", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_profiles_start_date_id", table_name="profiles")
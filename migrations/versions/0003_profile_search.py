@@ -0,0 +1,81 @@
+"""Full-text search over profiles
+
+PostgreSQL: a generated, weighted tsvector column with a GIN index, plus a trigram
+GIN index (pg_trgm) for typo-tolerant matching. SQLite: an FTS5 table kept in sync
+with profiles by triggers.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+SEARCH_TEXT = "(name || ' ' || specialty || ' ' || email)"
+
+POSTGRESQL_UPGRADE = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "ALTER TABLE profiles ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS ("
+    "setweight(to_tsvector('simple', coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(specialty, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(email, '')), 'C')) STORED",
+    "CREATE INDEX IF NOT EXISTS ix_profiles_search_vector ON profiles USING gin (search_vector)",
+    "CREATE INDEX IF NOT EXISTS ix_profiles_search_trgm ON profiles "
+    f"USING gin ({SEARCH_TEXT} gin_trgm_ops)",
+]
+
+POSTGRESQL_DOWNGRADE = [
+    "DROP INDEX IF EXISTS ix_profiles_search_trgm",
+    "DROP INDEX IF EXISTS ix_profiles_search_vector",
+    "ALTER TABLE profiles DROP COLUMN IF EXISTS search_vector",
+]
+
+SQLITE_UPGRADE = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS profiles_fts USING fts5("
+    "name, specialty, email, content='profiles', content_rowid='id')",
+    "CREATE TRIGGER IF NOT EXISTS profiles_fts_insert AFTER INSERT ON profiles BEGIN "
+    "INSERT INTO profiles_fts (rowid, name, specialty, email) "
+    "VALUES (new.id, new.name, new.specialty, new.email); END",
+    "CREATE TRIGGER IF NOT EXISTS profiles_fts_delete AFTER DELETE ON profiles BEGIN "
+    "INSERT INTO profiles_fts (profiles_fts, rowid, name, specialty, email) "
+    "VALUES ('delete', old.id, old.name, old.specialty, old.email); END",
+    "CREATE TRIGGER IF NOT EXISTS profiles_fts_update AFTER UPDATE ON profiles BEGIN "
+    "INSERT INTO profiles_fts (profiles_fts, rowid, name, specialty, email) "
+    "VALUES ('delete', old.id, old.name, old.specialty, old.email); "
+    "INSERT INTO profiles_fts (rowid, name, specialty, email) "
+    "VALUES (new.id, new.name, new.specialty, new.email); END",
+    # Index the rows that already exist
+    "INSERT INTO profiles_fts (profiles_fts) VALUES ('rebuild')",
+]
+
+SQLITE_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS profiles_fts_update",
+    "DROP TRIGGER IF EXISTS profiles_fts_delete",
+    "DROP TRIGGER IF EXISTS profiles_fts_insert",
+    "DROP TABLE IF EXISTS profiles_fts",
+]
+
+
+def _run(statements) -> None:
+    for statement in statements:
+        op.execute(statement)
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        _run(POSTGRESQL_UPGRADE)
+    elif dialect == "sqlite":
+        _run(SQLITE_UPGRADE)
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        _run(POSTGRESQL_DOWNGRADE)
+    elif dialect == "sqlite":
+        _run(SQLITE_DOWNGRADE)
@@ -0,0 +1,44 @@
+"""Indexes for filtered profile listings
+
+A composite index on (status, specialty) for the status/specialty filters, and a
+partial index on (start_date, id) that leaves out DELETED profiles for listings
+that exclude them.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+NOT_DELETED = sa.text("status <> 'DELETED'")
+
+
+def _existing_indexes() -> set:
+    if op.get_context().as_sql:
+        return set()
+    return {index["name"] for index in sa.inspect(op.get_bind()).get_indexes("profiles")}
+
+
+def upgrade() -> None:
+    existing = _existing_indexes()
+    if "ix_profiles_status_specialty" not in existing:
+        op.create_index("ix_profiles_status_specialty", "profiles", ["status", "specialty"])
+    if "ix_profiles_live_start_date_id" not in existing:
+        op.create_index(
+            "ix_profiles_live_start_date_id",
+            "profiles",
+            ["start_date", "id"],
+            postgresql_where=NOT_DELETED,
+            sqlite_where=NOT_DELETED,
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_profiles_live_start_date_id", table_name="profiles")
+    op.drop_index("ix_profiles_status_specialty", table_name="profiles")
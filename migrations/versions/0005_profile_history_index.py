@@ -0,0 +1,37 @@
+"""Index for the paginated status history
+
+A composite index on profile_history (profile_id, changed_at, id): the history
+of one profile is read in changed_at order straight from the index, and id
+breaks ties for the keyset cursor. It also serves the lookups by profile_id
+that had no index before.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def _existing_indexes() -> set:
+    if op.get_context().as_sql:
+        return set()
+    return {index["name"] for index in sa.inspect(op.get_bind()).get_indexes("profile_history")}
+
+
+def upgrade() -> None:
+    if "ix_profile_history_profile_id_changed_at" not in _existing_indexes():
+        op.create_index(
+            "ix_profile_history_profile_id_changed_at",
+            "profile_history",
+            ["profile_id", "changed_at", "id"],
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_profile_history_profile_id_changed_at", table_name="profile_history")
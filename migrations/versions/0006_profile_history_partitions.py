@@ -0,0 +1,109 @@
+"""Partition profile_history by month on PostgreSQL
+
+profile_history becomes a table partitioned by range of changed_at, with one
+partition per month from its oldest row to three months ahead and a default
+partition for anything else. Retention then drops whole months instead of
+deleting rows (compact_history.py creates the upcoming partitions). The primary
+key becomes (id, changed_at), as PostgreSQL requires the partition key in it;
+ids still come from the same sequence. Other databases keep a plain table.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+POSTGRESQL_UPGRADE = [
+    "ALTER TABLE profile_history RENAME TO profile_history_unpartitioned",
+    # The sequence must outlive the old table
+    "ALTER SEQUENCE profile_history_id_seq OWNED BY NONE",
+    "CREATE TABLE profile_history ("
+    "id integer NOT NULL DEFAULT nextval('profile_history_id_seq'), "
+    "profile_id integer NOT NULL, "
+    "status profilestatus NOT NULL, "
+    "changed_at timestamp without time zone NOT NULL"
+    ") PARTITION BY RANGE (changed_at)",
+    """
+    DO $$
+    DECLARE
+        month date;
+        last_month date := (date_trunc('month', now()) + interval '3 months')::date;
+    BEGIN
+        SELECT date_trunc('month', coalesce(min(changed_at), now()))::date INTO month
+        FROM profile_history_unpartitioned;
+        WHILE month <= last_month LOOP
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF profile_history FOR VALUES FROM (%L) TO (%L)',
+                'profile_history_p' || to_char(month, 'YYYYMM'),
+                month,
+                (month + interval '1 month')::date
+            );
+            month := (month + interval '1 month')::date;
+        END LOOP;
+    END $$
+    """,
+    "CREATE TABLE profile_history_default PARTITION OF profile_history DEFAULT",
+    "INSERT INTO profile_history (id, profile_id, status, changed_at) "
+    "SELECT id, profile_id, status, changed_at FROM profile_history_unpartitioned",
+    "DROP TABLE profile_history_unpartitioned",
+    "ALTER SEQUENCE profile_history_id_seq OWNED BY profile_history.id",
+    "ALTER TABLE profile_history ADD CONSTRAINT profile_history_pkey "
+    "PRIMARY KEY (id, changed_at)",
+    "ALTER TABLE profile_history ADD CONSTRAINT profile_history_profile_id_fkey "
+    "FOREIGN KEY (profile_id) REFERENCES profiles (id)",
+    "CREATE INDEX ix_profile_history_id ON profile_history (id)",
+    "CREATE INDEX ix_profile_history_profile_id_changed_at "
+    "ON profile_history (profile_id, changed_at, id)",
+]
+
+POSTGRESQL_DOWNGRADE = [
+    "ALTER TABLE profile_history RENAME TO profile_history_partitioned",
+    "ALTER SEQUENCE profile_history_id_seq OWNED BY NONE",
+    "CREATE TABLE profile_history_plain ("
+    "id integer NOT NULL DEFAULT nextval('profile_history_id_seq'), "
+    "profile_id integer NOT NULL, "
+    "status profilestatus NOT NULL, "
+    "changed_at timestamp without time zone NOT NULL)",
+    "INSERT INTO profile_history_plain (id, profile_id, status, changed_at) "
+    "SELECT id, profile_id, status, changed_at FROM profile_history_partitioned",
+    # Dropping the partitioned table drops its partitions and frees the index names
+    "DROP TABLE profile_history_partitioned",
+    "ALTER TABLE profile_history_plain RENAME TO profile_history",
+    "ALTER SEQUENCE profile_history_id_seq OWNED BY profile_history.id",
+    "ALTER TABLE profile_history ADD CONSTRAINT profile_history_pkey PRIMARY KEY (id)",
+    "ALTER TABLE profile_history ADD CONSTRAINT profile_history_profile_id_fkey "
+    "FOREIGN KEY (profile_id) REFERENCES profiles (id)",
+    "CREATE INDEX ix_profile_history_id ON profile_history (id)",
+    "CREATE INDEX ix_profile_history_profile_id_changed_at "
+    "ON profile_history (profile_id, changed_at, id)",
+]
+
+
+def _is_partitioned(bind) -> bool:
+    if op.get_context().as_sql:
+        return False
+    return bind.exec_driver_sql(
+        "SELECT 1 FROM pg_partitioned_table WHERE partrelid = 'profile_history'::regclass"
+    ).first() is not None
+
+
+def _run(statements) -> None:
+    for statement in statements:
+        op.execute(statement)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql" and not _is_partitioned(bind):
+        _run(POSTGRESQL_UPGRADE)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        _run(POSTGRESQL_DOWNGRADE)
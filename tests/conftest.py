@@ -1,18 +1,30 @@
+import asyncio
 import os
 import pytest
-from sqlalchemy import create_engine
+from fastapi import FastAPI
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from fastapi.testclient import TestClient
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool, StaticPool
 
+from app.api.async_routes import router as async_router
+from app.config.async_database import get_async_db
+from app.config.cache import get_profile_cache
 from app.config.database import Base, get_db
+from app.config.query_stats import query_budget as enforce_query_budget
+from app.api.metrics import MetricsMiddleware
 from app.main import app
 from app.db.profile_models import Profile
 from app.entities import ProfileStatus
+from app.services.profile_cache import InMemoryProfileCache
 
 # Test database URL - using SQLite in-memory database for tests
 TEST_DATABASE_URL = "sqlite:///./test.db"
 
+# aiosqlite stand-in for the async (DB_ASYNC=true) request path
+TEST_ASYNC_DATABASE_URL = "sqlite+aiosqlite:///./test_async.db"
+
 
 @pytest.fixture(scope="session")
 def test_engine():
@@ -51,7 +63,46 @@ def db_session(test_engine):
 
 
 @pytest.fixture(scope="function")
-def client(db_session):
+def query_counter(test_engine):
+    """Collect the SQL statements executed against the test engine."""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(test_engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(test_engine, "before_cursor_execute", record)
+
+
+@pytest.fixture(scope="function")
+def query_budget():
+    """
+    Fail any request served inside ``with query_budget(n):`` that runs more than n SQL
+    statements, listing the statements it ran.
+    """
+    return enforce_query_budget
+
+
+@pytest.fixture(autouse=True)
+def query_budget_marker(request):
+    """Apply ``@pytest.mark.query_budget(n)`` to every request made by the test."""
+    marker = request.node.get_closest_marker("query_budget")
+    if marker is None:
+        yield
+        return
+    with enforce_query_budget(marker.args[0]):
+        yield
+
+
+@pytest.fixture(scope="function")
+def profile_cache():
+    """A fresh profile cache, so entries never leak between tests."""
+    return InMemoryProfileCache()
+
+
+@pytest.fixture(scope="function")
+def client(db_session, profile_cache):
     """Create a test client for the FastAPI app."""
 
     def override_get_db():
@@ -61,6 +112,7 @@ def client(db_session):
             pass
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_profile_cache] = lambda: profile_cache
     with TestClient(app) as test_client:
         yield test_client
 
@@ -68,6 +120,51 @@ def client(db_session):
     app.dependency_overrides.clear()
 
 
+@pytest.fixture(scope="session")
+def async_test_engine():
+    """Create an aiosqlite engine for testing the async stack."""
+    if os.path.exists("./test_async.db"):
+        os.remove("./test_async.db")
+
+    # NullPool: every TestClient runs its own event loop, so connections are not reused
+    engine = create_async_engine(TEST_ASYNC_DATABASE_URL, poolclass=NullPool)
+
+    async def create_tables():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    asyncio.run(create_tables())
+
+    yield engine
+
+    asyncio.run(engine.dispose())
+    if os.path.exists("./test_async.db"):
+        os.remove("./test_async.db")
+
+
+@pytest.fixture(scope="function")
+def async_session_factory(async_test_engine):
+    """Session factory bound to the aiosqlite test engine."""
+    return async_sessionmaker(async_test_engine, autoflush=False, expire_on_commit=False)
+
+
+@pytest.fixture(scope="function")
+def async_client(async_session_factory, profile_cache):
+    """Create a test client for an app serving the async routes."""
+    async_app = FastAPI()
+    async_app.add_middleware(MetricsMiddleware)
+    async_app.include_router(async_router)
+
+    async def override_get_async_db():
+        async with async_session_factory() as db:
+            yield db
+
+    async_app.dependency_overrides[get_async_db] = override_get_async_db
+    async_app.dependency_overrides[get_profile_cache] = lambda: profile_cache
+    with TestClient(async_app) as test_client:
+        yield test_client
+
+
 @pytest.fixture(scope="function")
 def test_profile(db_session, request):
     """Create a test profile for testing."""
@@ -86,4 +183,14 @@ def test_profile(db_session, request):
     db_session.add(profile)
     db_session.commit()
     db_session.refresh(profile)
-    return profile
+    # Detach it: the repository writes with Core statements that bypass the identity map
+    db_session.expunge(profile)
+    profile_id = profile.id
+    yield profile
+
+    # Remove the profile (and its history) so the shared database stays small
+    db_session.rollback()
+    leftover = db_session.query(Profile).filter(Profile.id == profile_id).first()
+    if leftover:
+        db_session.delete(leftover)
+        db_session.commit()
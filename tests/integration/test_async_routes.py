@@ -0,0 +1,325 @@
+import uuid
+import pytest
+from sqlalchemy import event
+from app.entities import ProfileStatus
+
+
+def test_async_create_and_get_profile(async_client):
+    """Test creating and reading a profile through the async routes."""
+    profile_data = {
+        "name": "Async User",
+        "email": f"async_{uuid.uuid4()}@example.com",
+        "specialty": "Asyncio",
+        "linkedin": "https://linkedin.com/in/asyncuser",
+    }
+
+    response = async_client.post("/profiles/", json=profile_data)
+    assert response.status_code == 200
+    created = response.json()
+    assert created["email"] == profile_data["email"]
+    assert created["status"] == ProfileStatus.ACTIVE.value
+
+    response = async_client.get(f"/profiles/{created['id']}")
+    assert response.status_code == 200
+    assert response.json()["name"] == "Async User"
+
+    response = async_client.get("/profiles/999999")
+    assert response.status_code == 404
+
+
+def test_async_get_profiles_keyset(async_client, async_test_engine):
+    """Test offset and keyset pagination through the async routes."""
+    for i in range(3):
+        async_client.post(
+            "/profiles/",
+            json={
+                "name": f"Async Page {i}",
+                "email": f"async_page_{i}_{uuid.uuid4()}@example.com",
+                "specialty": "Asyncio",
+            },
+        )
+
+    response = async_client.get("/profiles/?skip=0&limit=1")
+    assert response.status_code == 200
+    assert len(response.json()) == 1
+
+    # Walk all pages with the cursor, counting statements per page
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(async_test_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        seen = []
+        response = async_client.get("/profiles/?limit=2")
+        pages = 1
+        while response.headers.get("X-Next-Cursor"):
+            seen.extend(p["id"] for p in response.json())
+            response = async_client.get(
+                f"/profiles/?limit=2&after={response.headers['X-Next-Cursor']}"
+            )
+            pages += 1
+        seen.extend(p["id"] for p in response.json())
+    finally:
+        event.remove(async_test_engine.sync_engine, "before_cursor_execute", record)
+
+    assert len(seen) == len(set(seen)) >= 3
+    assert len(statements) == pages
+
+
+def test_async_update_and_delete_profile(async_client):
+    """Test updating and deleting a profile through the async routes."""
+    created = async_client.post(
+        "/profiles/",
+        json={"name": "Async Update", "email": f"async_upd_{uuid.uuid4()}@example.com",
+              "specialty": "Asyncio"},
+    ).json()
+
+    response = async_client.put(
+        f"/profiles/{created['id']}", json={"name": "Async Updated", "status": "INACTIVE"}
+    )
+    assert response.status_code == 200
+    assert response.json()["name"] == "Async Updated"
+    assert response.json()["status"] == ProfileStatus.INACTIVE.value
+
+    response = async_client.delete(f"/profiles/{created['id']}")
+    assert response.status_code == 200
+    assert async_client.get(f"/profiles/{created['id']}").status_code == 404
+    assert async_client.delete(f"/profiles/{created['id']}").status_code == 404
+    assert async_client.put("/profiles/999999", json={"name": "x"}).status_code == 404
+
+
+def test_async_create_profiles_bulk(async_client):
+    """Test bulk creation through the async routes."""
+    email = f"async_bulk_{uuid.uuid4()}@example.com"
+    payload = [
+        {"name": "Async Bulk", "email": email, "specialty": "Bulk"},
+        {"name": "Async Bulk Dup", "email": email, "specialty": "Bulk"},
+    ]
+
+    data = async_client.post("/profiles/bulk", json=payload).json()
+    assert data["created"] == 1
+    assert data["conflicts"] == 1
+
+    # The same email is now a conflict against the table
+    data = async_client.post("/profiles/bulk", json=payload[:1]).json()
+    assert data["results"][0]["status"] == "conflict"
+
+
+def test_async_export_profiles(async_client):
+    """Test streaming the export through the async routes."""
+    import json
+
+    created = async_client.post(
+        "/profiles/",
+        json={"name": "Async Export", "email": f"async_exp_{uuid.uuid4()}@example.com",
+              "specialty": "Export"},
+    ).json()
+
+    response = async_client.get("/profiles/export")
+    assert response.status_code == 200
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert created in rows
+
+    response = async_client.get("/profiles/export?format=csv")
+    assert response.text.splitlines()[0] == (
+        "id,name,email,specialty,linkedin,status,start_date,end_date"
+    )
+
+
+def test_async_import_profiles(async_client):
+    """Test importing a CSV upload through the async routes."""
+    email = f"async_import_{uuid.uuid4()}@example.com"
+    body = f"name,email,specialty\nAsync Import,{email},Imports\n".encode()
+
+    report = async_client.post(
+        "/profiles/import", files={"file": ("roster.csv", body, "text/csv")}
+    ).json()
+    assert report == {"inserted": 1, "updated": 0, "skipped": 0, "rejected": 0, "errors": []}
+
+    report = async_client.post(
+        "/profiles/import", files={"file": ("roster.csv", body, "text/csv")}
+    ).json()
+    assert report["updated"] == 1
+
+
+def test_async_import_rejects_lines_that_are_not_utf8(async_client):
+    """Test that the async import reports a non-UTF-8 line instead of failing."""
+    email = f"async_latin_{uuid.uuid4()}@example.com"
+    body = b"name,email,specialty\nJos\xe9,bad@example.com,Imports\n" + (
+        f"Async Latin,{email},Imports\n".encode()
+    )
+
+    response = async_client.post(
+        "/profiles/import", files={"file": ("roster.csv", body, "text/csv")}
+    )
+    assert response.status_code == 200
+    report = response.json()
+    assert (report["inserted"], report["rejected"]) == (1, 1)
+    assert report["errors"][0]["line"] == 2
+
+
+def test_async_conditional_get(async_client):
+    """Test If-None-Match through the async routes."""
+    created = async_client.post(
+        "/profiles/",
+        json={"name": "Async Etag", "email": f"async_etag_{uuid.uuid4()}@example.com",
+              "specialty": "Caching"},
+    ).json()
+
+    etag = async_client.get(f"/profiles/{created['id']}").headers["ETag"]
+    response = async_client.get(f"/profiles/{created['id']}", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    etag = async_client.get("/profiles/").headers["ETag"]
+    assert async_client.get("/profiles/", headers={"If-None-Match": etag}).status_code == 304
+
+
+@pytest.mark.query_budget(2)
+def test_async_patch_profile(async_client):
+    """Test PATCH through the async routes."""
+    created = async_client.post(
+        "/profiles/",
+        json={"name": "Async Patch", "email": f"async_patch_{uuid.uuid4()}@example.com",
+              "specialty": "Patching"},
+    ).json()
+
+    response = async_client.patch(f"/profiles/{created['id']}", json={"status": "inactive"})
+    assert response.status_code == 200
+    assert response.json()["status"] == ProfileStatus.INACTIVE.value
+    assert response.json()["specialty"] == "Patching"
+
+    response = async_client.patch(f"/profiles/{created['id']}", json={"name": "Renamed"})
+    assert response.json()["name"] == "Renamed"
+    assert response.json()["status"] == ProfileStatus.INACTIVE.value
+
+    assert async_client.patch("/profiles/999999", json={"name": "x"}).status_code == 404
+
+
+def test_async_patch_profile_duplicate_email(async_client):
+    """Test that an async PATCH to an email already in use is a 409."""
+    emails = [f"async_dup_{i}_{uuid.uuid4()}@example.com" for i in range(2)]
+    first, second = [
+        async_client.post(
+            "/profiles/", json={"name": "Async Dup", "email": email, "specialty": "Dup"}
+        ).json()
+        for email in emails
+    ]
+
+    response = async_client.patch(f"/profiles/{first['id']}", json={"email": second["email"]})
+    assert response.status_code == 409
+    assert async_client.get(f"/profiles/{first['id']}").json()["email"] == first["email"]
+
+
+def test_async_search_profiles(async_client):
+    """Test full-text search through the async routes."""
+    tag = uuid.uuid4().hex[:8]
+    created = async_client.post(
+        "/profiles/",
+        json={"name": f"Async Finder{tag}", "email": f"finder_{tag}@example.com",
+              "specialty": "Search"},
+    ).json()
+
+    response = async_client.get("/profiles/search", params={"q": f"finder{tag}"})
+    assert response.status_code == 200
+    assert [p["id"] for p in response.json()] == [created["id"]]
+
+
+def test_async_profile_history(async_client):
+    """Test the paginated status history through the async routes."""
+    created = async_client.post(
+        "/profiles/",
+        json={
+            "name": "Async History",
+            "email": f"async_history_{uuid.uuid4()}@example.com",
+            "specialty": "Asyncio",
+        },
+    ).json()
+    async_client.patch(f"/profiles/{created['id']}", json={"status": "SUSPENDED"})
+
+    url = f"/profiles/{created['id']}/history"
+    response = async_client.get(url, params={"limit": 1})
+    assert response.status_code == 200
+    assert [e["status"] for e in response.json()] == ["active"]
+
+    response = async_client.get(url, params={"after": response.headers["X-Next-Cursor"]})
+    assert [e["status"] for e in response.json()] == ["suspended"]
+    assert "X-Next-Cursor" not in response.headers
+
+    assert async_client.get(url, params={"status": "suspended"}).json()[0]["status"] == (
+        "suspended"
+    )
+    assert async_client.get("/profiles/999999/history").status_code == 404
+
+
+def test_async_profiles_batch(async_client):
+    """Test the multi-get endpoint through the async routes."""
+    created = async_client.post(
+        "/profiles/",
+        json={
+            "name": "Async Batch",
+            "email": f"async_batch_{uuid.uuid4()}@example.com",
+            "specialty": "Asyncio",
+        },
+    ).json()
+
+    response = async_client.get(
+        "/profiles/batch", params={"ids": [str(created["id"]), f"999999,{created['id']}"]}
+    )
+    assert response.status_code == 200
+    assert [p["id"] for p in response.json()] == [created["id"]]
+    assert response.headers["X-Missing-Ids"] == "999999"
+    assert async_client.get("/profiles/batch", params={"ids": "x"}).status_code == 400
+
+
+def test_async_concurrent_reads_are_coalesced(async_client, monkeypatch):
+    """Test that concurrent GETs of one profile share a single query in async mode."""
+    import asyncio
+    import threading
+    from app.config.cache import async_profile_flights, get_profile_cache
+    from app.db.async_profile_repository import AsyncProfileRepository
+    from app.services.profile_cache import NullProfileCache
+
+    created = async_client.post(
+        "/profiles/",
+        json={
+            "name": "Async Flight",
+            "email": f"async_flight_{uuid.uuid4()}@example.com",
+            "specialty": "Asyncio",
+        },
+    ).json()
+
+    # No cache in front, and reads slow enough for the requests to overlap
+    async_client.app.dependency_overrides[get_profile_cache] = NullProfileCache
+    queries = []
+    get_by_id = AsyncProfileRepository.get_by_id
+
+    async def slow_get_by_id(self, profile_id, include_history=False):
+        queries.append(profile_id)
+        await asyncio.sleep(0.2)
+        return await get_by_id(self, profile_id, include_history)
+
+    monkeypatch.setattr(AsyncProfileRepository, "get_by_id", slow_get_by_id)
+    before = async_profile_flights.stats()
+
+    readers = 10
+    barrier = threading.Barrier(readers)
+    responses = [None] * readers
+
+    def read(index):
+        barrier.wait()
+        responses[index] = async_client.get(f"/profiles/{created['id']}")
+
+    threads = [threading.Thread(target=read, args=(n,)) for n in range(readers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+
+    assert [r.status_code for r in responses] == [200] * readers
+    assert {r.json()["name"] for r in responses} == {"Async Flight"}
+    assert queries == [created["id"]]
+    after = async_profile_flights.stats()
+    assert after["executed"] - before["executed"] == 1
+    assert after["coalesced"] - before["coalesced"] == readers - 1
@@ -138,3 +138,775 @@ def test_root_endpoint(client):
     assert response.status_code == 200
     data = response.json()
     assert "message" in data
+
+
+def test_get_profiles_keyset_pagination(client, test_profile):
+    """Test walking all profiles with the opaque `after` cursor."""
+    import uuid
+
+    created = [
+        client.post(
+            "/profiles/",
+            json={
+                "name": f"Keyset User {i}",
+                "email": f"keyset_{i}_{uuid.uuid4()}@example.com",
+                "specialty": "Pagination",
+            },
+        ).json()["id"]
+        for i in range(3)
+    ]
+
+    for order_by in ("id", "start_date"):
+        # Walk every page following the X-Next-Cursor header
+        seen = []
+        response = client.get(f"/profiles/?limit=2&order_by={order_by}")
+        while True:
+            assert response.status_code == 200
+            seen.extend(profile["id"] for profile in response.json())
+            cursor = response.headers.get("X-Next-Cursor")
+            if not cursor:
+                break
+            response = client.get(f"/profiles/?limit=2&order_by={order_by}&after={cursor}")
+
+        # Every profile is returned exactly once
+        all_profiles = client.get("/profiles/?limit=100000").json()
+        assert len(seen) == len(set(seen)) == len(all_profiles)
+        assert test_profile.id in seen
+
+    # Clean up so later tests see a small table
+    for profile_id in created:
+        client.delete(f"/profiles/{profile_id}")
+
+
+def test_get_profiles_invalid_cursor(client):
+    """Test that a malformed or mismatched cursor is rejected."""
+    response = client.get("/profiles/?after=not-a-cursor")
+    assert response.status_code == 400
+
+    # A cursor issued for one ordering cannot be reused with another
+    created = client.post(
+        "/profiles/",
+        json={"name": "Cursor User", "email": "cursor_user@example.com", "specialty": "Cursors"},
+    ).json()
+    cursor = client.get("/profiles/?limit=1").headers["X-Next-Cursor"]
+    response = client.get(f"/profiles/?limit=1&order_by=start_date&after={cursor}")
+    assert response.status_code == 400
+
+    client.delete(f"/profiles/{created['id']}")
+
+
+def test_read_endpoints_query_count(client, test_profile, query_counter):
+    """Test that read endpoints do not lazy-load history once per profile."""
+    # Give every profile on the page some history to (not) load
+    for i in range(3):
+        client.put(f"/profiles/{test_profile.id}", json={"name": f"Query Count {i}"})
+
+    query_counter.clear()
+    response = client.get(f"/profiles/{test_profile.id}")
+    assert response.status_code == 200
+    assert len(query_counter) == 1
+
+    query_counter.clear()
+    response = client.get("/profiles/?limit=100")
+    assert response.status_code == 200
+    assert len(response.json()) >= 1
+    assert len(query_counter) == 1
+
+
+def test_create_profiles_bulk(client, test_profile, query_counter):
+    """Test bulk creation with duplicate emails reported per item."""
+    import uuid
+
+    unique_id = str(uuid.uuid4())
+    payload = [
+        {"name": "Bulk One", "email": f"bulk_one_{unique_id}@example.com", "specialty": "Bulk"},
+        # Already in the table
+        {"name": "Bulk Existing", "email": test_profile.email, "specialty": "Bulk"},
+        {"name": "Bulk Two", "email": f"bulk_two_{unique_id}@example.com", "specialty": "Bulk",
+         "linkedin": "https://linkedin.com/in/bulktwo"},
+        # Repeated inside the batch
+        {"name": "Bulk Again", "email": f"bulk_one_{unique_id}@example.com", "specialty": "Bulk"},
+    ]
+
+    query_counter.clear()
+    response = client.post("/profiles/bulk", json=payload)
+
+    # One INSERT for the profiles and one for their history rows
+    assert len(query_counter) == 2
+    assert response.status_code == 200
+    data = response.json()
+    assert data["created"] == 2
+    assert data["conflicts"] == 2
+    assert [item["status"] for item in data["results"]] == [
+        "created", "conflict", "created", "conflict"
+    ]
+    assert data["results"][1]["profile"] is None
+    created = data["results"][2]["profile"]
+    assert created["linkedin"] == "https://linkedin.com/in/bulktwo"
+    assert created["status"] == ProfileStatus.ACTIVE.value
+
+    # Created profiles are readable
+    response = client.get(f"/profiles/{created['id']}")
+    assert response.status_code == 200
+    assert response.json()["email"] == payload[2]["email"]
+
+    for item in data["results"]:
+        if item["profile"]:
+            client.delete(f"/profiles/{item['profile']['id']}")
+
+
+def test_create_profiles_bulk_invalid_item(client):
+    """Test that an invalid item rejects the whole request before touching the database."""
+    response = client.post(
+        "/profiles/bulk",
+        json=[{"name": "Bad Email", "email": "not-an-email", "specialty": "Bulk"}],
+    )
+    assert response.status_code == 422
+
+
+def test_export_profiles(client, test_profile):
+    """Test streaming every profile as NDJSON and CSV."""
+    import csv
+    import io
+    import json
+
+    # NDJSON: one JSON object per line, same fields as ProfileResponse
+    response = client.get("/profiles/export?format=ndjson")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    exported = next(row for row in rows if row["id"] == test_profile.id)
+    assert exported == client.get(f"/profiles/{test_profile.id}").json()
+    assert [row["id"] for row in rows] == sorted(row["id"] for row in rows)
+
+    # CSV: header plus one line per profile
+    response = client.get("/profiles/export?format=csv")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    records = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(records) == len(rows)
+    exported = next(r for r in records if r["id"] == str(test_profile.id))
+    assert exported["email"] == test_profile.email
+    assert exported["status"] == ProfileStatus.ACTIVE.value
+    assert exported["end_date"] == ""
+
+    response = client.get("/profiles/export?format=xml")
+    assert response.status_code == 422
+
+
+def test_export_profiles_spans_many_chunks(db_session):
+    """Test that the export serializer emits every row across chunk boundaries."""
+    from app.api.profile_export import EXPORT_CHUNK_ROWS, iter_export
+
+    rows = [(i, "n", "e", "s", None, ProfileStatus.ACTIVE, None, None)
+            for i in range(EXPORT_CHUNK_ROWS * 2 + 7)]
+    chunks = list(iter_export(iter(rows), "csv"))
+    assert len(chunks) == 3
+    lines = "".join(chunks).splitlines()
+    assert lines[0].startswith("id,name,email")
+    assert len(lines) == len(rows) + 1
+
+
+def test_import_profiles_csv(client, test_profile, query_counter):
+    """Test importing a CSV upload: inserts, updates and rejections."""
+    import uuid
+
+    unique_id = str(uuid.uuid4())
+    csv_body = (
+        "name,email,specialty,linkedin\n"
+        f"Import One,import_one_{unique_id}@example.com,Imports,\n"
+        f"Renamed Test User,{test_profile.email},New Specialty,https://linkedin.com/in/new\n"
+        "Bad Row,not-an-email,Imports,\n"
+        f"Import Two,import_two_{unique_id}@example.com,Imports,\n"
+    )
+
+    query_counter.clear()
+    response = client.post(
+        "/profiles/import?batch_size=10",
+        files={"file": ("roster.csv", csv_body.encode(), "text/csv")},
+    )
+
+    assert response.status_code == 200
+    report = response.json()
+    assert report["inserted"] == 2
+    assert report["updated"] == 1
+    assert report["rejected"] == 1
+    assert report["errors"][0]["line"] == 4
+    assert "email" in report["errors"][0]["error"]
+    # One batch: email lookup, profile INSERT, history INSERT and UPDATE
+    assert len(query_counter) == 4
+
+    updated = client.get(f"/profiles/{test_profile.id}").json()
+    assert updated["name"] == "Renamed Test User"
+    assert updated["specialty"] == "New Specialty"
+
+    exported = client.get("/profiles/export").text
+    for email in (f"import_one_{unique_id}@example.com", f"import_two_{unique_id}@example.com"):
+        assert email in exported
+        profile_id = next(
+            p["id"] for p in client.get("/profiles/?limit=100000").json() if p["email"] == email
+        )
+        client.delete(f"/profiles/{profile_id}")
+
+
+def test_import_profiles_ndjson_batches(client):
+    """Test importing NDJSON across several batches, with a malformed line."""
+    import json
+    import uuid
+
+    unique_id = str(uuid.uuid4())
+    lines = [
+        json.dumps({"name": f"Ndjson {i}", "email": f"ndjson_{i}_{unique_id}@example.com",
+                    "specialty": "Imports"})
+        for i in range(5)
+    ]
+    lines.insert(2, "{not json")
+    # The same email twice: the last occurrence wins
+    lines.append(json.dumps({"name": "Ndjson 0 again", "email": f"ndjson_0_{unique_id}@example.com",
+                             "specialty": "Imports"}))
+    body = "\n".join(lines).encode()
+
+    response = client.post(
+        "/profiles/import?batch_size=2",
+        files={"file": ("roster.ndjson", body, "application/x-ndjson")},
+    )
+    report = response.json()
+    assert report["inserted"] == 5
+    assert report["updated"] == 1
+    assert report["rejected"] == 1
+    assert report["errors"][0]["line"] == 3
+
+    profiles = [p for p in client.get("/profiles/?limit=100000").json()
+                if p["email"].endswith(f"{unique_id}@example.com")]
+    assert {p["name"] for p in profiles} >= {"Ndjson 0 again", "Ndjson 4"}
+    for profile in profiles:
+        client.delete(f"/profiles/{profile['id']}")
+
+    response = client.post("/profiles/import", files={"file": ("roster.txt", body, "text/plain")})
+    assert response.status_code == 400
+
+
+def test_import_counts_repeated_emails_as_skipped(client, test_profile, profile_cache):
+    """Test that an email repeated within a batch is skipped, not reported as an update."""
+    import uuid
+
+    email = f"import_repeat_{uuid.uuid4()}@example.com"
+    body = (
+        "name,email,specialty\n"
+        f"First,{email},Imports\n"
+        f"Second,{email},Imports\n"
+    ).encode()
+    client.get(f"/profiles/{test_profile.id}")
+
+    report = client.post(
+        "/profiles/import", files={"file": ("roster.csv", body, "text/csv")}
+    ).json()
+    assert (report["inserted"], report["updated"], report["skipped"]) == (1, 0, 1)
+    # Nothing was updated, so cached profiles stay
+    assert profile_cache.stats()["size"] >= 1
+
+    profile = next(
+        p for p in client.get("/profiles/?limit=100000").json() if p["email"] == email
+    )
+    assert profile["name"] == "Second"
+    client.delete(f"/profiles/{profile['id']}")
+
+
+def test_import_rejects_lines_that_are_not_utf8(client):
+    """Test that a non-UTF-8 line is reported as rejected and the other rows are imported."""
+    import uuid
+
+    unique_id = str(uuid.uuid4())
+    body = (
+        "\ufeffname,email,specialty\n"
+        f"Ana,latin_ana_{unique_id}@example.com,Imports\n"
+        f"Bea,latin_bea_{unique_id}@example.com,Imports\n"
+    ).encode() + f"Jos\xe9,latin_jose_{unique_id}@example.com,Imports\n".encode("latin-1")
+
+    response = client.post(
+        "/profiles/import?batch_size=1",
+        files={"file": ("roster.csv", body, "text/csv")},
+    )
+    assert response.status_code == 200
+    report = response.json()
+    assert (report["inserted"], report["rejected"]) == (2, 1)
+    assert report["errors"][0]["line"] == 4
+    assert "UTF-8" in report["errors"][0]["error"]
+
+    for profile in client.get("/profiles/?limit=100000").json():
+        if profile["email"].endswith(f"{unique_id}@example.com"):
+            client.delete(f"/profiles/{profile['id']}")
+
+
+def test_read_profile_is_cached(client, test_profile, query_counter, profile_cache):
+    """Test that repeated reads are served from the cache and writes invalidate it."""
+    client.get(f"/profiles/{test_profile.id}")
+
+    query_counter.clear()
+    response = client.get(f"/profiles/{test_profile.id}")
+    assert response.status_code == 200
+    assert len(query_counter) == 0
+    assert profile_cache.stats()["hits"] >= 1
+
+    # PUT reads past the cache and must not leave the old version behind
+    client.put(f"/profiles/{test_profile.id}", json={"name": "Cache Busted"})
+    assert client.get(f"/profiles/{test_profile.id}").json()["name"] == "Cache Busted"
+
+    client.delete(f"/profiles/{test_profile.id}")
+    assert client.get(f"/profiles/{test_profile.id}").status_code == 404
+
+
+def test_put_does_not_revert_changes_missing_from_the_cache(client, db_session, test_profile):
+    """Test that PUT starts from the stored row, not from a stale cached copy."""
+    from sqlalchemy import update
+    from app.db.profile_models import Profile as ProfileModel
+
+    client.get(f"/profiles/{test_profile.id}")  # Cached as ACTIVE
+
+    # Another worker changes the profile; this worker's cache does not know
+    db_session.execute(
+        update(ProfileModel)
+        .where(ProfileModel.id == test_profile.id)
+        .values(status=ProfileStatus.SUSPENDED, linkedin="https://linkedin.com/in/elsewhere")
+    )
+    db_session.commit()
+
+    response = client.put(f"/profiles/{test_profile.id}", json={"name": "Renamed"})
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["name"], body["status"]) == ("Renamed", "suspended")
+    assert body["linkedin"] == "https://linkedin.com/in/elsewhere"
+
+
+def test_conditional_get_profile(client, test_profile):
+    """Test ETag and If-None-Match on the detail endpoint."""
+    response = client.get(f"/profiles/{test_profile.id}")
+    etag = response.headers["ETag"]
+    assert etag.startswith('"') and etag.endswith('"')
+
+    # Unchanged profile: 304 with no body
+    response = client.get(f"/profiles/{test_profile.id}", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+
+    # Weak validators and lists of tags also match
+    response = client.get(
+        f"/profiles/{test_profile.id}", headers={"If-None-Match": f'"other", W/{etag}'}
+    )
+    assert response.status_code == 304
+
+    # Any change produces a new ETag
+    client.put(f"/profiles/{test_profile.id}", json={"specialty": "Changed"})
+    response = client.get(f"/profiles/{test_profile.id}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def test_conditional_get_profiles(client, test_profile):
+    """Test ETag and If-None-Match on the list endpoint."""
+    response = client.get("/profiles/?limit=1")
+    etag = response.headers["ETag"]
+    cursor = response.headers.get("X-Next-Cursor")
+
+    response = client.get("/profiles/?limit=1", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers.get("X-Next-Cursor") == cursor
+
+    # A different page has a different ETag
+    response = client.get("/profiles/?limit=2", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+
+
+def test_write_endpoints_round_trips(client, query_counter):
+    """Test that each write is a single transaction without re-reads."""
+    import uuid
+
+    payload = {"name": "Round Trip", "email": f"round_trip_{uuid.uuid4()}@example.com",
+               "specialty": "Writes"}
+    response = client.post("/profiles/", json=payload)
+    assert response.status_code == 200
+    profile_id = response.json()["id"]
+    # INSERT ... RETURNING and the history INSERT
+    assert len(query_counter) == 2
+    assert all(statement.startswith("INSERT") for statement in query_counter)
+
+    query_counter.clear()
+    response = client.put(f"/profiles/{profile_id}", json={"status": "INACTIVE"})
+    assert response.status_code == 200
+    assert response.json()["status"] == "inactive"
+    # The current profile, UPDATE ... RETURNING and the history INSERT
+    assert len(query_counter) == 3
+
+    query_counter.clear()
+    response = client.put(f"/profiles/{profile_id}", json={"name": "Renamed",
+                                                           "status": "INACTIVE"})
+    assert response.status_code == 200
+    # Same status: no history INSERT
+    assert len(query_counter) == 2
+    history = client.get(f"/profiles/{profile_id}/history").json()
+    assert [entry["status"] for entry in history] == ["active", "inactive"]
+
+    query_counter.clear()
+    response = client.delete(f"/profiles/{profile_id}")
+    assert response.status_code == 200
+    assert response.json() == {"message": "Perfil eliminado"}
+    # History DELETE and DELETE ... RETURNING
+    assert len(query_counter) == 2
+    assert client.get(f"/profiles/{profile_id}").status_code == 404
+
+
+def test_patch_profile(client, db_session, test_profile, query_counter):
+    """Test PATCH updates only the supplied fields in a single statement."""
+    from app.db.profile_models import ProfileHistory
+
+    def history_count():
+        return db_session.query(ProfileHistory).filter(
+            ProfileHistory.profile_id == test_profile.id
+        ).count()
+
+    # Status transition: conditional UPDATE ... RETURNING plus the history INSERT
+    query_counter.clear()
+    response = client.patch(f"/profiles/{test_profile.id}", json={"status": "SUSPENDED"})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == ProfileStatus.SUSPENDED.value
+    assert data["name"] == test_profile.name
+    assert data["linkedin"] == test_profile.linkedin
+    assert len(query_counter) == 2
+    assert not any(statement.startswith("SELECT") for statement in query_counter)
+    assert history_count() == 1
+
+    # Same status again: no history entry
+    response = client.patch(f"/profiles/{test_profile.id}", json={"status": "SUSPENDED"})
+    assert response.status_code == 200
+    assert history_count() == 1
+
+    # Other fields only: a single UPDATE; null clears linkedin but not required fields
+    query_counter.clear()
+    response = client.patch(
+        f"/profiles/{test_profile.id}",
+        json={"specialty": "Patched", "linkedin": None, "name": None},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["specialty"] == "Patched"
+    assert data["linkedin"] is None
+    assert data["name"] == test_profile.name
+    assert data["status"] == ProfileStatus.SUSPENDED.value
+    assert len(query_counter) == 1
+    assert history_count() == 1
+
+    # The cached profile is invalidated
+    assert client.get(f"/profiles/{test_profile.id}").json()["specialty"] == "Patched"
+
+    response = client.patch("/profiles/999999", json={"status": "ACTIVE"})
+    assert response.status_code == 404
+
+
+def test_patch_profile_duplicate_email(client, test_profile):
+    """Test that PATCH to an email another profile has is a 409, not a 500."""
+    import uuid
+
+    other = client.post(
+        "/profiles/",
+        json={"name": "Other", "email": f"other_{uuid.uuid4()}@example.com", "specialty": "Dup"},
+    ).json()
+
+    for changes in ({"email": other["email"]}, {"email": other["email"], "status": "INACTIVE"}):
+        response = client.patch(f"/profiles/{test_profile.id}", json=changes)
+        assert response.status_code == 409
+        assert response.json()["detail"] == "El email ya está registrado"
+
+    data = client.get(f"/profiles/{test_profile.id}").json()
+    assert (data["email"], data["status"]) == (test_profile.email, ProfileStatus.ACTIVE.value)
+    client.delete(f"/profiles/{other['id']}")
+
+
+def test_internal_stats(client, test_profile, monkeypatch):
+    """Test the internal pool and cache telemetry endpoints and their token."""
+    from app.config import internal
+
+    # Disabled until a token is configured
+    assert client.get("/internal/pool").status_code == 403
+    monkeypatch.setattr(internal, "INTERNAL_API_TOKEN", "s3cret")
+    assert client.get("/internal/pool").status_code == 403
+    assert client.get("/internal/pool", headers={"X-Internal-Token": "wrong"}).status_code == 403
+
+    headers = {"X-Internal-Token": "s3cret"}
+    response = client.get("/internal/pool", headers=headers)
+    assert response.status_code == 200
+    assert "pool" in response.json()["sync"]
+
+    client.get(f"/profiles/{test_profile.id}")
+    response = client.get("/internal/cache", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["misses"] == 1
+
+
+def test_health_probes(client):
+    """Test the liveness and readiness probes."""
+    from app.config.health import Readiness, get_database_check, get_readiness
+    from app.main import app
+
+    assert client.get("/healthz").json() == {"status": "ok"}
+
+    state = Readiness()
+    app.dependency_overrides[get_readiness] = lambda: state
+    response = client.get("/readyz")
+    assert response.status_code == 503
+    assert response.json()["status"] == "starting"
+
+    state.ready = True
+    assert client.get("/readyz").json() == {"status": "ready"}
+
+    async def unreachable(warm):
+        raise ConnectionError("refused")
+
+    app.dependency_overrides[get_database_check] = lambda: unreachable
+    response = client.get("/readyz")
+    assert response.status_code == 503
+    assert response.json() == {"status": "unavailable", "error": "refused"}
+
+
+def test_search_profiles(client):
+    """Test ranked full-text search with keyset pagination."""
+    import uuid
+
+    tag = uuid.uuid4().hex[:8]
+    payload = [
+        {"name": f"Searchable Java{tag}", "email": f"java_{tag}@example.com",
+         "specialty": "Backend"},
+        {"name": "Searchable Ana", "email": f"ana_{tag}@example.com",
+         "specialty": f"Java{tag} Frontend"},
+        {"name": "Searchable Other", "email": f"other_{tag}@example.com", "specialty": "Design"},
+    ]
+    created = client.post("/profiles/bulk", json=payload).json()["results"]
+    ids = [item["profile"]["id"] for item in created]
+    try:
+        # Prefix match across name, specialty and email; name matches rank first
+        response = client.get("/profiles/search", params={"q": f"java{tag[:4]}"})
+        assert response.status_code == 200
+        assert [p["id"] for p in response.json()] == ids[:2]
+
+        # Keyset pagination over the ranked results
+        response = client.get("/profiles/search", params={"q": f"java{tag}", "limit": 1})
+        assert [p["id"] for p in response.json()] == ids[:1]
+        cursor = response.headers["X-Next-Cursor"]
+        response = client.get(
+            "/profiles/search", params={"q": f"java{tag}", "limit": 1, "after": cursor}
+        )
+        assert [p["id"] for p in response.json()] == ids[1:2]
+        cursor = response.headers["X-Next-Cursor"]
+        response = client.get(
+            "/profiles/search", params={"q": f"java{tag}", "limit": 1, "after": cursor}
+        )
+        assert response.json() == []
+        assert "X-Next-Cursor" not in response.headers
+
+        # Updates are reflected in the index; punctuation-only queries match nothing
+        client.patch(f"/profiles/{ids[2]}", json={"specialty": f"Java{tag}"})
+        response = client.get("/profiles/search", params={"q": f"java{tag}"})
+        assert len(response.json()) == 3
+        assert client.get("/profiles/search", params={"q": "%*\""}).json() == []
+
+        response = client.get("/profiles/search", params={"q": "java", "after": "bogus"})
+        assert response.status_code == 400
+        assert client.get("/profiles/search").status_code == 422
+    finally:
+        for profile_id in ids:
+            client.delete(f"/profiles/{profile_id}")
+
+
+def test_read_profiles_filters(client):
+    """Test status, specialty and date range filters on the listing."""
+    import uuid
+
+    specialty = f"Filters {uuid.uuid4().hex[:8]}"
+    payload = [
+        {"name": f"Filter {i}", "email": f"filter_{i}_{uuid.uuid4()}@example.com",
+         "specialty": specialty}
+        for i in range(3)
+    ]
+    ids = [item["profile"]["id"] for item in
+           client.post("/profiles/bulk", json=payload).json()["results"]]
+    try:
+        client.patch(f"/profiles/{ids[1]}", json={"status": "SUSPENDED"})
+        client.patch(f"/profiles/{ids[2]}", json={"status": "DELETED"})
+
+        def listed(**params):
+            response = client.get("/profiles/", params={"specialty": specialty, "limit": 100,
+                                                        **params})
+            assert response.status_code == 200
+            return [p["id"] for p in response.json()]
+
+        assert listed() == ids
+        assert listed(status="active") == ids[:1]
+        assert listed(status="SUSPENDED") == ids[1:2]
+        assert listed(include_deleted="false") == ids[:2]
+
+        start_date = client.get(f"/profiles/{ids[0]}").json()["start_date"]
+        assert listed(start_date_from=start_date) == ids
+        assert listed(start_date_to=start_date) == []
+        assert listed(end_date_from="2000-01-01T00:00:00") == []
+
+        # Filters combine with keyset pagination
+        response = client.get("/profiles/", params={"specialty": specialty, "limit": 1,
+                                                    "include_deleted": "false"})
+        cursor = response.headers["X-Next-Cursor"]
+        assert listed(include_deleted="false", after=cursor) == ids[1:2]
+
+        response = client.get("/profiles/", params={"status": "unknown"})
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Estado inválido"
+    finally:
+        for profile_id in ids:
+            client.delete(f"/profiles/{profile_id}")
+
+
+def test_read_profile_history(client, query_budget):
+    """Test the keyset-paginated, filtered status history of a profile."""
+    import uuid
+
+    created = client.post("/profiles/", json={
+        "name": "History Pages", "email": f"history_{uuid.uuid4()}@example.com",
+        "specialty": "History",
+    }).json()
+    try:
+        for status in ("SUSPENDED", "ACTIVE", "INACTIVE"):
+            client.patch(f"/profiles/{created['id']}", json={"status": status})
+
+        url = f"/profiles/{created['id']}/history"
+        entries, after = [], None
+        while True:
+            with query_budget(1):
+                response = client.get(url, params={"limit": 3, "after": after})
+            assert response.status_code == 200
+            entries += response.json()
+            after = response.headers.get("X-Next-Cursor")
+            if after is None:
+                break
+        assert [e["status"] for e in entries] == ["active", "suspended", "active", "inactive"]
+        assert all(e["profile_id"] == created["id"] for e in entries)
+        assert [e["changed_at"] for e in entries] == sorted(e["changed_at"] for e in entries)
+
+        active = client.get(url, params={"status": "active"}).json()
+        assert [e["id"] for e in active] == [entries[0]["id"], entries[2]["id"]]
+        since = client.get(url, params={"changed_from": entries[2]["changed_at"]}).json()
+        assert [e["id"] for e in since] == [e["id"] for e in entries[2:]]
+        until = client.get(url, params={"changed_to": entries[1]["changed_at"]}).json()
+        assert [e["id"] for e in until] == [entries[0]["id"]]
+
+        assert client.get(url, params={"changed_from": "2100-01-01T00:00:00"}).json() == []
+        assert client.get(url, params={"after": "bogus"}).status_code == 400
+        assert client.get(url, params={"status": "unknown"}).status_code == 400
+        assert client.get("/profiles/999999/history").status_code == 404
+    finally:
+        client.delete(f"/profiles/{created['id']}")
+
+
+def test_read_profiles_batch(client, test_profile, query_budget):
+    """Test fetching many profiles by ID in one query, in request order and deduplicated."""
+    import uuid
+
+    other = client.post("/profiles/", json={
+        "name": "Batch Other", "email": f"batch_{uuid.uuid4()}@example.com",
+        "specialty": "Batching",
+    }).json()
+    try:
+        with query_budget(1):
+            response = client.get(
+                "/profiles/batch",
+                params={"ids": [f"{other['id']},999999", str(test_profile.id), str(other["id"])]},
+            )
+        assert response.status_code == 200
+        assert [p["id"] for p in response.json()] == [other["id"], test_profile.id]
+        assert response.headers["X-Missing-Ids"] == "999999"
+
+        response = client.get(
+            "/profiles/batch", params={"ids": f"{other['id']},999999,{test_profile.id}"},
+            headers={"If-None-Match": response.headers["ETag"]},
+        )
+        assert response.status_code == 304
+        assert response.headers["X-Missing-Ids"] == "999999"
+
+        assert client.get("/profiles/batch", params={"ids": "1,abc"}).status_code == 400
+        assert client.get("/profiles/batch", params={"ids": ","}).status_code == 400
+        for out_of_range in ("99999999999999999999999", "0", "-5", str(2**63)):
+            response = client.get("/profiles/batch", params={"ids": f"1,{out_of_range}"})
+            assert response.status_code == 400
+        too_many = ",".join(str(n) for n in range(1, 102))
+        assert client.get("/profiles/batch", params={"ids": too_many}).status_code == 400
+        assert client.get("/profiles/batch").status_code == 422
+    finally:
+        client.delete(f"/profiles/{other['id']}")
+
+
+def test_metrics_endpoint(client, test_profile):
+    """Test that /metrics labels requests by route template and counts their SQL."""
+    from app.api.metrics import REGISTRY
+
+    labels = {"method": "GET", "route": "/profiles/{profile_id}"}
+    before = REGISTRY.get_sample_value("db_queries_per_request_count", labels) or 0
+    queries_before = REGISTRY.get_sample_value("db_queries_per_request_sum", labels) or 0
+
+    assert client.get(f"/profiles/{test_profile.id}").status_code == 200
+    assert client.get("/profiles/999999").status_code == 404
+    client.get("/no/such/path")
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert 'http_requests_total{method="GET",route="/profiles/{profile_id}",status="200"}' in body
+    assert 'http_requests_total{method="GET",route="/profiles/{profile_id}",status="404"}' in body
+    assert 'route="unmatched"' in body
+    assert f"/profiles/{test_profile.id}" not in body
+    assert "http_request_duration_seconds_bucket" in body
+    assert "http_requests_in_progress" in body
+    assert "db_pool_checkouts_total" in body
+    assert 'profile_reads_executed_total{mode="sync"}' in body
+
+    assert REGISTRY.get_sample_value("db_queries_per_request_count", labels) == before + 2
+    # Both lookups miss the cache and read the database
+    assert REGISTRY.get_sample_value("db_queries_per_request_sum", labels) >= queries_before + 2
+
+
+@pytest.mark.query_budget(2)
+def test_endpoints_query_budget(client, test_profile):
+    """Test that reads and writes stay within two statements per request."""
+    assert client.get(f"/profiles/{test_profile.id}").status_code == 200
+    assert client.get("/profiles/?limit=100").status_code == 200
+    assert client.get("/profiles/?limit=10&order_by=start_date").status_code == 200
+    assert client.get("/profiles/search?q=test").status_code == 200
+    response = client.patch(f"/profiles/{test_profile.id}", json={"status": "INACTIVE"})
+    assert response.status_code == 200
+
+    response = client.post(
+        "/profiles/",
+        json={
+            "name": "Budget User",
+            "email": "budget@example.com",
+            "specialty": "Testing",
+            "linkedin": "https://linkedin.com/in/budget",
+            "status": "ACTIVE",
+        },
+    )
+    assert response.status_code == 200
+    assert client.delete(f"/profiles/{response.json()['id']}").status_code == 200
+
+
+def test_query_budget_exceeded(client, test_profile, query_budget):
+    """Test that a request over its query budget fails and lists its statements."""
+    from app.config.query_stats import QueryBudgetExceeded
+
+    with query_budget(0):
+        with pytest.raises(QueryBudgetExceeded) as excinfo:
+            client.get(f"/profiles/{test_profile.id}")
+
+    message = str(excinfo.value)
+    assert message.startswith("/profiles/{profile_id} ran 1 SQL statements, budget is 0")
+    assert "1x SELECT profiles.id" in message
+
+    # Outside the block requests run unchecked
+    assert client.get(f"/profiles/{test_profile.id}").status_code == 200
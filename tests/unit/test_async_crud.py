@@ -0,0 +1,62 @@
+import asyncio
+from app.api.async_profile_api import AsyncProfileApi
+from app.config.database import to_async_url
+from app.db.async_profile_repository import AsyncProfileRepository
+from app.entities import ProfileStatus
+from app.services.async_profile_service import AsyncProfileService
+
+
+def test_async_profile_lifecycle(async_session_factory):
+    """Test create, read with history, update and delete through the async stack."""
+
+    async def scenario():
+        async with async_session_factory() as db:
+            profile_service = AsyncProfileApi(AsyncProfileService(AsyncProfileRepository(db)))
+
+            profile = await profile_service.create_profile(
+                name="Async Crud", email="async_crud@example.com", specialty="Asyncio"
+            )
+            assert profile.id is not None
+            assert profile.status == ProfileStatus.ACTIVE
+
+            loaded = await profile_service.get_profile(profile.id, include_history=True)
+            assert [h.status for h in loaded.history] == [ProfileStatus.ACTIVE]
+
+            updated = await profile_service.update_profile(profile.id, status="suspended")
+            assert updated.status == ProfileStatus.SUSPENDED
+
+            deleted = await profile_service.delete_profile(profile.id)
+            assert deleted.id == profile.id
+            assert await profile_service.get_profile(profile.id) is None
+
+    asyncio.run(scenario())
+
+
+def test_to_async_url():
+    """Test mapping sync database URLs to their asyncio drivers."""
+    assert to_async_url("postgresql://u:p@db:5432/x") == "postgresql+asyncpg://u:p@db:5432/x"
+    assert to_async_url("sqlite:///./test.db") == "sqlite+aiosqlite:///./test.db"
+    assert to_async_url("sqlite+aiosqlite:///./a.db") == "sqlite+aiosqlite:///./a.db"
+
+
+def test_async_import_parses_off_the_event_loop(async_session_factory):
+    """Test that the async import reads and validates its batches in a worker thread."""
+    import threading
+    import uuid
+
+    parsed_on = []
+
+    def profiles():
+        for i in range(3):
+            parsed_on.append(threading.get_ident())
+            yield {"name": f"Threaded {i}", "email": f"threaded_{i}_{uuid.uuid4()}@example.com",
+                   "specialty": "Asyncio"}
+
+    async def scenario():
+        async with async_session_factory() as db:
+            service = AsyncProfileService(AsyncProfileRepository(db))
+            report = await service.import_profiles(profiles(), batch_size=2)
+            assert report.inserted == 3
+
+    asyncio.run(scenario())
+    assert threading.get_ident() not in parsed_on
@@ -1,4 +1,5 @@
 import pytest
+from sqlalchemy import text
 from app.api.profile_api import ProfileApi
 from app.db.profile_repository import ProfileRepository as ProfileRepositoryImpl
 from app.db.profile_models import ProfileHistory
@@ -149,3 +150,107 @@ def test_delete_profile(db_session, test_profile):
     # Verify profile no longer exists in database
     profile = profile_service.get_profile(profile_id)
     assert profile is None
+
+
+def test_get_profiles_keyset(db_session, test_profile):
+    """Test keyset pagination through the ProfileApi."""
+    repository = ProfileRepositoryImpl(db_session)
+    service = ProfileService(repository)
+    profile_service = ProfileApi(service)
+
+    first_page, cursor = profile_service.get_profiles_page(limit=1)
+    assert len(first_page) == 1
+    assert cursor is not None
+
+    second_page, _ = profile_service.get_profiles_page(limit=1, after=cursor)
+    assert all(p.id > first_page[0].id for p in second_page)
+
+    # The last page does not return a cursor
+    everything, last_cursor = profile_service.get_profiles_page(limit=100000)
+    assert last_cursor is None
+    assert any(p.id == test_profile.id for p in everything)
+
+
+def test_get_profiles_with_history_batches_queries(db_session, query_counter):
+    """Test that history is loaded with one extra query per page when requested."""
+    repository = ProfileRepositoryImpl(db_session)
+    service = ProfileService(repository)
+    profile_service = ProfileApi(service)
+
+    for i in range(3):
+        profile_service.create_profile(
+            name=f"History User {i}",
+            email=f"history_batch_{i}@example.com",
+            specialty="History",
+        )
+
+    query_counter.clear()
+    profiles = profile_service.get_profiles(skip=0, limit=100, include_history=True)
+    assert len(query_counter) == 2
+    assert all(p.history for p in profiles if p.email.startswith("history_batch_"))
+
+    query_counter.clear()
+    profiles = profile_service.get_profiles(skip=0, limit=100)
+    assert len(query_counter) == 1
+    assert all(p.history == [] for p in profiles)
+
+    for profile in profiles:
+        if profile.email.startswith("history_batch_"):
+            profile_service.delete_profile(profile.id)
+
+
+def test_mapped_profiles_are_slotted_and_acyclic(db_session):
+    """Test that mapped profiles carry no __dict__ and their history no back-reference."""
+    import gc
+
+    profile_service = ProfileApi(ProfileService(ProfileRepositoryImpl(db_session)))
+    created = profile_service.create_profile(
+        name="Slotted User", email="slotted_user@example.com", specialty="Memory"
+    )
+
+    profile = profile_service.get_profile(created.id, include_history=True)
+    entry = profile.history[0]
+    assert not hasattr(profile, "__dict__") and not hasattr(entry, "__dict__")
+    assert entry.profile_id == profile.id
+    assert profile not in gc.get_referents(entry)
+
+    profile_service.delete_profile(created.id)
+
+
+def test_filtered_listing_uses_indexes(db_session):
+    """Test that listing filters are answered from the composite and partial indexes."""
+    from app.db.profile_queries import select_profiles
+    from app.entities import ProfileFilter
+
+    def query_plan(filters, order_by="id"):
+        stmt = select_profiles(limit=10, order_by=order_by, filters=filters)
+        compiled = stmt.compile(db_session.get_bind(), compile_kwargs={"literal_binds": True})
+        rows = db_session.execute(text(f"EXPLAIN QUERY PLAN {compiled}")).all()
+        return " ".join(row[-1] for row in rows)
+
+    plan = query_plan(ProfileFilter(status=ProfileStatus.ACTIVE, specialty="Testing"))
+    assert "ix_profiles_status_specialty" in plan
+
+    plan = query_plan(ProfileFilter(include_deleted=False), order_by="start_date")
+    assert "ix_profiles_live_start_date_id" in plan
+
+
+def test_read_for_update_locks_the_row_on_postgresql():
+    """Test that the read of a read-modify-write locks the row where the database can."""
+    from sqlalchemy.dialects import postgresql, sqlite
+    from app.db.profile_queries import select_profile_for_update
+
+    stmt = select_profile_for_update(7)
+    assert str(stmt.compile(dialect=postgresql.dialect())).endswith("FOR UPDATE")
+    assert "FOR UPDATE" not in str(stmt.compile(dialect=sqlite.dialect()))
+
+
+def test_search_falls_back_to_a_substring_match(db_session, test_profile):
+    """Test that a database without a search index still gets search results."""
+    from app.db.profile_queries import search_profiles
+
+    stmt = search_profiles("mysql", f"{test_profile.name.split()[0]} testing")
+    rows = db_session.execute(stmt).all()
+    assert test_profile.id in [row.id for row in rows]
+    # Underscores in a term are matched literally, not as LIKE wildcards
+    assert db_session.execute(search_profiles("mysql", "test_user_")).all() == []
@@ -0,0 +1,44 @@
+import asyncio
+from app.config.health import Readiness, wait_for_database
+
+
+def test_wait_for_database_backs_off_until_ready():
+    """Test exponential, capped backoff while the database is unreachable."""
+    state = Readiness()
+    failures = [ConnectionError("refused")] * 4
+    delays = []
+
+    async def check(warm):
+        if failures:
+            raise failures.pop()
+
+    async def sleep(delay):
+        delays.append(delay)
+
+    asyncio.run(
+        wait_for_database(state, check, initial_delay=0.5, max_delay=3, warm=2, sleep=sleep)
+    )
+
+    assert delays == [0.5, 1.0, 2.0, 3]
+    assert state.ready
+    assert state.attempts == 5
+    assert state.last_error is None
+
+
+def test_wait_for_database_records_last_error():
+    """Test that the readiness state reports why the database is not ready yet."""
+    state = Readiness()
+
+    async def check(warm):
+        raise ConnectionError("refused")
+
+    async def sleep(delay):
+        raise asyncio.CancelledError
+
+    try:
+        asyncio.run(wait_for_database(state, check, sleep=sleep))
+    except asyncio.CancelledError:
+        pass
+
+    assert not state.ready
+    assert state.to_dict() == {"ready": False, "attempts": 1, "last_error": "refused"}
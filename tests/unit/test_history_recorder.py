@@ -0,0 +1,131 @@
+import time
+from datetime import datetime
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+from app.config.database import Base
+from app.db.history_recorder import HistoryRecorder
+from app.db.profile_models import ProfileHistory as ProfileHistoryModel
+from app.db.profile_queries import history_row
+from app.db.profile_repository import ProfileRepository
+from app.entities import Profile, ProfileStatus
+
+
+@pytest.fixture
+def history_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'recorder.db'}")
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+def stored_history(engine):
+    with engine.connect() as conn:
+        return conn.execute(select(func.count()).select_from(ProfileHistoryModel)).scalar()
+
+
+def rows(count, profile_id=1):
+    entry = history_row(profile_id, ProfileStatus.ACTIVE, datetime(2026, 1, 1))
+    return [dict(entry) for _ in range(count)]
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.01)
+
+
+def test_flushes_on_size_and_on_interval(history_engine):
+    """Test that a full batch is written at once and a partial one after the interval."""
+    recorder = HistoryRecorder(history_engine, flush_size=3, flush_interval=0.2)
+    recorder.start()
+    try:
+        assert recorder.record(rows(3))
+        wait_for(lambda: recorder.stats()["written"] == 3)
+        assert recorder.stats()["flushes"] == 1
+
+        assert recorder.record(rows(1))
+        assert recorder.stats()["queued"] == 1
+        wait_for(lambda: recorder.stats()["written"] == 4)
+    finally:
+        recorder.stop()
+    assert stored_history(history_engine) == 4
+
+
+def test_bounded_queue_and_stop(history_engine):
+    """Test that a full queue rejects rows, flush() drains it and stop() writes the rest."""
+    recorder = HistoryRecorder(history_engine, flush_size=100, flush_interval=60,
+                               max_queued=3)
+    assert not recorder.record(rows(1))  # Not started: the caller writes its rows
+
+    recorder.start()
+    assert recorder.record(rows(2))
+    assert not recorder.record(rows(2))
+    assert recorder.stats()["rejected"] == 3
+
+    assert recorder.flush()
+    assert stored_history(history_engine) == 2
+
+    assert recorder.record(rows(3))
+    recorder.stop()
+    assert stored_history(history_engine) == 5
+    assert recorder.stats()["queued"] == 0
+
+
+def test_failed_writes_are_retried_or_dropped(history_engine, tmp_path):
+    """Test that rows stay queued while the table is unreachable and bad rows are dropped."""
+    unreachable = create_engine(f"sqlite:///{tmp_path / 'empty.db'}")
+    recorder = HistoryRecorder(unreachable, flush_size=100, flush_interval=60)
+    recorder.start()
+    assert recorder.record(rows(2))
+    assert not recorder.flush(timeout=0.2)
+    assert recorder.stats()["failed_flushes"] == 1
+    assert recorder.stats()["queued"] == 2
+    recorder.stop()
+    unreachable.dispose()
+
+    recorder = HistoryRecorder(history_engine, flush_size=100, flush_interval=60)
+    recorder.start()
+    invalid = dict(rows(1)[0], status=None)
+    assert recorder.record(rows(1) + [invalid] + rows(1))
+    assert recorder.flush()
+    recorder.stop()
+    assert (recorder.stats()["written"], recorder.stats()["dropped"]) == (2, 1)
+    assert stored_history(history_engine) == 2
+
+
+def test_repository_queues_history_after_commit(history_engine):
+    """Test that writes queue their history rows, and a full queue falls back to the request."""
+    recorder = HistoryRecorder(history_engine, flush_size=100, flush_interval=60)
+    recorder.start()
+    try:
+        with Session(history_engine) as session:
+            repository = ProfileRepository(session, recorder)
+            created = repository.create(Profile(
+                name="Write Behind", email="write_behind@example.com", specialty="Queues",
+                status=ProfileStatus.ACTIVE, start_date=datetime.utcnow(),
+            ))
+            repository.patch(created.id, {"status": ProfileStatus.SUSPENDED})
+            assert stored_history(history_engine) == 0
+            assert recorder.stats()["queued"] == 2
+
+            assert recorder.flush()
+            assert stored_history(history_engine) == 2
+
+            # Deleting flushes first, so no queued row outlives its profile
+            repository.patch(created.id, {"status": ProfileStatus.ACTIVE})
+            assert repository.delete(created.id).id == created.id
+            assert stored_history(history_engine) == 0
+            assert recorder.stats()["queued"] == 0
+    finally:
+        recorder.stop()
+
+    # Stopped (or full), the recorder rejects rows and the repository writes them itself
+    with Session(history_engine) as session:
+        repository = ProfileRepository(session, recorder)
+        repository.create(Profile(
+            name="Fallback", email="fallback@example.com", specialty="Queues",
+            status=ProfileStatus.ACTIVE, start_date=datetime.utcnow(),
+        ))
+    assert stored_history(history_engine) == 1
@@ -0,0 +1,100 @@
+import csv
+import gzip
+from datetime import datetime
+import pytest
+from sqlalchemy import create_engine, text
+from app.config.database import Base
+from app.db.history_retention import add_months, compact_history, run_retention
+from app.db.profile_models import ProfileHistory as ProfileHistoryModel
+from app.db.profile_models import Profile as ProfileModel
+from app.entities import ProfileStatus
+
+NOW = datetime(2026, 6, 15, 12, 0)
+
+
+@pytest.fixture
+def history_engine(tmp_path):
+    """A SQLite file with two profiles and a history full of repeated statuses."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'history.db'}")
+    Base.metadata.create_all(bind=engine)
+    active, suspended = ProfileStatus.ACTIVE, ProfileStatus.SUSPENDED
+    with engine.begin() as conn:
+        conn.execute(ProfileModel.__table__.insert(), [
+            {"id": n, "name": f"P{n}", "email": f"p{n}@example.com", "specialty": "History",
+             "status": active, "start_date": datetime(2024, 1, 1)}
+            for n in (1, 2)
+        ])
+        conn.execute(ProfileHistoryModel.__table__.insert(), [
+            # Old entries, past a 365-day retention
+            {"profile_id": 1, "status": active, "changed_at": datetime(2024, 1, 1)},
+            {"profile_id": 1, "status": active, "changed_at": datetime(2024, 2, 1)},
+            {"profile_id": 2, "status": suspended, "changed_at": datetime(2024, 3, 1)},
+            # Recent entries: two runs of repeats for profile 1
+            {"profile_id": 1, "status": suspended, "changed_at": datetime(2026, 1, 1)},
+            {"profile_id": 1, "status": suspended, "changed_at": datetime(2026, 2, 1)},
+            {"profile_id": 1, "status": active, "changed_at": datetime(2026, 3, 1)},
+            {"profile_id": 1, "status": active, "changed_at": datetime(2026, 4, 1)},
+            {"profile_id": 1, "status": active, "changed_at": datetime(2026, 5, 1)},
+            {"profile_id": 2, "status": suspended, "changed_at": datetime(2026, 5, 1)},
+        ])
+    yield engine
+    engine.dispose()
+
+
+def history(engine):
+    with engine.connect() as conn:
+        return conn.execute(text(
+            "SELECT profile_id, status, changed_at FROM profile_history "
+            "ORDER BY profile_id, changed_at"
+        )).all()
+
+
+def test_add_months():
+    """Test month arithmetic across year boundaries."""
+    assert add_months(datetime(2025, 11, 1), 3) == datetime(2026, 2, 1)
+    assert add_months(datetime(2026, 1, 1), -1) == datetime(2025, 12, 1)
+
+
+def test_run_retention_archives_and_compacts(history_engine, tmp_path):
+    """Test that old entries go to a gzip CSV and repeated statuses collapse."""
+    archive_dir = tmp_path / "archive"
+    summary = run_retention(history_engine, 365, str(archive_dir), now=NOW)
+
+    assert summary["archived"] == 3
+    with gzip.open(summary["archive_file"], "rt", newline="") as archive:
+        rows = list(csv.reader(archive))
+    assert rows[0] == ["id", "profile_id", "status", "changed_at"]
+    assert [row[2:] for row in rows[1:]] == [
+        ["active", "2024-01-01T00:00:00"],
+        ["active", "2024-02-01T00:00:00"],
+        ["suspended", "2024-03-01T00:00:00"],
+    ]
+    assert summary["archive_bytes"] > 0
+    assert list(archive_dir.iterdir()) == [archive_dir / summary["archive_file"].split("/")[-1]]
+
+    assert summary["compacted"] == 3
+    assert [(p, s, c[:10]) for p, s, c in history(history_engine)] == [
+        (1, "SUSPENDED", "2026-01-01"),
+        (1, "ACTIVE", "2026-03-01"),
+        (2, "SUSPENDED", "2026-05-01"),
+    ]
+    assert summary["reclaimed_bytes"] == summary["bytes_before"] - summary["bytes_after"]
+
+    # A second run has nothing left to do and writes no archive
+    summary = run_retention(history_engine, 365, str(archive_dir), now=NOW)
+    assert (summary["archived"], summary["compacted"], summary["archive_file"]) == (0, 0, None)
+    assert len(list(archive_dir.iterdir())) == 1
+
+
+def test_retention_disabled_keeps_old_entries(history_engine, tmp_path):
+    """Test that retention_days=0 archives nothing and compact_history works alone."""
+    summary = run_retention(history_engine, 0, str(tmp_path / "archive"), compact=False,
+                            now=NOW)
+    assert summary["archived"] == 0
+    assert len(history(history_engine)) == 9
+
+    # Runs spanning the old entries collapse too
+    assert compact_history(history_engine, batch_profiles=1) == 5
+    assert [(p, s) for p, s, _ in history(history_engine)] == [
+        (1, "ACTIVE"), (1, "SUSPENDED"), (1, "ACTIVE"), (2, "SUSPENDED"),
+    ]
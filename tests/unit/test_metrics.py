@@ -0,0 +1,37 @@
+from sqlalchemy import create_engine, text
+from app.api.metrics import PoolCollector
+from app.config.pool import InstrumentedQueuePool
+from app.config.query_stats import collect_queries, current_query_stats
+
+
+def test_collect_queries_counts_statements():
+    """Test that statements are counted only inside collect_queries."""
+    engine = create_engine("sqlite://")
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        assert current_query_stats() is None
+
+        with collect_queries() as stats:
+            connection.execute(text("SELECT 1"))
+            connection.execute(text("SELECT 2"))
+            assert current_query_stats() is stats
+
+        connection.execute(text("SELECT 3"))
+
+    assert stats.count == 2
+    assert stats.seconds > 0
+    assert current_query_stats() is None
+
+
+def test_pool_collector():
+    """Test that pool occupancy and checkout telemetry are exported per engine."""
+    engine = create_engine("sqlite://", poolclass=InstrumentedQueuePool, pool_size=2)
+    with engine.connect():
+        families = {
+            family.name: family for family in PoolCollector(lambda: {"sync": engine.pool}).collect()
+        }
+
+    assert families["db_pool_checked_out"].samples[0].value == 1
+    assert families["db_pool_size"].samples[0].labels == {"engine": "sync"}
+    assert families["db_pool_checkouts"].type == "counter"
+    assert families["db_pool_checkouts"].samples[0].value == 1
@@ -0,0 +1,67 @@
+import os
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.config import Config
+from alembic.migration import MigrationContext
+from sqlalchemy import create_engine, inspect
+from app.config.database import Base
+from app.db.profile_models import is_search_object
+
+ALEMBIC_INI = os.path.join(os.path.dirname(__file__), "..", "..", "alembic.ini")
+
+
+def alembic_config(url):
+    config = Config(ALEMBIC_INI)
+    config.set_main_option("sqlalchemy.url", url)
+    config.attributes["configure_logger"] = False
+    return config
+
+
+def test_migrations_match_models(tmp_path):
+    """Test that upgrading an empty database yields exactly the ORM schema."""
+    url = f"sqlite:///{tmp_path / 'migrated.db'}"
+    command.upgrade(alembic_config(url), "head")
+
+    engine = create_engine(url)
+    try:
+        with engine.connect() as connection:
+            context = MigrationContext.configure(
+                connection,
+                opts={
+                    "include_object": lambda obj, name, type_, reflected, compare_to: not (
+                        reflected and compare_to is None and is_search_object(name or "")
+                    )
+                },
+            )
+            diff = compare_metadata(context, Base.metadata)
+        assert diff == []
+
+        # The search index covers the migrated table
+        with engine.begin() as connection:
+            connection.exec_driver_sql(
+                "INSERT INTO profiles (name, email, specialty, status, start_date) "
+                "VALUES ('Migrated', 'migrated@example.com', 'Search', 'ACTIVE', '2024-01-01')"
+            )
+            matches = connection.exec_driver_sql(
+                "SELECT rowid FROM profiles_fts WHERE profiles_fts MATCH 'migrat*'"
+            ).all()
+        assert len(matches) == 1
+    finally:
+        engine.dispose()
+
+
+def test_baseline_adopts_existing_tables(tmp_path):
+    """Test that a database created by create_all is upgraded in place."""
+    url = f"sqlite:///{tmp_path / 'legacy.db'}"
+    engine = create_engine(url)
+    try:
+        Base.metadata.create_all(bind=engine)
+        with engine.begin() as connection:
+            connection.exec_driver_sql("DROP INDEX ix_profiles_start_date_id")
+
+        command.upgrade(alembic_config(url), "head")
+
+        indexes = {index["name"] for index in inspect(engine).get_indexes("profiles")}
+        assert "ix_profiles_start_date_id" in indexes
+    finally:
+        engine.dispose()
@@ -0,0 +1,78 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import NullPool
+from app.config.pool import (
+    InstrumentedAsyncQueuePool,
+    InstrumentedQueuePool,
+    pool_options,
+    pool_stats,
+)
+
+
+def test_pool_options_sqlite_keeps_default_pool():
+    """Test that SQLite engines get no pool sizing arguments."""
+    assert pool_options("sqlite:///./test.db") == {}
+    assert pool_options("sqlite+aiosqlite:///./test.db", pgbouncer=True) == {}
+
+
+def test_pool_options_postgresql():
+    """Test pool sizing for the sync and async PostgreSQL drivers."""
+    options = pool_options(
+        "postgresql+psycopg2://u:p@db/app", pool_size=20, max_overflow=5, pool_timeout=2,
+        pool_recycle=600, pool_pre_ping=False,
+    )
+    assert options == {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": 20,
+        "max_overflow": 5,
+        "pool_timeout": 2,
+        "pool_recycle": 600,
+        "pool_pre_ping": False,
+    }
+    options = pool_options("postgresql+asyncpg://u:p@db/app")
+    assert options["poolclass"] is InstrumentedAsyncQueuePool
+
+
+def test_pool_options_pgbouncer():
+    """Test that PgBouncer mode uses no client pool and no prepared statements."""
+    options = pool_options("postgresql+asyncpg://u:p@pgbouncer/app", pgbouncer=True)
+    assert options["poolclass"] is NullPool
+    assert options["connect_args"]["statement_cache_size"] == 0
+    assert options["connect_args"]["prepared_statement_cache_size"] == 0
+    name = options["connect_args"]["prepared_statement_name_func"]
+    assert name() != name()
+
+    options = pool_options("postgresql+psycopg://u:p@pgbouncer/app", pgbouncer=True)
+    assert options == {"poolclass": NullPool, "connect_args": {"prepare_threshold": None}}
+
+
+def test_pool_telemetry(tmp_path):
+    """Test checkout counts, occupancy and timeouts of the instrumented pool."""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    try:
+        connection = engine.connect()
+        stats = pool_stats(engine.pool)
+        assert stats["pool"] == "InstrumentedQueuePool"
+        assert stats["checked_out"] == 1
+        assert stats["checkouts"] == 1
+
+        # The only connection is taken: the next checkout waits and times out
+        with pytest.raises(PoolTimeoutError):
+            engine.connect()
+        stats = pool_stats(engine.pool)
+        assert stats["checkout_failures"] == 1
+        assert stats["wait_seconds_max"] >= 0.05
+
+        connection.close()
+        stats = pool_stats(engine.pool)
+        assert stats["checked_out"] == 0
+        assert stats["checked_in"] == 1
+    finally:
+        engine.dispose()
@@ -0,0 +1,122 @@
+import pytest
+from app.entities import Profile
+from app.services.profile_cache import (
+    CachedProfileRepository,
+    InMemoryProfileCache,
+    NullProfileCache,
+    ProfileCache,
+    create_profile_cache,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_lru_eviction_and_counters():
+    """Test that the least recently used entry is evicted first."""
+    cache = InMemoryProfileCache(maxsize=2, ttl=60)
+    cache.set(1, Profile(id=1, name="One"))
+    cache.set(2, Profile(id=2, name="Two"))
+
+    # Touch 1 so that 2 becomes the least recently used
+    assert cache.get(1).name == "One"
+    cache.set(3, Profile(id=3, name="Three"))
+
+    assert cache.get(2) is None
+    assert cache.get(3).name == "Three"
+    stats = cache.stats()
+    assert stats["size"] == 2
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+    assert stats["evictions"] == 1
+
+
+def test_ttl_expiration():
+    """Test that entries expire after their TTL."""
+    clock = FakeClock()
+    cache = InMemoryProfileCache(maxsize=10, ttl=5, clock=clock)
+    cache.set(1, Profile(id=1))
+
+    clock.now = 4.9
+    assert cache.get(1) is not None
+    clock.now = 5.0
+    assert cache.get(1) is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_cached_copies_are_isolated():
+    """Test that mutating a returned profile does not change the cached entry."""
+    cache = InMemoryProfileCache()
+    profile = Profile(id=1, name="Original")
+    cache.set(1, profile)
+    profile.name = "Mutated after set"
+
+    cached = cache.get(1)
+    cached.name = "Mutated after get"
+    assert cache.get(1).name == "Original"
+
+
+def test_invalidation_during_load_is_not_cached():
+    """Test that a load racing with a write does not store a stale profile."""
+    cache = InMemoryProfileCache()
+    epoch = cache.epoch()
+    cache.invalidate(1)  # A concurrent update lands while the row is being read
+    cache.set(1, Profile(id=1, name="Stale"), epoch)
+    assert cache.get(1) is None
+
+
+def test_cached_repository_reads_through_and_invalidates():
+    """Test the repository decorator: one load per profile, writes invalidate."""
+
+    class StubRepository:
+        def __init__(self):
+            self.loads = 0
+
+        def get_by_id(self, profile_id, include_history=False):
+            self.loads += 1
+            return Profile(id=profile_id, name=f"Load {self.loads}")
+
+        def update(self, profile):
+            return profile
+
+        def get_all(self):
+            return ["delegated"]
+
+    stub = StubRepository()
+    repository = CachedProfileRepository(stub, InMemoryProfileCache())
+
+    assert repository.get_by_id(7).name == "Load 1"
+    assert repository.get_by_id(7).name == "Load 1"
+    assert stub.loads == 1
+
+    repository.update(Profile(id=7))
+    assert repository.get_by_id(7).name == "Load 2"
+
+    # History reads bypass the cache; other methods are delegated
+    repository.get_by_id(7, include_history=True)
+    assert stub.loads == 3
+    assert repository.get_all() == ["delegated"]
+
+
+def test_create_profile_cache_backends():
+    """Test selecting cache backends by name."""
+    assert isinstance(create_profile_cache("memory", 10, 1), InMemoryProfileCache)
+    assert isinstance(create_profile_cache("none", 10, 1), NullProfileCache)
+    with pytest.raises(ValueError):
+        create_profile_cache("redis-typo", 10, 1)
+
+
+def test_incomplete_backend_fails_on_instantiation():
+    """Test that a backend missing part of the ProfileCache interface cannot be created."""
+
+    class GetOnlyCache(ProfileCache):
+        def get(self, profile_id):
+            return None
+
+    with pytest.raises(TypeError, match="abstract"):
+        GetOnlyCache()
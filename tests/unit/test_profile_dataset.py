@@ -0,0 +1,93 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+from app.config.database import Base
+from app.db.profile_dataset import HistoryDistribution, generate_chunk, generate_dataset
+
+
+@pytest.fixture
+def dataset_engine():
+    """An empty in-memory database with the full schema, FTS table included."""
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+def dump(engine):
+    with engine.connect() as conn:
+        return (
+            conn.execute(text("SELECT * FROM profiles ORDER BY id")).all(),
+            conn.execute(text("SELECT * FROM profile_history ORDER BY id")).all(),
+        )
+
+
+def test_history_distribution_parse():
+    """Test fixed and weighted history distributions."""
+    assert HistoryDistribution.parse("3").counts == [3]
+    distribution = HistoryDistribution.parse("0:20,1:50,5:30")
+    assert distribution.counts == [0, 1, 5]
+    assert distribution.mean() == pytest.approx(2.0)
+    with pytest.raises(ValueError):
+        HistoryDistribution.parse("1:x")
+    with pytest.raises(ValueError):
+        HistoryDistribution.parse("-1")
+
+
+def test_generate_chunk_is_deterministic():
+    """Test that a chunk depends only on the seed and its index."""
+    history = HistoryDistribution.parse("0:1,2:1")
+    first = generate_chunk(7, 1, 1, 50, 200, history)
+    assert generate_chunk(7, 1, 1, 50, 200, history) == first
+    assert generate_chunk(8, 1, 1, 50, 200, history) != first
+
+    profiles, entries = first
+    assert [p["id"] for p in profiles] == list(range(51, 101))
+    assert len({p["email"] for p in profiles}) == 50
+    # The last history entry of a profile is its current status
+    last_status = {e["profile_id"]: e["status"] for e in entries}
+    assert all(last_status.get(p["id"], p["status"]) == p["status"] for p in profiles)
+
+
+def test_generate_dataset_resumes(dataset_engine):
+    """Test that a rerun after a failure produces the same rows as one uninterrupted run."""
+    history = HistoryDistribution.parse("0:1,1:1,3:1")
+
+    def fail_after_first_chunk(loaded, total):
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        generate_dataset(dataset_engine, 250, seed=3, history=history, chunk_size=100,
+                         progress=fail_after_first_chunk)
+    summary = generate_dataset(dataset_engine, 250, seed=3, history=history, chunk_size=100)
+    assert summary["resumed_from"] == 100
+    assert summary["profiles"] == 150
+
+    uninterrupted = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(bind=uninterrupted)
+    generate_dataset(uninterrupted, 250, seed=3, history=history, chunk_size=100)
+    assert dump(dataset_engine) == dump(uninterrupted)
+
+    # Everything loaded: nothing left to do, also with a partial last chunk and progress
+    assert generate_dataset(dataset_engine, 250, seed=3, history=history)["profiles"] == 0
+    reported = []
+    summary = generate_dataset(dataset_engine, 250, seed=3, history=history, chunk_size=100,
+                               progress=lambda loaded, total: reported.append(loaded))
+    assert (summary["profiles"], reported) == (0, [])
+
+
+def test_generated_profiles_are_searchable(dataset_engine):
+    """Test that bulk-loaded profiles are in the FTS index and its trigger survives."""
+    generate_dataset(dataset_engine, 300, seed=1, chunk_size=128)
+    with dataset_engine.connect() as conn:
+        indexed = conn.execute(
+            text("SELECT count(*) FROM profiles_fts WHERE profiles_fts MATCH 'garcia'")
+        ).scalar()
+        expected = conn.execute(
+            text("SELECT count(*) FROM profiles WHERE name LIKE '%Garcia%'")
+        ).scalar()
+        triggers = conn.execute(
+            text("SELECT count(*) FROM sqlite_master WHERE name = 'profiles_fts_insert'")
+        ).scalar()
+    assert indexed == expected > 0
+    assert triggers == 1
@@ -0,0 +1,25 @@
+import json
+from datetime import datetime
+from app.api.profile_json import dumps
+from app.api.profile_schemas import ProfileResponse
+from app.entities import Profile, ProfileStatus
+
+
+def test_dumps_matches_profile_response():
+    """Test that orjson output equals what response_model validation would produce."""
+    profiles = [
+        Profile(id=1, name="Ana", email="ana@example.com", specialty="Backend",
+                start_date=datetime(2024, 1, 2, 3, 4, 5, 123456)),
+        Profile(id=2, name="Luis", email="luis@example.com", specialty="QA",
+                linkedin="https://linkedin.com/in/luis", status=ProfileStatus.INACTIVE,
+                start_date=datetime(2023, 5, 6), end_date=datetime(2024, 7, 8, 9, 10)),
+    ]
+
+    for profile in profiles:
+        expected = ProfileResponse.model_validate(profile, from_attributes=True)
+        assert json.loads(dumps(profile)) == json.loads(expected.model_dump_json())
+
+    listed = json.loads(dumps(profiles))
+    assert [p["id"] for p in listed] == [1, 2]
+    assert listed[1]["status"] == "inactive"
+    assert listed[0]["end_date"] is None
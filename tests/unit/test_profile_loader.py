@@ -0,0 +1,89 @@
+import asyncio
+from app.entities import Profile
+from app.services.profile_loader import AsyncProfileLoader, ProfileLoader
+
+
+class StubRepository:
+    """Records every lookup; profiles 1 to 9 exist."""
+
+    def __init__(self):
+        self.calls = []
+
+    def get_by_id(self, profile_id, include_history=False):
+        self.calls.append(("get_by_id", profile_id))
+        return Profile(id=profile_id) if profile_id < 10 else None
+
+    def get_many(self, profile_ids):
+        self.calls.append(("get_many", list(profile_ids)))
+        return {i: Profile(id=i) for i in profile_ids if i < 10}
+
+
+class AsyncStubRepository(StubRepository):
+    async def get_by_id(self, profile_id, include_history=False):
+        await asyncio.sleep(0)
+        return StubRepository.get_by_id(self, profile_id)
+
+    async def get_many(self, profile_ids):
+        await asyncio.sleep(0)
+        return StubRepository.get_many(self, profile_ids)
+
+
+def test_loader_memoizes_lookups():
+    """Test that each ID is read once per loader, missing ones included."""
+    stub = StubRepository()
+    loader = ProfileLoader(stub)
+
+    assert loader.load(1).id == 1
+    found = loader.load_many([2, 1, 2, 42])
+    assert [p and p.id for p in found.values()] == [2, 1, None]
+    assert loader.load(42) is None
+    assert stub.calls == [("get_by_id", 1), ("get_many", [2, 42])]
+
+    loader.prime(1, None)
+    loader.forget(2)
+    assert loader.load(1) is None
+    assert loader.load(2).id == 2
+    assert stub.calls[-1] == ("get_by_id", 2)
+
+
+def test_async_loader_coalesces_concurrent_loads():
+    """Test that loads awaited together are answered by one get_many."""
+    stub = AsyncStubRepository()
+
+    async def scenario():
+        loader = AsyncProfileLoader(stub)
+        profiles = await asyncio.gather(
+            loader.load(3), loader.load(1), loader.load(3), loader.load(42)
+        )
+        assert [p and p.id for p in profiles] == [3, 1, 3, None]
+
+        found = await loader.load_many([1, 5, 5])
+        assert sorted(found) == [1, 5]
+        loader.prime(5, None)
+        assert await loader.load(5) is None
+
+    asyncio.run(scenario())
+    # A lone ID is read with get_by_id, so single-flight can share it across requests
+    assert stub.calls == [("get_many", [3, 1, 42]), ("get_by_id", 5)]
+
+
+def test_async_loader_does_not_memoize_failures():
+    """Test that a failed batch reaches every caller and is retried on the next load."""
+
+    class FlakyRepository(AsyncStubRepository):
+        async def get_many(self, profile_ids):
+            if not self.calls:
+                self.calls.append(("failed", list(profile_ids)))
+                raise ConnectionError("database unavailable")
+            return await super().get_many(profile_ids)
+
+    stub = FlakyRepository()
+
+    async def scenario():
+        loader = AsyncProfileLoader(stub)
+        results = await asyncio.gather(loader.load(1), loader.load(2), return_exceptions=True)
+        assert all(isinstance(result, ConnectionError) for result in results)
+        assert (await loader.load(1)).id == 1
+
+    asyncio.run(scenario())
+    assert stub.calls == [("failed", [1, 2]), ("get_by_id", 1)]
@@ -0,0 +1,56 @@
+import logging
+from sqlalchemy import create_engine, text
+from app.config import query_stats
+from app.config.query_stats import collect_queries, parameters_shape, request_queries
+
+
+def test_nested_collectors_share_statements():
+    """Test that statements count towards every enclosing collector."""
+    engine = create_engine("sqlite://")
+    with engine.connect() as connection:
+        with collect_queries() as outer:
+            connection.execute(text("SELECT 1"))
+            with collect_queries() as inner:
+                connection.execute(text("SELECT 2"))
+
+    assert (outer.count, inner.count) == (2, 1)
+    assert outer.statements["SELECT 2"] == 1
+
+
+def test_slow_query_log(monkeypatch, caplog):
+    """Test that statements over DB_SLOW_QUERY_MS are logged with route and parameter types."""
+    monkeypatch.setattr(query_stats, "DB_SLOW_QUERY_MS", 1e-6)
+    engine = create_engine("sqlite://")
+    with caplog.at_level(logging.WARNING, logger="app.config.query_stats"):
+        with engine.connect() as connection:
+            with request_queries(lambda: "/profiles/{profile_id}"):
+                connection.execute(text("SELECT :a, :b"), {"a": 1, "b": "secret"})
+
+    (record,) = caplog.records
+    assert "Slow query" in record.getMessage()
+    assert "/profiles/{profile_id}" in record.getMessage()
+    assert "(int, str)" in record.getMessage()
+    assert "secret" not in record.getMessage()
+
+
+def test_n_plus_one_log(monkeypatch, caplog):
+    """Test that a statement repeated within one request is reported."""
+    monkeypatch.setattr(query_stats, "DB_N_PLUS_ONE_THRESHOLD", 3)
+    engine = create_engine("sqlite://")
+    with caplog.at_level(logging.WARNING, logger="app.config.query_stats"):
+        with engine.connect() as connection:
+            with request_queries(lambda: "/profiles/"):
+                for i in range(3):
+                    connection.execute(text("SELECT :i"), {"i": i})
+                connection.execute(text("SELECT 0"))
+
+    (record,) = caplog.records
+    assert record.getMessage() == "Possible N+1 in /profiles/: statement ran 3 times: SELECT ?"
+
+
+def test_parameters_shape():
+    """Test the type-only description of bound parameters."""
+    assert parameters_shape((1, "a", None)) == "(int, str, NoneType)"
+    assert parameters_shape({"id": 1}) == "{id: int}"
+    assert parameters_shape([(1, "a"), (2, "b")], executemany=True) == "2 x (int, str)"
+    assert parameters_shape(None) == "()"
@@ -0,0 +1,181 @@
+import asyncio
+import threading
+import pytest
+from app.api.metrics import SingleFlightCollector
+from app.entities import Profile
+from app.services.single_flight import (
+    AsyncSingleFlight,
+    AsyncSingleFlightProfileRepository,
+    SingleFlight,
+    SingleFlightProfileRepository,
+)
+
+
+class BlockingRepository:
+    """get_by_id waits for ``release``, so concurrent callers pile up behind it."""
+
+    def __init__(self):
+        self.loads = 0
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def get_by_id(self, profile_id, include_history=False):
+        self.loads += 1
+        self.started.set()
+        assert self.release.wait(5)
+        if profile_id == 13:
+            raise ConnectionError("database unavailable")
+        return Profile(id=profile_id, name=f"Load {self.loads}")
+
+    def update(self, profile):
+        return profile
+
+
+def read_concurrently(repository, profile_id, readers):
+    results = [None] * readers
+
+    def read(index):
+        try:
+            results[index] = repository.get_by_id(profile_id)
+        except ConnectionError as exc:
+            results[index] = exc
+
+    threads = [threading.Thread(target=read, args=(n,)) for n in range(readers)]
+    threads[0].start()
+    assert repository.repository.started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    # Followers are parked once every one of them has been counted
+    while repository.flights.stats()["coalesced"] < readers - 1:
+        threading.Event().wait(0.001)
+    repository.repository.release.set()
+    for thread in threads:
+        thread.join(5)
+    return results
+
+
+def test_concurrent_reads_share_one_query():
+    """Test that identical reads in flight run one query and hand out copies."""
+    flights = SingleFlight()
+    repository = SingleFlightProfileRepository(BlockingRepository(), flights)
+
+    profiles = read_concurrently(repository, 7, readers=8)
+
+    assert repository.repository.loads == 1
+    assert {p.name for p in profiles} == {"Load 1"}
+    assert len({id(p) for p in profiles}) == 8
+    assert flights.stats() == {"in_flight": 0, "executed": 1, "coalesced": 7}
+
+    # Nothing is kept afterwards, and other methods are delegated
+    assert repository.get_by_id(7).name == "Load 2"
+    assert repository.update(Profile(id=7)).id == 7
+
+
+def test_failed_read_reaches_every_caller():
+    """Test that the leader's exception is raised to the callers that joined it."""
+    repository = SingleFlightProfileRepository(BlockingRepository(), SingleFlight())
+
+    results = read_concurrently(repository, 13, readers=3)
+
+    assert repository.repository.loads == 1
+    assert all(isinstance(result, ConnectionError) for result in results)
+
+
+def test_write_forgets_the_read_in_flight():
+    """Test that a read after a write does not join a read that started before it."""
+    flights = SingleFlight()
+    release = threading.Event()
+
+    def slow_read():
+        release.wait(5)
+        return "before the write"
+
+    leader = threading.Thread(target=flights.do, args=((7, False), slow_read))
+    leader.start()
+    while not flights.stats()["in_flight"]:
+        threading.Event().wait(0.001)
+
+    repository = SingleFlightProfileRepository(BlockingRepository(), flights)
+    repository.update(Profile(id=7))
+    repository.repository.release.set()
+    assert repository.get_by_id(7).name == "Load 1"
+
+    release.set()
+    leader.join(5)
+    assert flights.stats()["coalesced"] == 0
+
+
+def test_async_reads_share_one_query():
+    """Test coalescing in the event loop, including a cancelled leader."""
+
+    class AsyncRepository:
+        def __init__(self):
+            self.loads = 0
+
+        async def get_by_id(self, profile_id, include_history=False):
+            self.loads += 1
+            await asyncio.sleep(0.01)
+            return Profile(id=profile_id, name=f"Load {self.loads}")
+
+    async def scenario():
+        flights = AsyncSingleFlight()
+        repository = AsyncSingleFlightProfileRepository(AsyncRepository(), flights)
+
+        profiles = await asyncio.gather(*(repository.get_by_id(3) for _ in range(5)))
+        assert {p.name for p in profiles} == {"Load 1"}
+        assert flights.stats() == {"in_flight": 0, "executed": 1, "coalesced": 4}
+
+        # Followers of a cancelled leader run the read themselves
+        leader = asyncio.ensure_future(repository.get_by_id(4))
+        await asyncio.sleep(0)
+        followers = asyncio.gather(repository.get_by_id(4), repository.get_by_id(4))
+        await asyncio.sleep(0)
+        leader.cancel()
+        assert {p.name for p in await followers} == {"Load 3"}
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        assert flights.stats()["executed"] == 3
+
+    asyncio.run(scenario())
+
+
+def test_callers_cannot_see_each_others_changes():
+    """Test that a leader mutating its profile before the followers resume affects no one."""
+
+    class AsyncRepository:
+        async def get_by_id(self, profile_id, include_history=False):
+            await asyncio.sleep(0.01)
+            return Profile(id=profile_id, name="Stored", history=[])
+
+    async def read_and_modify(repository):
+        profile = await repository.get_by_id(5)
+        # Like update_profile: mutated in place, before anything else gets to run
+        profile.name = "Uncommitted"
+        profile.history.append("pending entry")
+        return profile
+
+    async def scenario():
+        repository = AsyncSingleFlightProfileRepository(AsyncRepository(), AsyncSingleFlight())
+        leader, *followers = await asyncio.gather(
+            read_and_modify(repository), repository.get_by_id(5), repository.get_by_id(5)
+        )
+        assert leader.name == "Uncommitted"
+        assert [(p.name, p.history) for p in followers] == [("Stored", []), ("Stored", [])]
+        assert followers[0] is not followers[1]
+
+    asyncio.run(scenario())
+
+
+def test_single_flight_collector():
+    """Test that executed, coalesced and in-flight reads are exported per mode."""
+    flights = SingleFlight()
+    flights.do("key", lambda: None)
+    families = {
+        family.name: family
+        for family in SingleFlightCollector(lambda: {"sync": flights}).collect()
+    }
+
+    assert families["profile_reads_executed"].type == "counter"
+    assert families["profile_reads_executed"].samples[0].value == 1
+    assert families["profile_reads_coalesced"].samples[0].labels == {"mode": "sync"}
+    assert families["profile_reads_in_flight"].samples[0].value == 0